@@ -0,0 +1,39 @@
+import smartpy as sp
+from contracts.storage.backed_multi_oracle import BackedMultiOracleStorageModule
+
+@sp.module
+def AddFeedModule():
+    AddFeedParams: type = sp.record(feedId=sp.string, decimals=sp.string, description=sp.string)
+
+    @sp.effects(with_operations=True)
+    def addFeed(storage, data):
+        '''
+        Adds a new price feed, without any round. Allowed only for owner,
+        so the action has to be registered with the `only_admin` flag.
+
+        Params:
+        storage (BackedMultiOracle storage) - current storage of the BackedMultiOracle contract
+        data (sp.bytes) - packed AddFeedParams
+            feedId (sp.string) - the id of the new feed
+            decimals (sp.string) - the number of decimals of the answers of the feed
+            description (sp.string) - the description of the feed
+
+        Returns:
+        BackedMultiOracle storage: Updated storage object
+        '''
+        sp.cast(storage, BackedMultiOracleStorageModule.BackedMultiOracle)
+        sp.cast(data, sp.bytes)
+        params = sp.unpack(data, AddFeedParams).unwrap_some(error="BACKED_ORACLE_AddFeed_CannotUnpackParams")
+
+        assert not storage.feeds.contains(params.feedId), "BACKED_ORACLE_FeedAlreadyExists"
+
+        updated_storage = storage
+
+        updated_storage.feeds[params.feedId] = sp.record(
+            decimals=params.decimals,
+            description=params.description,
+            latestRoundNumber=0,
+            latest=sp.record(answer=0, timestamp=sp.timestamp(0), cumulativePrice=0)
+        )
+
+        return updated_storage
@@ -0,0 +1,70 @@
+import smartpy as sp
+from contracts.storage.backed_multi_oracle import BackedMultiOracleStorageModule
+from contracts.utils.round_buffer import RoundBufferModule
+from contracts.actions.oracle.update_answer import UpdateAnswerModule
+
+@sp.module
+def UpdateAnswersModule():
+    FeedAnswer: type = sp.record(feedId=sp.string, newAnswer=sp.int, newTimestamp=sp.timestamp).layout(("feedId", ("newAnswer", "newTimestamp")))
+    UpdateAnswersParams: type = sp.list[FeedAnswer]
+
+    @sp.effects(with_operations=True)
+    def updateAnswers(storage, data):
+        '''
+        Updates the answers of many feeds and sets up a new round for each of them. Every answer goes through
+        the same checks as `updateAnswer`, against the latest round of its own feed. Fails as a whole if any of the answers is invalid.
+
+        Params:
+        storage (BackedMultiOracle storage) - current storage of the BackedMultiOracle contract
+        data (sp.bytes) - packed UpdateAnswersParams
+            list of FeedAnswer
+                feedId (sp.string) - the feed to update
+                newAnswer (sp.int) - the new answer of the feed
+                newTimestamp (sp.timestamp) - the time of the new answer
+
+        Returns:
+        BackedMultiOracle storage: Updated storage object
+
+        Emits:
+        RoundUpdated event for every feed
+        '''
+        sp.cast(storage, BackedMultiOracleStorageModule.BackedMultiOracle)
+        sp.cast(data, sp.bytes)
+        answers = sp.unpack(data, UpdateAnswersParams).unwrap_some(error="BACKED_ORACLE_UpdateAnswers_CannotUnpackParams")
+
+        assert sp.sender == storage.updater, "BACKED_ORACLE_NotUpdater"
+
+        updated_storage = storage
+
+        for answer in answers:
+            feed = updated_storage.feeds.get_opt(answer.feedId).unwrap_some(error="BACKED_ORACLE_UnknownFeed")
+
+            newAnswer = UpdateAnswerModule.checkAnswer(sp.record(
+                latestRoundData=sp.record(answer=feed.latest.answer, timestamp=feed.latest.timestamp),
+                params=sp.record(newAnswer=answer.newAnswer, newTimestamp=answer.newTimestamp)
+            ))
+
+            # The previous answer of the feed held from its timestamp until the new one
+            cumulativePrice = feed.latest.cumulativePrice
+            if feed.latestRoundNumber > 0:
+                cumulativePrice += feed.latest.answer * (answer.newTimestamp - feed.latest.timestamp)
+
+            feed.latestRoundNumber += 1
+            feed.latest = sp.record(answer=newAnswer, timestamp=answer.newTimestamp, cumulativePrice=cumulativePrice)
+
+            # Once the buffer of the feed is full, its oldest round is overwritten
+            updated_storage.roundData[sp.record(
+                feedId=answer.feedId,
+                roundId=RoundBufferModule.roundKey(sp.record(retention=updated_storage.retention, roundId=feed.latestRoundNumber))
+            )] = feed.latest
+            updated_storage.feeds[answer.feedId] = feed
+
+            sp.emit(sp.cast(sp.record(
+                feedId=answer.feedId,
+                roundId=feed.latestRoundNumber,
+                answer=newAnswer,
+                timestamp=answer.newTimestamp,
+                updatedBy=sp.sender
+            ), BackedMultiOracleStorageModule.FeedRoundUpdatedEvent), tag="RoundUpdated")
+
+        return updated_storage
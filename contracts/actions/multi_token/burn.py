@@ -0,0 +1,43 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenBurnModule():
+    BurnParams: type = sp.record(token_id=sp.nat, address=sp.address, value=sp.nat)
+
+    @sp.effects()
+    def burn(storage, data):
+        '''
+        Function to burn tokens of an asset. Allowed only for the burner of the asset
+
+        Params:
+        storage (BackedMultiToken hot storage) - current hot section of the BackedMultiToken storage
+        data (sp.bytes) - packed BurnParams
+            token_id (sp.nat) - the asset to be burned
+            account (sp.address) - the account from which the tokens will be burned
+            amount (sp.nat) - the amount of tokens to be burned
+
+        Returns:
+        BackedMultiToken hot storage: Updated hot section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenHot)
+        sp.cast(data, sp.bytes)
+        burnParams = sp.unpack(data, BurnParams).unwrap_some(error="BACKED_TOKEN_Burn_CannotUnpackParams")
+
+        roles = storage.roles.get(burnParams.token_id, error="FA2_TOKEN_UNDEFINED")
+        assert sp.sender == roles.burner, "BACKED_TOKEN_Burn_NotBurner"
+
+        updated_storage = storage
+
+        key = sp.record(owner=burnParams.address, token_id=burnParams.token_id)
+        balance = sp.as_nat(
+            updated_storage.ledger.get(key, default=0) - burnParams.value,
+            error="BACKED_TOKEN_Burn_InsufficientBalance",
+        )
+        if balance == 0:
+            del updated_storage.ledger[key]
+        else:
+            updated_storage.ledger[key] = balance
+        updated_storage.supply[burnParams.token_id] = sp.as_nat(updated_storage.supply[burnParams.token_id] - burnParams.value)
+
+        return updated_storage
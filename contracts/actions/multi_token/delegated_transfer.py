@@ -0,0 +1,67 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenDelegatedTransferModule():
+    DelegatedTransferParams: type = sp.record(owner=sp.key, to_=sp.address, token_id=sp.nat, amount=sp.nat, deadline=sp.timestamp, signature=sp.signature)
+
+    @sp.effects()
+    def delegatedTransfer(storage, data):
+        '''
+        Perform an intended transfer of one asset on one account's behalf, from another account,
+        who actually pays fees for the transaction. Allowed only if the sender
+        is whitelisted, or the delegateMode is set to true
+
+        Params:
+        storage (BackedMultiToken storage) - current storage of the BackedMultiToken contract
+        data (sp.bytes) - packed DelegatedTransferParams
+            owner (sp.key) - token owner's public key (Authorizer)
+            to_ (sp.address) - recipient's address
+            token_id (sp.nat) - the transferred asset
+            amount (sp.nat) - amount of tokens
+            deadline (sp.timestamp) - expiration time, seconds since the epoch
+            signature (sp.signature) - token owner's signature of the message
+
+        Returns:
+        BackedMultiToken storage: Updated storage object
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiToken)
+        sp.cast(data, sp.bytes)
+        params = sp.unpack(data, DelegatedTransferParams).unwrap_some(error="BACKED_TOKEN_DelegatedTransfer_CannotUnpackParams")
+
+        assert params.deadline > sp.now, 'BACKED_TOKEN_DelegatedTransfer_ExpiredSignature'
+        updated_storage = storage
+
+        assert updated_storage.cold.delegateMode or updated_storage.cold.delegateWhitelist.get(sp.sender, default=False), 'BACKED_TOKEN_DelegatedTransfer_UnauthorizedDelegate'
+        assert updated_storage.hot.supply.contains(params.token_id), "FA2_TOKEN_UNDEFINED"
+
+        owner_address = sp.to_address(sp.implicit_account(sp.hash_key(params.owner)))
+
+        nonce = updated_storage.cold.nonce.get(owner_address, default=0)
+
+        message = sp.pack(sp.record(
+            deadline=params.deadline, to_=params.to_, token_id=params.token_id, amount=params.amount, nonce=nonce
+        ))
+
+        assert sp.check_signature(params.owner, params.signature, message), 'BACKED_TOKEN_DelegatedTransfer_InvalidSigner'
+
+        from_key = sp.record(owner=owner_address, token_id=params.token_id)
+        balance_from = sp.as_nat(
+            updated_storage.hot.ledger.get(from_key, default=0) - params.amount,
+            error="BACKED_TOKEN_DelegatedTransfer_InsufficientBalance"
+        )
+        if balance_from == 0:
+            del updated_storage.hot.ledger[from_key]
+        else:
+            updated_storage.hot.ledger[from_key] = balance_from
+
+        to_key = sp.record(owner=params.to_, token_id=params.token_id)
+        balance_to = updated_storage.hot.ledger.get(to_key, default=0) + params.amount
+        if balance_to == 0:
+            del updated_storage.hot.ledger[to_key]
+        else:
+            updated_storage.hot.ledger[to_key] = balance_to
+
+        updated_storage.cold.nonce[owner_address] = nonce + 1
+
+        return updated_storage
@@ -0,0 +1,40 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenMintModule():
+    MintParams: type = sp.record(token_id=sp.nat, address=sp.address, value=sp.nat)
+
+    @sp.effects()
+    def mint(storage, data):
+        '''
+        Function to mint tokens of an asset. Allowed only for the minter of the asset
+
+        Params:
+        storage (BackedMultiToken hot storage) - current hot section of the BackedMultiToken storage
+        data (sp.bytes) - packed MintParams
+            token_id (sp.nat) - the asset to be minted
+            account (sp.address) - the account to which the tokens will be minted
+            amount (sp.nat) - the amount of tokens to be minted
+
+        Returns:
+        BackedMultiToken hot storage: Updated hot section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenHot)
+        sp.cast(data, sp.bytes)
+        mintParams = sp.unpack(data, MintParams).unwrap_some(error="BACKED_TOKEN_Mint_CannotUnpackParams")
+
+        roles = storage.roles.get(mintParams.token_id, error="FA2_TOKEN_UNDEFINED")
+        assert sp.sender == roles.minter, "BACKED_TOKEN_Mint_NotMinter"
+
+        updated_storage = storage
+
+        key = sp.record(owner=mintParams.address, token_id=mintParams.token_id)
+        balance = updated_storage.ledger.get(key, default=0) + mintParams.value
+        if balance == 0:
+            del updated_storage.ledger[key]
+        else:
+            updated_storage.ledger[key] = balance
+        updated_storage.supply[mintParams.token_id] += mintParams.value
+
+        return updated_storage
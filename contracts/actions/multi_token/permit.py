@@ -0,0 +1,55 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenPermitModule():
+    PermitParams: type = sp.record(owner=sp.key, operator=sp.address, token_id=sp.nat, enabled=sp.bool, deadline=sp.timestamp, signature=sp.signature)
+
+    @sp.effects()
+    def permit(storage, data):
+        '''
+        Adds or removes an operator of one asset with a signed permit. Allowed only if
+        the sender is whitelisted, or the delegateMode is set to true
+
+        Params:
+        storage (BackedMultiToken storage) - current storage of the BackedMultiToken contract
+        data (sp.bytes) - packed PermitParams
+            owner (sp.key) - token owner's public key (Authorizer)
+            operator (sp.address) - operator's address
+            token_id (sp.nat) - the asset the operator is allowed to transfer
+            enabled (sp.bool) - true to add the operator, false to remove it
+            deadline (sp.timestamp) - expiration time, seconds since the epoch
+            signature (sp.signature) - token owner's signature of the message
+
+        Returns:
+        BackedMultiToken storage: Updated storage object
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiToken)
+        sp.cast(data, sp.bytes)
+        params = sp.unpack(data, PermitParams).unwrap_some(error="BACKED_TOKEN_Permit_CannotUnpackParams")
+
+        assert params.deadline > sp.now, 'BACKED_TOKEN_Permit_ExpiredSignature'
+        updated_storage = storage
+
+        assert updated_storage.cold.delegateMode or updated_storage.cold.delegateWhitelist.get(sp.sender, default=False), 'BACKED_TOKEN_Permit_UnauthorizedDelegate'
+        assert updated_storage.hot.supply.contains(params.token_id), "FA2_TOKEN_UNDEFINED"
+
+        owner_address = sp.to_address(sp.implicit_account(sp.hash_key(params.owner)))
+
+        nonce = updated_storage.cold.nonce.get(owner_address, default=0)
+
+        message = sp.pack(sp.record(
+            deadline=params.deadline, operator=params.operator, token_id=params.token_id, enabled=params.enabled, nonce=nonce
+        ))
+
+        assert sp.check_signature(params.owner, params.signature, message), 'BACKED_TOKEN_Permit_InvalidSigner'
+
+        operator_key = sp.record(owner=owner_address, operator=params.operator, token_id=params.token_id)
+        if params.enabled:
+            updated_storage.hot.operators[operator_key] = ()
+        else:
+            del updated_storage.hot.operators[operator_key]
+
+        updated_storage.cold.nonce[owner_address] = nonce + 1
+
+        return updated_storage
@@ -0,0 +1,32 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenSetBurnerModule():
+    SetBurnerParams: type = sp.record(token_id=sp.nat, address=sp.address)
+
+    @sp.effects()
+    def setBurner(storage, data):
+        '''
+        Function to change the burner of an asset. Allowed only for owner
+
+        Params:
+        storage (BackedMultiToken hot storage) - current hot section of the BackedMultiToken storage
+        data (sp.bytes) - packed SetBurnerParams
+            token_id (sp.nat) - the asset
+            address (sp.address) - the address of the new burner
+
+        Returns:
+        BackedMultiToken hot storage: Updated hot section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenHot)
+        sp.cast(data, sp.bytes)
+        params = sp.unpack(data, SetBurnerParams).unwrap_some(error="BACKED_TOKEN_SetBurner_CannotUnpackParams")
+
+        updated_storage = storage
+
+        roles = updated_storage.roles.get(params.token_id, error="FA2_TOKEN_UNDEFINED")
+        roles.burner = params.address
+        updated_storage.roles[params.token_id] = roles
+
+        return updated_storage
@@ -0,0 +1,29 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenSetDelegateModeModule():
+    SetDelegateModeParams: type = sp.bool
+
+    @sp.effects()
+    def setDelegateMode(storage, data):
+        '''
+        Function to change the contract delegate mode. Allowed only for owner
+
+        Params:
+        storage (BackedMultiToken cold storage) - current cold section of the BackedMultiToken storage
+        data (sp.bytes) - packed SetDelegateModeParams
+            newDelegateMode (sp.bool) - the new delegate mode for the contract
+
+        Returns:
+        BackedMultiToken cold storage: Updated cold section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenCold)
+        sp.cast(data, sp.bytes)
+        newDelegateMode = sp.unpack(data, SetDelegateModeParams).unwrap_some(error="BACKED_TOKEN_SetDelegateMode_CannotUnpackParams")
+
+        updated_storage = storage
+
+        updated_storage.delegateMode = newDelegateMode
+
+        return updated_storage
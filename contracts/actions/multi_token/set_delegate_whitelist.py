@@ -0,0 +1,30 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenSetDelegateWhitelistModule():
+    SetDelegateWhitelistParams: type = sp.record(address=sp.address, status=sp.bool)
+
+    @sp.effects()
+    def setDelegateWhitelist(storage, data):
+        '''
+        Function to change the delegate status. Allowed only for owner
+
+        Params:
+        storage (BackedMultiToken cold storage) - current cold section of the BackedMultiToken storage
+        data (sp.bytes) - packed SetDelegateWhitelistParams
+            address (sp.address) - the address for which to change the delegate status
+            status (sp.bool) - the new delegate status
+
+        Returns:
+        BackedMultiToken cold storage: Updated cold section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenCold)
+        sp.cast(data, sp.bytes)
+        params = sp.unpack(data, SetDelegateWhitelistParams).unwrap_some(error="BACKED_TOKEN_SetDelegateWhitelist_CannotUnpackParams")
+
+        updated_storage = storage
+
+        updated_storage.delegateWhitelist[params.address] = params.status
+
+        return updated_storage
@@ -0,0 +1,32 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenSetMinterModule():
+    SetMinterParams: type = sp.record(token_id=sp.nat, address=sp.address)
+
+    @sp.effects()
+    def setMinter(storage, data):
+        '''
+        Function to change the minter of an asset. Allowed only for owner
+
+        Params:
+        storage (BackedMultiToken hot storage) - current hot section of the BackedMultiToken storage
+        data (sp.bytes) - packed SetMinterParams
+            token_id (sp.nat) - the asset
+            address (sp.address) - the address of the new minter
+
+        Returns:
+        BackedMultiToken hot storage: Updated hot section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenHot)
+        sp.cast(data, sp.bytes)
+        params = sp.unpack(data, SetMinterParams).unwrap_some(error="BACKED_TOKEN_SetMinter_CannotUnpackParams")
+
+        updated_storage = storage
+
+        roles = updated_storage.roles.get(params.token_id, error="FA2_TOKEN_UNDEFINED")
+        roles.minter = params.address
+        updated_storage.roles[params.token_id] = roles
+
+        return updated_storage
@@ -0,0 +1,29 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenSetTermsModule():
+    SetTermsParams: type = sp.string
+
+    @sp.effects()
+    def setTerms(storage, data):
+        '''
+        Function to change the contract terms. Allowed only for owner
+
+        Params:
+        storage (BackedMultiToken cold storage) - current cold section of the BackedMultiToken storage
+        data (sp.bytes) - packed SetTermsParams
+            newTerms (sp.string) - a string with the terms. Usually a web or IPFS link.
+
+        Returns:
+        BackedMultiToken cold storage: Updated cold section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenCold)
+        sp.cast(data, sp.bytes)
+        newTerms = sp.unpack(data, SetTermsParams).unwrap_some(error="BACKED_TOKEN_SetTerms_CannotUnpackParams")
+
+        updated_storage = storage
+
+        updated_storage.terms = newTerms
+
+        return updated_storage
@@ -0,0 +1,77 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenTransferModule():
+    TransferParams: type = BackedMultiTokenStorageModule.TransferParams
+
+    @sp.effects()
+    def applyTransfer(storage, params):
+        '''
+        Typed core of the FA2 `transfer` action. Used directly by the native entrypoint
+        of the BackedMultiToken contract, so no packing of the parameters is needed.
+
+        Every transfer of the batch must be sent by the owner of the tokens or by one of its operators
+        for the transferred asset. Fails if any of the transfers fails.
+
+        Params:
+        storage (BackedMultiToken hot storage) - current hot section of the BackedMultiToken storage
+        params (TransferParams) - unpacked list of transfers
+            from_ (sp.address) - the address from which the tokens will be sent
+            txs (sp.list) - transfers from `from_`
+                to_ (sp.address) - the address to which the tokens will be sent
+                token_id (sp.nat) - the transferred asset
+                amount (sp.nat) - the amount of the tokens that will be sent
+
+        Returns:
+        BackedMultiToken hot storage: Updated hot section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenHot)
+        sp.cast(params, TransferParams)
+
+        updated_storage = storage
+
+        for transfer in params:
+            for tx in transfer.txs:
+                assert updated_storage.supply.contains(tx.token_id), "FA2_TOKEN_UNDEFINED"
+                assert transfer.from_ == sp.sender or updated_storage.operators.contains(
+                    sp.record(owner=transfer.from_, operator=sp.sender, token_id=tx.token_id)
+                ), "FA2_NOT_OPERATOR"
+
+                # Entries that drop to zero are removed, so their storage is freed
+                from_key = sp.record(owner=transfer.from_, token_id=tx.token_id)
+                balance_from = sp.as_nat(
+                    updated_storage.ledger.get(from_key, default=0) - tx.amount,
+                    error="FA2_INSUFFICIENT_BALANCE"
+                )
+                if balance_from == 0:
+                    del updated_storage.ledger[from_key]
+                else:
+                    updated_storage.ledger[from_key] = balance_from
+
+                to_key = sp.record(owner=tx.to_, token_id=tx.token_id)
+                balance_to = updated_storage.ledger.get(to_key, default=0) + tx.amount
+                if balance_to == 0:
+                    del updated_storage.ledger[to_key]
+                else:
+                    updated_storage.ledger[to_key] = balance_to
+
+        return updated_storage
+
+    @sp.effects()
+    def transfer(storage, data):
+        '''
+        Moves tokens of one or more assets for every transfer in the list, following TZIP-12.
+
+        Params:
+        storage (BackedMultiToken hot storage) - current hot section of the BackedMultiToken storage
+        data (sp.bytes) - packed TransferParams
+
+        Returns:
+        BackedMultiToken hot storage: Updated hot section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenHot)
+        sp.cast(data, sp.bytes)
+        transferParams = sp.unpack(data, TransferParams).unwrap_some(error="BACKED_TOKEN_Transfer_CannotUnpackParams")
+
+        return applyTransfer(sp.record(storage=storage, params=transferParams))
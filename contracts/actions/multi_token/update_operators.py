@@ -0,0 +1,58 @@
+import smartpy as sp
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def MultiTokenUpdateOperatorsModule():
+    UpdateOperatorsParams: type = BackedMultiTokenStorageModule.UpdateOperatorsParams
+
+    @sp.effects()
+    def applyUpdateOperators(storage, params):
+        '''
+        Typed core of the FA2 `update_operators` action. Used directly by the native entrypoint
+        of the BackedMultiToken contract. Only the owner of the tokens can add or remove its operators.
+
+        Params:
+        storage (BackedMultiToken hot storage) - current hot section of the BackedMultiToken storage
+        params (UpdateOperatorsParams) - list of `add_operator` and `remove_operator` updates
+            owner (sp.address) - the owner of the tokens
+            operator (sp.address) - the operator
+            token_id (sp.nat) - the asset the operator is allowed to transfer
+
+        Returns:
+        BackedMultiToken hot storage: Updated hot section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenHot)
+        sp.cast(params, UpdateOperatorsParams)
+
+        updated_storage = storage
+
+        for update in params:
+            if update.is_variant.add_operator():
+                operator = update.unwrap.add_operator()
+                assert operator.owner == sp.sender, "FA2_NOT_OWNER"
+                assert updated_storage.supply.contains(operator.token_id), "FA2_TOKEN_UNDEFINED"
+                updated_storage.operators[operator] = ()
+            else:
+                operator = update.unwrap.remove_operator()
+                assert operator.owner == sp.sender, "FA2_NOT_OWNER"
+                del updated_storage.operators[operator]
+
+        return updated_storage
+
+    @sp.effects()
+    def updateOperators(storage, data):
+        '''
+        Adds or removes operators of the sender's tokens, following TZIP-12.
+
+        Params:
+        storage (BackedMultiToken hot storage) - current hot section of the BackedMultiToken storage
+        data (sp.bytes) - packed UpdateOperatorsParams
+
+        Returns:
+        BackedMultiToken hot storage: Updated hot section
+        '''
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenHot)
+        sp.cast(data, sp.bytes)
+        params = sp.unpack(data, UpdateOperatorsParams).unwrap_some(error="BACKED_TOKEN_UpdateOperators_CannotUnpackParams")
+
+        return applyUpdateOperators(sp.record(storage=storage, params=params))
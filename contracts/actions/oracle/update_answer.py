@@ -1,11 +1,40 @@
 import smartpy as sp
 from contracts.storage.backed_oracle import BackedOracleStorageModule
+from contracts.utils.round_buffer import RoundBufferModule
 
 @sp.module
 def UpdateAnswerModule():
     UpdateAnswerParams: type = sp.record(newAnswer=sp.int, newTimestamp=sp.timestamp)
-    
-    @sp.effects()
+
+    def checkAnswer(latestRoundData, params):
+        '''
+        Checks that a new answer is recent enough and not sent too often, and returns it
+        limited to 10% of deviation from the latest answer.
+
+        Params:
+        latestRoundData (sp.record) - answer and timestamp of the latest round of the feed
+        params (UpdateAnswerParams) - the new answer and its timestamp
+        '''
+        sp.cast(latestRoundData, sp.record(answer=sp.int, timestamp=sp.timestamp))
+        sp.cast(params, UpdateAnswerParams)
+
+        assert params.newTimestamp < sp.now, "Timestamp cannot be in the future"
+        assert sp.now - params.newTimestamp < 300, "Timestamp is too old"
+        assert params.newTimestamp > latestRoundData.timestamp, "Timestamp is older than the last update"
+        assert params.newTimestamp - latestRoundData.timestamp > 3600, "Timestamp cannot be updated too often"
+
+        newAnswer = params.newAnswer
+
+        if latestRoundData.answer > 0:
+            allowedDeviation = latestRoundData.answer * 10 / 100
+            if params.newAnswer > latestRoundData.answer + allowedDeviation:
+                newAnswer = latestRoundData.answer + allowedDeviation
+            if params.newAnswer < latestRoundData.answer - allowedDeviation:
+                newAnswer = latestRoundData.answer - allowedDeviation
+
+        return newAnswer
+
+    @sp.effects(with_operations=True)
     def updateAnswer(storage, data):
         '''
         Updates BackedOracle answer and sets up new round
@@ -16,6 +45,9 @@ def UpdateAnswerModule():
 
         Returs:
         BackedOracle storage: Updated storage object
+
+        Emits:
+        RoundUpdated event
         '''
         sp.cast(storage, BackedOracleStorageModule.BackedOracle)
         sp.cast(data, sp.bytes)
@@ -25,27 +57,28 @@ def UpdateAnswerModule():
 
         updated_storage = storage
 
-        latestRoundData = updated_storage.roundData.get(updated_storage.latestRoundNumber, default=sp.record(answer=0, timestamp=sp.timestamp(0)))    
+        latestRoundData = updated_storage.latest
+        newAnswer = checkAnswer(sp.record(
+            latestRoundData=sp.record(answer=latestRoundData.answer, timestamp=latestRoundData.timestamp),
+            params=params
+        ))
 
-        assert params.newTimestamp < sp.now, "Timestamp cannot be in the future"
-        assert sp.now - params.newTimestamp < 300, "Timestamp is too old"
-        assert params.newTimestamp > latestRoundData.timestamp, "Timestamp is older than the last update"
-        assert params.newTimestamp - latestRoundData.timestamp > 3600, "Timestamp cannot be updated too often"
+        # The previous answer held from its timestamp until the new one
+        cumulativePrice = latestRoundData.cumulativePrice
+        if updated_storage.latestRoundNumber > 0:
+            cumulativePrice += latestRoundData.answer * (params.newTimestamp - latestRoundData.timestamp)
 
-        newAnswer = params.newAnswer
+        updated_storage.latestRoundNumber += 1
 
-        if latestRoundData.answer > 0:
-            allowedDeviation = latestRoundData.answer * 10 / 100
-            if params.newAnswer > latestRoundData.answer + allowedDeviation:
-                newAnswer = latestRoundData.answer + allowedDeviation
-            if params.newAnswer < latestRoundData.answer - allowedDeviation:
-                newAnswer = latestRoundData.answer - allowedDeviation
-            
+        # Once the buffer is full, the oldest round is overwritten
+        updated_storage.latest = sp.record(answer=newAnswer, timestamp=params.newTimestamp, cumulativePrice=cumulativePrice)
+        updated_storage.roundData[RoundBufferModule.roundKey(sp.record(retention=updated_storage.retention, roundId=updated_storage.latestRoundNumber))] = updated_storage.latest
 
-        updated_storage.latestRoundNumber += 1
+        sp.emit(sp.cast(sp.record(
+            roundId=updated_storage.latestRoundNumber,
+            answer=newAnswer,
+            timestamp=params.newTimestamp,
+            updatedBy=sp.sender
+        ), BackedOracleStorageModule.RoundUpdatedEvent), tag="RoundUpdated")
 
-        updated_storage.roundData[updated_storage.latestRoundNumber] = sp.record(answer=newAnswer, timestamp=params.newTimestamp)
-        
-        return updated_storage
-        # sp.emit(sp.record(answer=newAnswer, timestamp=params.newTimestamp), tag="AnswerUpdated")
-        # sp.emit(sp.record(roundId=updated_storage.latestRoundNumber, sender=sp.sender), tag="NewRound")
\ No newline at end of file
+        return updated_storage
\ No newline at end of file
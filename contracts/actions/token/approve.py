@@ -1,47 +1,73 @@
 import smartpy as sp
 from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.token_events import TokenEventsModule
 
 @sp.module
 def ApproveModule():
-    ApproveParams: type = sp.record(spender=sp.address, value=sp.nat).layout(("spender", "value"))
+    ApproveParams: type = BackedTokenStorageModule.AllowanceParams
 
-    @sp.effects()
+    @sp.effects(with_operations=True)
+    def applyApprove(storage, params):
+        '''
+        Typed core of the `approve` action. Used directly by the native entrypoint
+        of the BackedToken contract, so no packing of the parameters is needed.
+        Can also be registered as the typed lambda of the action.
+
+        Params:
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
+        params (ApproveParams) - unpacked approve parameters
+
+        Returns:
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Approval event
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.cast(params, ApproveParams)
+
+        updated_storage = storage
+
+        allowance_key = sp.record(owner=sp.sender, spender=params.spender)
+        alreadyApproved = updated_storage.allowances.get(allowance_key, default=0)
+        assert (
+            alreadyApproved == 0 or params.value == 0
+        ), "BACKED_TOKEN_Approve_UnsafeAllowanceChange"
+        if params.value == 0:
+            del updated_storage.allowances[allowance_key]
+        else:
+            updated_storage.allowances[allowance_key] = params.value
+
+        TokenEventsModule.emitApproval(sp.record(owner=sp.sender, spender=params.spender, value=params.value))
+
+        return updated_storage
+
+    @sp.effects(with_operations=True)
     def approve(storage, data):
         '''
-        Sets a `value` amount of tokens as the allowance of `spender` over the caller's tokens
+        Sets a `value` amount of tokens as the allowance of `spender` over the caller's tokens.
+        A `value` of 2^256 - 1 sets an unlimited allowance, which is never decremented by transfers
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
         data (sp.bytes) - packed ApproveParams
             spender (sp.address) - address that will have allowance to spend caller's tokens
             value (sp.nat) - amount of the tokens that will be allowed to spend
 
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken hot storage: Updated hot section
 
-        # Emits:
-        # Approval event
+        Emits:
+        Approval event
         '''
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
         sp.cast(data, sp.bytes)
         approvalParams = sp.unpack(data, ApproveParams).unwrap_some(error="BACKED_TOKEN_Approve_CannotUnpackParams")
-      
-        updated_storage = storage
 
-        spender_balance = updated_storage.balances.get(
-            sp.sender, default=sp.record(balance=0, approvals={})
-        )
-        alreadyApproved = spender_balance.approvals.get(approvalParams.spender, default=0)
-        assert (
-            alreadyApproved == 0 or approvalParams.value == 0
-        ), "BACKED_TOKEN_Approve_UnsafeAllowanceChange"
-        spender_balance.approvals[approvalParams.spender] = approvalParams.value
-        updated_storage.balances[sp.sender] = spender_balance
-
-        return updated_storage
+        return applyApprove(sp.record(storage=storage, params=approvalParams))
 
 
 
  
  
- 
\ No newline at end of file
+ 
@@ -1,41 +1,93 @@
 import smartpy as sp
 from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.shares import SharesModule
 
+from contracts.utils.token_events import TokenEventsModule
 @sp.module
 def BurnModule():
     BurnParams: type = sp.record(address=sp.address, value=sp.nat)
+    BurnBatchParams: type = sp.list[BurnParams]
 
-    @sp.effects()
+    @sp.effects(with_operations=True)
     def burn(storage, data):
         '''
         Function to burn tokens. Allowed only for burner. The burned tokens
         must be from the burner (sp.sender), or from the contract itself
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
         data (sp.bytes) - packed BurnParams
             account (sp.address) - the account from which the tokens will be burned
             amount (sp.nat) - the amount of tokens to be burned
 
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Burn event
         '''
         assert sp.sender == storage.roles.burner, "BACKED_TOKEN_Burn_NotBurner"
 
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
         sp.cast(data, sp.bytes)
         burnParams = sp.unpack(data, BurnParams).unwrap_some(error="BACKED_TOKEN_Burn_CannotUnpackParams")
 
         updated_storage = storage
         
-        receiver_balance = updated_storage.balances.get(
-            burnParams.address, default=sp.record(balance=0, approvals={})
-        )
-        receiver_balance.balance = sp.as_nat(
-            receiver_balance.balance - burnParams.value,
+        # The burned shares are rounded up, so at least `value` is removed from the balance
+        shares = SharesModule.toSharesUp(sp.record(value=burnParams.value, multiplier=updated_storage.multiplier))
+        balance = sp.as_nat(
+            updated_storage.balances.get(burnParams.address, default=0) - shares,
             error="BACKED_TOKEN_Burn_InsufficientBalance",
         )
-        updated_storage.balances[burnParams.address] = receiver_balance
-        updated_storage.total_supply = sp.as_nat(updated_storage.total_supply - burnParams.value)
+        if balance == 0:
+            del updated_storage.balances[burnParams.address]
+        else:
+            updated_storage.balances[burnParams.address] = balance
+        updated_storage.total_supply = sp.as_nat(updated_storage.total_supply - shares)
+
+        TokenEventsModule.emitBurn(sp.record(storage=updated_storage, from_=burnParams.address, value=burnParams.value))
+
+        return updated_storage
+
+    @sp.effects(with_operations=True)
+    def burnBatch(storage, data):
+        '''
+        Function to burn tokens from many accounts at once. Allowed only for burner
+
+        Params:
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
+        data (sp.bytes) - packed BurnBatchParams
+            list of BurnParams
+                account (sp.address) - the account from which the tokens will be burned
+                amount (sp.nat) - the amount of tokens to be burned
+
+        Returns:
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Burn event for every account
+        '''
+        assert sp.sender == storage.roles.burner, "BACKED_TOKEN_Burn_NotBurner"
+
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.cast(data, sp.bytes)
+        burns = sp.unpack(data, BurnBatchParams).unwrap_some(error="BACKED_TOKEN_BurnBatch_CannotUnpackParams")
+
+        updated_storage = storage
+
+        for burnParams in burns:
+            shares = SharesModule.toSharesUp(sp.record(value=burnParams.value, multiplier=updated_storage.multiplier))
+            balance = sp.as_nat(
+                updated_storage.balances.get(burnParams.address, default=0) - shares,
+                error="BACKED_TOKEN_Burn_InsufficientBalance",
+            )
+            if balance == 0:
+                del updated_storage.balances[burnParams.address]
+            else:
+                updated_storage.balances[burnParams.address] = balance
+            updated_storage.total_supply = sp.as_nat(updated_storage.total_supply - shares)
+
+            TokenEventsModule.emitBurn(sp.record(storage=updated_storage, from_=burnParams.address, value=burnParams.value))
 
         return updated_storage
\ No newline at end of file
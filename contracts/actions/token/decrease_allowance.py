@@ -1,43 +1,72 @@
 import smartpy as sp
 from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.token_events import TokenEventsModule
 
 @sp.module
 def DecreaseAllowanceModule():
-    DecreaseAllowanceParams: type = sp.record(spender=sp.address, value=sp.nat).layout(("spender", "value"))
+    DecreaseAllowanceParams: type = BackedTokenStorageModule.AllowanceParams
 
-    @sp.effects()
+    @sp.effects(with_operations=True)
+    def applyDecreaseAllowance(storage, params):
+        '''
+        Typed core of the `decreaseAllowance` action. Used directly by the native entrypoint
+        of the BackedToken contract, so no packing of the parameters is needed.
+        Can also be registered as the typed lambda of the action.
+
+        Params:
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
+        params (DecreaseAllowanceParams) - unpacked decrease allowance parameters
+
+        Returns:
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Approval event
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.cast(params, DecreaseAllowanceParams)
+
+        updated_storage = storage
+
+        allowance_key = sp.record(owner=sp.sender, spender=params.spender)
+        allowance = sp.as_nat(
+            updated_storage.allowances.get(allowance_key, default=0) - params.value,
+            error="BACKED_TOKEN_DecreaseAllowance_AllownaceCannotBeLessThanZero",
+        )
+        if allowance == 0:
+            del updated_storage.allowances[allowance_key]
+        else:
+            updated_storage.allowances[allowance_key] = allowance
+
+        TokenEventsModule.emitApproval(sp.record(owner=sp.sender, spender=params.spender, value=allowance))
+
+        return updated_storage
+
+    @sp.effects(with_operations=True)
     def decreaseAllowance(storage, data):
         '''
         Decreases by `value` amount of tokens as the allowance of `spender` over the caller's tokens
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
         data (sp.bytes) - packed DecreaseAllowanceParams
             spender (sp.address) - address that will have allowance to spend caller's tokens
             value (sp.nat) - amount of the tokens that the allowance will be decreased by
 
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Approval event
         '''
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
         sp.cast(data, sp.bytes)
         decreaseAllowanceParams = sp.unpack(data, DecreaseAllowanceParams).unwrap_some(error="BACKED_TOKEN_DecreaseAllowance_CannotUnpackParams")
-      
-        updated_storage = storage
 
-        spender_balance = updated_storage.balances.get(
-            sp.sender, default=sp.record(balance=0, approvals={})
-        )
-        spender_balance.approvals[decreaseAllowanceParams.spender] = sp.as_nat(
-            spender_balance.approvals[decreaseAllowanceParams.spender] - decreaseAllowanceParams.value,
-            error="BACKED_TOKEN_DecreaseAllowance_AllownaceCannotBeLessThanZero",
-        )
-        updated_storage.balances[sp.sender] = spender_balance
-
-        return updated_storage
+        return applyDecreaseAllowance(sp.record(storage=storage, params=decreaseAllowanceParams))
 
 
 
  
  
- 
\ No newline at end of file
+ 
@@ -1,11 +1,13 @@
 import smartpy as sp
 from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.shares import SharesModule
 
+from contracts.utils.token_events import TokenEventsModule
 @sp.module
 def DelegatedTransferModule():
     DelegatedTransferParams: type = sp.record(owner=sp.key, spender=sp.address, amount=sp.nat, deadline=sp.timestamp, signature=sp.signature)
 
-    @sp.effects()
+    @sp.effects(with_operations=True)
     def delegatedTransfer(storage, data):
         '''
         Perform an intended transfer on one account's behalf, from another account,
@@ -23,6 +25,9 @@ def DelegatedTransferModule():
 
         Returns:
         BackedToken storage: Updated storage object
+
+        Emits:
+        Transfer event
         '''
         sp.cast(storage, BackedTokenStorageModule.BackedToken)
         sp.cast(data, sp.bytes)
@@ -31,11 +36,11 @@ def DelegatedTransferModule():
         assert params.deadline > sp.now, 'BACKED_TOKEN_DelegatedTransfer_ExpiredSignature'
         updated_storage = storage
 
-        assert updated_storage.delegateMode or updated_storage.delegateWhitelist[sp.sender], 'BACKED_TOKEN_DelegatedTransfer_UnauthorizedDelegate'
+        assert updated_storage.cold.delegateMode or updated_storage.cold.delegateWhitelist[sp.sender], 'BACKED_TOKEN_DelegatedTransfer_UnauthorizedDelegate'
         
         owner_address = sp.to_address(sp.implicit_account(sp.hash_key(params.owner)))
         
-        nonce = updated_storage.nonce.get(owner_address, default=0)
+        nonce = updated_storage.cold.nonce.get(owner_address, default=0)
 
         message = sp.pack(sp.record(
             deadline=params.deadline, spender=params.spender, amount=params.amount, nonce=nonce
@@ -43,21 +48,29 @@ def DelegatedTransferModule():
 
         assert sp.check_signature(params.owner, params.signature, message), 'BACKED_TOKEN_DelegatedTransfer_InvalidSigner'
 
-        balance_from = updated_storage.balances.get(
-            owner_address, default=sp.record(balance=0, approvals={})
-        )
-        balance_to = updated_storage.balances.get(
-            params.spender, default=sp.record(balance=0, approvals={})
-        )
-        balance_from.balance = sp.as_nat(
-            balance_from.balance - params.amount, error="BACKED_TOKEN_DelegatedTransfer_InsufficientBalance"
+        shares = SharesModule.toSharesUp(sp.record(value=params.amount, multiplier=updated_storage.hot.multiplier))
+        balance_from = sp.as_nat(
+            updated_storage.hot.balances.get(owner_address, default=0) - shares,
+            error="BACKED_TOKEN_DelegatedTransfer_InsufficientBalance"
         )
+        if balance_from == 0:
+            del updated_storage.hot.balances[owner_address]
+        else:
+            updated_storage.hot.balances[owner_address] = balance_from
 
-        balance_to.balance += params.amount 
-       
-        updated_storage.balances[owner_address] = balance_from
-        updated_storage.balances[params.spender] = balance_to
+        balance_to = updated_storage.hot.balances.get(params.spender, default=0) + shares
+        if balance_to == 0:
+            del updated_storage.hot.balances[params.spender]
+        else:
+            updated_storage.hot.balances[params.spender] = balance_to
 
-        updated_storage.nonce[owner_address] = nonce + 1
+        updated_storage.cold.nonce[owner_address] = nonce + 1
+
+        TokenEventsModule.emitTransfer(sp.record(
+            transfer=sp.record(from_=owner_address, to_=params.spender, value=params.amount),
+            fromShares=updated_storage.hot.balances.get(owner_address, default=0),
+            toShares=balance_to,
+            multiplier=updated_storage.hot.multiplier
+        ))
 
         return updated_storage
\ No newline at end of file
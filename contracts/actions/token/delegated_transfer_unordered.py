@@ -0,0 +1,83 @@
+import smartpy as sp
+from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.shares import SharesModule
+from contracts.utils.nonce import NonceModule
+
+from contracts.utils.token_events import TokenEventsModule
+@sp.module
+def DelegatedTransferUnorderedModule():
+    DelegatedTransferUnorderedParams: type = sp.record(owner=sp.key, spender=sp.address, amount=sp.nat, nonce=sp.nat, deadline=sp.timestamp, signature=sp.signature)
+
+    @sp.effects(with_operations=True)
+    def delegatedTransferUnordered(storage, data):
+        '''
+        Perform an intended transfer on one account's behalf, signed with an unordered nonce.
+        Any unused nonce can be signed, so many transfers of one owner can be pending and included
+        in any order. Allowed only if the sender is whitelisted, or the delegateMode is set to true
+
+        Params:
+        storage (BackedToken storage) - current storage of the BackedToken contract
+        data (sp.bytes) - packed DelegatedTransferUnorderedParams
+            owner (sp.key) - token owner's public key (Authorizer)
+            spender (sp.address) - receiver's address
+            amount (sp.nat) - amount of tokens to transfer
+            nonce (sp.nat) - unused unordered nonce of the owner
+            deadline (sp.timestamp) - expiration time, seconds since the epoch
+            signature (sp.signature) - token owner's signature of the message
+
+        Returns:
+        BackedToken storage: Updated storage object
+
+        Emits:
+        Transfer event
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(data, sp.bytes)
+        params = sp.unpack(data, DelegatedTransferUnorderedParams).unwrap_some(error="BACKED_TOKEN_DelegatedTransferUnordered_CannotUnpackParams")
+
+        assert params.deadline > sp.now, 'BACKED_TOKEN_DelegatedTransferUnordered_ExpiredSignature'
+        updated_storage = storage
+
+        assert updated_storage.cold.delegateMode or updated_storage.cold.delegateWhitelist.get(sp.sender, default=False), 'BACKED_TOKEN_DelegatedTransferUnordered_UnauthorizedDelegate'
+
+        owner_address = sp.to_address(sp.implicit_account(sp.hash_key(params.owner)))
+
+        slot = NonceModule.unorderedNonceSlot(sp.record(owner=owner_address, nonce=params.nonce))
+        bitmap = updated_storage.cold.nonceBitmap.get(slot.key, default=0)
+        assert bitmap & slot.mask == 0, 'BACKED_TOKEN_DelegatedTransferUnordered_NonceAlreadyUsed'
+
+        # The token address and the chain id are signed too, so the signature can not be replayed
+        # on another token or on another chain, where the unordered nonce may still be unused
+        message = sp.pack(sp.record(
+            action="delegatedTransfer", deadline=params.deadline, spender=params.spender, amount=params.amount, nonce=params.nonce,
+            contract=sp.self_address, chainId=sp.chain_id
+        ))
+
+        assert sp.check_signature(params.owner, params.signature, message), 'BACKED_TOKEN_DelegatedTransferUnordered_InvalidSigner'
+
+        shares = SharesModule.toSharesUp(sp.record(value=params.amount, multiplier=updated_storage.hot.multiplier))
+        balance_from = sp.as_nat(
+            updated_storage.hot.balances.get(owner_address, default=0) - shares,
+            error="BACKED_TOKEN_DelegatedTransferUnordered_InsufficientBalance"
+        )
+        if balance_from == 0:
+            del updated_storage.hot.balances[owner_address]
+        else:
+            updated_storage.hot.balances[owner_address] = balance_from
+
+        balance_to = updated_storage.hot.balances.get(params.spender, default=0) + shares
+        if balance_to == 0:
+            del updated_storage.hot.balances[params.spender]
+        else:
+            updated_storage.hot.balances[params.spender] = balance_to
+
+        updated_storage.cold.nonceBitmap[slot.key] = bitmap | slot.mask
+
+        TokenEventsModule.emitTransfer(sp.record(
+            transfer=sp.record(from_=owner_address, to_=params.spender, value=params.amount),
+            fromShares=updated_storage.hot.balances.get(owner_address, default=0),
+            toShares=balance_to,
+            multiplier=updated_storage.hot.multiplier
+        ))
+
+        return updated_storage
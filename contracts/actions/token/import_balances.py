@@ -0,0 +1,92 @@
+import smartpy as sp
+from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.shares import SharesModule
+from contracts.utils.ownable import OwnableModule
+
+from contracts.utils.token_events import TokenEventsModule
+@sp.module
+def ImportBalancesModule():
+    ImportEntry: type = sp.record(address=sp.address, balance=sp.nat).layout(("address", "balance"))
+    ImportBalancesParams: type = sp.record(chunk=sp.nat, entries=sp.list[ImportEntry]).layout(("chunk", "entries"))
+
+    @sp.effects(with_operations=True)
+    def importBalances(storage, data):
+        '''
+        Credits one chunk of a balances snapshot, migrated from another chain. Allowed only for owner,
+        until the import is finalized with `finalizeImport`.
+
+        The owner is checked by the action itself, so it stays restricted whatever `only_admin` flag it is
+        registered with. The minter role is limited to `mint`.
+
+        Chunks are imported in order. The checksum (blake2b of the packed entries) of every imported chunk
+        is recorded, so sending an already imported chunk again is a no-op, as long as it has the same entries.
+        An interrupted import is resumed from `importedChunks`.
+
+        Params:
+        storage (BackedToken storage) - current storage of the BackedToken contract
+        data (sp.bytes) - packed ImportBalancesParams
+            chunk (sp.nat) - position of the chunk in the snapshot, starting at 0
+            entries (sp.list) - list of ImportEntry
+                address (sp.address) - the account to be credited
+                balance (sp.nat) - the balance of the account in the snapshot
+
+        Returns:
+        BackedToken storage: Updated storage object
+
+        Emits:
+        Mint event for every entry of a newly imported chunk
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(data, sp.bytes)
+        params = sp.unpack(data, ImportBalancesParams).unwrap_some(error="BACKED_TOKEN_ImportBalances_CannotUnpackParams")
+        assert OwnableModule.isContractOwner(sp.sender), "BACKED_TOKEN_ImportBalances_NotAllowed"
+        assert not storage.cold.importFinalized, "BACKED_TOKEN_ImportBalances_Finalized"
+
+        updated_storage = storage
+
+        checksum = sp.blake2b(sp.pack(params.entries))
+
+        if params.chunk < updated_storage.cold.importedChunks:
+            assert updated_storage.cold.importChecksums.get(params.chunk, default=sp.bytes("0x")) == checksum, "BACKED_TOKEN_ImportBalances_ChecksumMismatch"
+        else:
+            assert params.chunk == updated_storage.cold.importedChunks, "BACKED_TOKEN_ImportBalances_InvalidChunk"
+
+            for entry in params.entries:
+                shares = SharesModule.toShares(sp.record(value=entry.balance, multiplier=updated_storage.hot.multiplier))
+                balance = updated_storage.hot.balances.get(entry.address, default=0) + shares
+                if balance == 0:
+                    del updated_storage.hot.balances[entry.address]
+                else:
+                    updated_storage.hot.balances[entry.address] = balance
+                updated_storage.hot.total_supply += shares
+
+                TokenEventsModule.emitMint(sp.record(storage=updated_storage.hot, to_=entry.address, shares=shares))
+
+            updated_storage.cold.importChecksums[params.chunk] = checksum
+            updated_storage.cold.importedChunks += 1
+
+        return updated_storage
+
+    @sp.effects(with_operations=True)
+    def finalizeImport(storage, data):
+        '''
+        Ends the migration of balances: `importBalances` fails from then on, and can not be enabled again.
+        Allowed only for owner.
+
+        Params:
+        storage (BackedToken storage) - current storage of the BackedToken contract
+        data (sp.bytes) - packed sp.unit
+
+        Returns:
+        BackedToken storage: Updated storage object
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(data, sp.bytes)
+        sp.unpack(data, sp.unit).unwrap_some(error="BACKED_TOKEN_FinalizeImport_CannotUnpackParams")
+        assert OwnableModule.isContractOwner(sp.sender), "BACKED_TOKEN_ImportBalances_NotAllowed"
+        assert not storage.cold.importFinalized, "BACKED_TOKEN_ImportBalances_Finalized"
+
+        updated_storage = storage
+        updated_storage.cold.importFinalized = True
+
+        return updated_storage
@@ -1,40 +1,72 @@
 import smartpy as sp
 from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.token_events import TokenEventsModule
 
 @sp.module
 def IncreaseAllowanceModule():
-    IncreaseAllowanceParams: type = sp.record(spender=sp.address, value=sp.nat).layout(("spender", "value"))
+    IncreaseAllowanceParams: type = BackedTokenStorageModule.AllowanceParams
 
-    @sp.effects()
+    @sp.effects(with_operations=True)
+    def applyIncreaseAllowance(storage, params):
+        '''
+        Typed core of the `increaseAllowance` action. Used directly by the native entrypoint
+        of the BackedToken contract, so no packing of the parameters is needed.
+        Can also be registered as the typed lambda of the action.
+
+        Params:
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
+        params (IncreaseAllowanceParams) - unpacked increase allowance parameters
+
+        Returns:
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Approval event
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.cast(params, IncreaseAllowanceParams)
+
+        updated_storage = storage
+
+        allowance_key = sp.record(owner=sp.sender, spender=params.spender)
+        allowance = updated_storage.allowances.get(allowance_key, default=0) + params.value
+        # Allowances at or above the unlimited value are capped, so they stay unlimited
+        if allowance > BackedTokenStorageModule.UNLIMITED_ALLOWANCE:
+            allowance = BackedTokenStorageModule.UNLIMITED_ALLOWANCE
+        if allowance == 0:
+            del updated_storage.allowances[allowance_key]
+        else:
+            updated_storage.allowances[allowance_key] = allowance
+
+        TokenEventsModule.emitApproval(sp.record(owner=sp.sender, spender=params.spender, value=allowance))
+
+        return updated_storage
+
+    @sp.effects(with_operations=True)
     def increaseAllowance(storage, data):
         '''
         Increases by `value` amount of tokens as the allowance of `spender` over the caller's tokens
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
         data (sp.bytes) - packed IncreaseAllowanceParams
             spender (sp.address) - address that will have allowance to spend caller's tokens
             value (sp.nat) - amount of the tokens that the allowance will be increased by
 
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Approval event
         '''
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
         sp.cast(data, sp.bytes)
         increaseAllowanceParams = sp.unpack(data, IncreaseAllowanceParams).unwrap_some(error="BACKED_TOKEN_IncreaseAllowance_CannotUnpackParams")
-      
-        updated_storage = storage
-
-        spender_balance = updated_storage.balances.get(
-            sp.sender, default=sp.record(balance=0, approvals={})
-        )
-        spender_balance.approvals[increaseAllowanceParams.spender] += increaseAllowanceParams.value
-        updated_storage.balances[sp.sender] = spender_balance
 
-        return updated_storage
+        return applyIncreaseAllowance(sp.record(storage=storage, params=increaseAllowanceParams))
 
 
 
  
  
- 
\ No newline at end of file
+ 
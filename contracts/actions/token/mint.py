@@ -1,37 +1,80 @@
 import smartpy as sp
 from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.shares import SharesModule
 
+from contracts.utils.token_events import TokenEventsModule
 @sp.module
 def MintModule():
     MintParams: type = sp.record(address=sp.address, value=sp.nat)
+    MintBatchParams: type = sp.list[MintParams]
 
-    @sp.effects()
+    @sp.effects(with_operations=True)
     def mint(storage, data):
         '''
         Function to mint tokens. Allowed only for minter
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
         data (sp.bytes) - packed MintParams
             account (sp.address) - the account to which the tokens will be minted
             amount (sp.nat) - the amount of tokens to be minted
 
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Mint event
         '''
         assert sp.sender == storage.roles.minter, "BACKED_TOKEN_Mint_NotMinter"
 
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
         sp.cast(data, sp.bytes)
         mintParams = sp.unpack(data, MintParams).unwrap_some(error="BACKED_TOKEN_Mint_CannotUnpackParams")
         
         updated_storage = storage
 
-        receiver_balance = updated_storage.balances.get(
-            mintParams.address, default=sp.record(balance=0, approvals={})
-        )
-        receiver_balance.balance += mintParams.value
-        updated_storage.balances[mintParams.address] = receiver_balance
-        updated_storage.total_supply += mintParams.value
+        # The minted shares are rounded down, so the credited balance may be lower than `value` by less than one share
+        shares = SharesModule.toShares(sp.record(value=mintParams.value, multiplier=updated_storage.multiplier))
+        assert shares > 0, "BACKED_TOKEN_Mint_ZeroShares"
+        updated_storage.balances[mintParams.address] = updated_storage.balances.get(mintParams.address, default=0) + shares
+        updated_storage.total_supply += shares
+
+        TokenEventsModule.emitMint(sp.record(storage=updated_storage, to_=mintParams.address, shares=shares))
+
+        return updated_storage
+
+    @sp.effects(with_operations=True)
+    def mintBatch(storage, data):
+        '''
+        Function to mint tokens to many accounts at once. Allowed only for minter
+
+        Params:
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
+        data (sp.bytes) - packed MintBatchParams
+            list of MintParams
+                account (sp.address) - the account to which the tokens will be minted
+                amount (sp.nat) - the amount of tokens to be minted
+
+        Returns:
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Mint event for every account
+        '''
+        assert sp.sender == storage.roles.minter, "BACKED_TOKEN_Mint_NotMinter"
+
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.cast(data, sp.bytes)
+        mints = sp.unpack(data, MintBatchParams).unwrap_some(error="BACKED_TOKEN_MintBatch_CannotUnpackParams")
+
+        updated_storage = storage
+
+        for mintParams in mints:
+            shares = SharesModule.toShares(sp.record(value=mintParams.value, multiplier=updated_storage.multiplier))
+            assert shares > 0, "BACKED_TOKEN_Mint_ZeroShares"
+            updated_storage.balances[mintParams.address] = updated_storage.balances.get(mintParams.address, default=0) + shares
+            updated_storage.total_supply += shares
+
+            TokenEventsModule.emitMint(sp.record(storage=updated_storage, to_=mintParams.address, shares=shares))
 
         return updated_storage
\ No newline at end of file
@@ -1,15 +1,17 @@
 import smartpy as sp
 from contracts.storage.backed_token import BackedTokenStorageModule
 
+from contracts.utils.token_events import TokenEventsModule
 @sp.module
 def PermitModule():
     PermitParams: type = sp.record(owner=sp.key, spender=sp.address, amount=sp.nat, deadline=sp.timestamp, signature=sp.signature)
 
-    @sp.effects()
+    @sp.effects(with_operations=True)
     def permit(storage, data):
         '''
         Update allowance with a signed permit. Allowed only if
-        the sender is whitelisted, or the delegateMode is set to true
+        the sender is whitelisted, or the delegateMode is set to true.
+        An `amount` of 2^256 - 1 sets an unlimited allowance, which is never decremented by transfers
         
         Params:
         storage (BackedToken storage) - current storage of the BackedToken contract
@@ -22,6 +24,9 @@ def PermitModule():
 
         Returns:
         BackedToken storage: Updated storage object
+
+        Emits:
+        Approval event
         '''
         sp.cast(storage, BackedTokenStorageModule.BackedToken)
         sp.cast(data, sp.bytes)
@@ -30,12 +35,12 @@ def PermitModule():
         assert params.deadline > sp.now, 'BACKED_TOKEN_Permit_ExpiredSignature'
         updated_storage = storage
 
-        assert updated_storage.delegateMode or updated_storage.delegateWhitelist[sp.sender], 'BACKED_TOKEN_Permit_UnauthorizedDelegate'
+        assert updated_storage.cold.delegateMode or updated_storage.cold.delegateWhitelist[sp.sender], 'BACKED_TOKEN_Permit_UnauthorizedDelegate'
 
         
         owner_address = sp.to_address(sp.implicit_account(sp.hash_key(params.owner)))
         
-        nonce = updated_storage.nonce.get(owner_address, default=0)
+        nonce = updated_storage.cold.nonce.get(owner_address, default=0)
 
         message = sp.pack(sp.record(
             deadline=params.deadline, spender=params.spender, amount=params.amount, nonce=nonce
@@ -43,17 +48,19 @@ def PermitModule():
 
         assert sp.check_signature(params.owner, params.signature, message), 'BACKED_TOKEN_Permit_InvalidSigner'
 
-        owner_balance = updated_storage.balances.get(
-            owner_address, default=sp.record(balance=0, approvals={})
-        )
-        alreadyApproved = owner_balance.approvals.get(params.spender, default=0)
+        allowance_key = sp.record(owner=owner_address, spender=params.spender)
+        alreadyApproved = updated_storage.hot.allowances.get(allowance_key, default=0)
         assert (
             alreadyApproved == 0 or params.amount == 0
         ), "BACKED_TOKEN_Permit_UnsafeAllowanceChange"
 
-        owner_balance.approvals[params.spender] = params.amount
-        updated_storage.balances[owner_address] = owner_balance
+        if params.amount == 0:
+            del updated_storage.hot.allowances[allowance_key]
+        else:
+            updated_storage.hot.allowances[allowance_key] = params.amount
+
+        updated_storage.cold.nonce[owner_address] = nonce + 1
 
-        updated_storage.nonce[owner_address] = nonce + 1
+        TokenEventsModule.emitApproval(sp.record(owner=owner_address, spender=params.spender, value=params.amount))
 
         return updated_storage
\ No newline at end of file
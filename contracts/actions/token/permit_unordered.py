@@ -0,0 +1,72 @@
+import smartpy as sp
+from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.nonce import NonceModule
+
+from contracts.utils.token_events import TokenEventsModule
+@sp.module
+def PermitUnorderedModule():
+    PermitUnorderedParams: type = sp.record(owner=sp.key, spender=sp.address, amount=sp.nat, nonce=sp.nat, deadline=sp.timestamp, signature=sp.signature)
+
+    @sp.effects(with_operations=True)
+    def permitUnordered(storage, data):
+        '''
+        Update allowance with a signed permit that uses an unordered nonce. Any unused nonce
+        can be signed, so many permits of one owner can be pending and included in any order.
+        Allowed only if the sender is whitelisted, or the delegateMode is set to true
+
+        Params:
+        storage (BackedToken storage) - current storage of the BackedToken contract
+        data (sp.bytes) - packed PermitUnorderedParams
+            owner (sp.key) - token owner's public key (Authorizer)
+            spender (sp.address) - spender's address
+            amount (sp.nat) - amount of allowance
+            nonce (sp.nat) - unused unordered nonce of the owner
+            deadline (sp.timestamp) - expiration time, seconds since the epoch
+            signature (sp.signature) - token owner's signature of the message
+
+        Returns:
+        BackedToken storage: Updated storage object
+
+        Emits:
+        Approval event
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(data, sp.bytes)
+        params = sp.unpack(data, PermitUnorderedParams).unwrap_some(error="BACKED_TOKEN_PermitUnordered_CannotUnpackParams")
+
+        assert params.deadline > sp.now, 'BACKED_TOKEN_PermitUnordered_ExpiredSignature'
+        updated_storage = storage
+
+        assert updated_storage.cold.delegateMode or updated_storage.cold.delegateWhitelist.get(sp.sender, default=False), 'BACKED_TOKEN_PermitUnordered_UnauthorizedDelegate'
+
+        owner_address = sp.to_address(sp.implicit_account(sp.hash_key(params.owner)))
+
+        slot = NonceModule.unorderedNonceSlot(sp.record(owner=owner_address, nonce=params.nonce))
+        bitmap = updated_storage.cold.nonceBitmap.get(slot.key, default=0)
+        assert bitmap & slot.mask == 0, 'BACKED_TOKEN_PermitUnordered_NonceAlreadyUsed'
+
+        # The token address and the chain id are signed too, so the signature can not be replayed
+        # on another token or on another chain, where the unordered nonce may still be unused
+        message = sp.pack(sp.record(
+            action="permit", deadline=params.deadline, spender=params.spender, amount=params.amount, nonce=params.nonce,
+            contract=sp.self_address, chainId=sp.chain_id
+        ))
+
+        assert sp.check_signature(params.owner, params.signature, message), 'BACKED_TOKEN_PermitUnordered_InvalidSigner'
+
+        allowance_key = sp.record(owner=owner_address, spender=params.spender)
+        alreadyApproved = updated_storage.hot.allowances.get(allowance_key, default=0)
+        assert (
+            alreadyApproved == 0 or params.amount == 0
+        ), "BACKED_TOKEN_PermitUnordered_UnsafeAllowanceChange"
+
+        if params.amount == 0:
+            del updated_storage.hot.allowances[allowance_key]
+        else:
+            updated_storage.hot.allowances[allowance_key] = params.amount
+
+        updated_storage.cold.nonceBitmap[slot.key] = bitmap | slot.mask
+
+        TokenEventsModule.emitApproval(sp.record(owner=owner_address, spender=params.spender, value=params.amount))
+
+        return updated_storage
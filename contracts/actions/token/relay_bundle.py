@@ -0,0 +1,116 @@
+import smartpy as sp
+from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.shares import SharesModule
+from contracts.actions.token.permit import PermitModule
+from contracts.actions.token.delegated_transfer import DelegatedTransferModule
+
+from contracts.utils.token_events import TokenEventsModule
+@sp.module
+def RelayBundleModule():
+    RelayItem: type = sp.variant(
+        permit=PermitModule.PermitParams,
+        delegatedTransfer=DelegatedTransferModule.DelegatedTransferParams
+    )
+    RelayBundleParams: type = sp.record(items=sp.list[RelayItem], skipInvalid=sp.bool)
+
+    @sp.effects(with_operations=True)
+    def relayBundle(storage, data):
+        '''
+        Applies many signed permits and delegated transfers in one action. Allowed only if
+        the sender is whitelisted, or the delegateMode is set to true. The delegate is checked once
+        for the whole bundle.
+
+        If `skipInvalid` is false, the bundle fails as a whole on the first invalid item. Otherwise invalid
+        items (expired, wrong signature or nonce, unsafe allowance change, insufficient balance) are skipped.
+        The outcome of each item is reported by a RelayResult event, with the position of the item in the bundle.
+
+        Params:
+        storage (BackedToken storage) - current storage of the BackedToken contract
+        data (sp.bytes) - packed RelayBundleParams
+            items (sp.list) - list of RelayItem, either `permit` (PermitParams) or `delegatedTransfer` (DelegatedTransferParams)
+            skipInvalid (sp.bool) - whether invalid items should be skipped instead of failing the bundle
+
+        Returns:
+        BackedToken storage: Updated storage object
+
+        Emits:
+        RelayResult event for every item, Approval or Transfer event for every applied item
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(data, sp.bytes)
+        bundle = sp.unpack(data, RelayBundleParams).unwrap_some(error="BACKED_TOKEN_RelayBundle_CannotUnpackParams")
+
+        updated_storage = storage
+
+        assert updated_storage.cold.delegateMode or updated_storage.cold.delegateWhitelist.get(sp.sender, default=False), 'BACKED_TOKEN_RelayBundle_UnauthorizedDelegate'
+
+        index = sp.nat(0)
+
+        for item in bundle.items:
+            applied = False
+
+            if item.is_variant.permit():
+                permitParams = item.unwrap.permit()
+                owner_address = sp.to_address(sp.implicit_account(sp.hash_key(permitParams.owner)))
+                nonce = updated_storage.cold.nonce.get(owner_address, default=0)
+                message = sp.pack(sp.record(
+                    deadline=permitParams.deadline, spender=permitParams.spender, amount=permitParams.amount, nonce=nonce
+                ))
+                allowance_key = sp.record(owner=owner_address, spender=permitParams.spender)
+                alreadyApproved = updated_storage.hot.allowances.get(allowance_key, default=0)
+
+                if (
+                    permitParams.deadline > sp.now
+                    and sp.check_signature(permitParams.owner, permitParams.signature, message)
+                    and (alreadyApproved == 0 or permitParams.amount == 0)
+                ):
+                    if permitParams.amount == 0:
+                        del updated_storage.hot.allowances[allowance_key]
+                    else:
+                        updated_storage.hot.allowances[allowance_key] = permitParams.amount
+                    updated_storage.cold.nonce[owner_address] = nonce + 1
+                    applied = True
+
+                    TokenEventsModule.emitApproval(sp.record(owner=owner_address, spender=permitParams.spender, value=permitParams.amount))
+                else:
+                    assert bundle.skipInvalid, 'BACKED_TOKEN_RelayBundle_InvalidPermit'
+            else:
+                transferParams = item.unwrap.delegatedTransfer()
+                owner_address = sp.to_address(sp.implicit_account(sp.hash_key(transferParams.owner)))
+                nonce = updated_storage.cold.nonce.get(owner_address, default=0)
+                message = sp.pack(sp.record(
+                    deadline=transferParams.deadline, spender=transferParams.spender, amount=transferParams.amount, nonce=nonce
+                ))
+                balance_from = updated_storage.hot.balances.get(owner_address, default=0)
+                shares = SharesModule.toSharesUp(sp.record(value=transferParams.amount, multiplier=updated_storage.hot.multiplier))
+
+                if (
+                    transferParams.deadline > sp.now
+                    and sp.check_signature(transferParams.owner, transferParams.signature, message)
+                    and balance_from >= shares
+                ):
+                    if balance_from == shares:
+                        del updated_storage.hot.balances[owner_address]
+                    else:
+                        updated_storage.hot.balances[owner_address] = sp.as_nat(balance_from - shares)
+                    balance_to = updated_storage.hot.balances.get(transferParams.spender, default=0) + shares
+                    if balance_to == 0:
+                        del updated_storage.hot.balances[transferParams.spender]
+                    else:
+                        updated_storage.hot.balances[transferParams.spender] = balance_to
+                    updated_storage.cold.nonce[owner_address] = nonce + 1
+                    applied = True
+
+                    TokenEventsModule.emitTransfer(sp.record(
+                        transfer=sp.record(from_=owner_address, to_=transferParams.spender, value=transferParams.amount),
+                        fromShares=updated_storage.hot.balances.get(owner_address, default=0),
+                        toShares=balance_to,
+                        multiplier=updated_storage.hot.multiplier
+                    ))
+                else:
+                    assert bundle.skipInvalid, 'BACKED_TOKEN_RelayBundle_InvalidDelegatedTransfer'
+
+            sp.emit(sp.cast(sp.record(index=index, applied=applied), BackedTokenStorageModule.RelayResultEvent), tag="RelayResult")
+            index += 1
+
+        return updated_storage
@@ -5,23 +5,23 @@ from contracts.storage.backed_token import BackedTokenStorageModule
 def SetBurnerModule():
     SetBurnerParams: type = sp.address
     
-    @sp.effects()
+    @sp.effects(with_operations=True)
     def setBurner(storage, data):
         '''
         Function to change the contract burner. Allowed only for owner
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
         data (sp.bytes) - packed SetBurnerParams
             newBurner (sp.address) - the address of the new burner
 
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken hot storage: Updated hot section
 
         # Emits:
         # NewBurner event
         '''
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
         sp.cast(data, sp.bytes)
         newBurner = sp.unpack(data, SetBurnerParams).unwrap_some(error="BACKED_TOKEN_SetBurner_CannotUnpackParams")
 
@@ -5,23 +5,23 @@ from contracts.storage.backed_token import BackedTokenStorageModule
 def SetDelegateModeModule():
     SetDelegateModeParams: type = sp.bool
     
-    @sp.effects()
+    @sp.effects(with_operations=True)
     def setDelegateMode(storage, data):
         '''
         EIP-712 Function to change the contract delegate mode. Allowed only for owner
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken cold storage) - current cold section of the BackedToken storage
         data (sp.bytes) - packed SetDelegateModeParams
             newDelegateMode (sp.bool) - the new delegate mode for the contract
 
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken cold storage: Updated cold section
 
         # Emits:
         # DelegateModeChange event
         '''
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenCold)
         sp.cast(data, sp.bytes)
         newDelegateMode = sp.unpack(data, SetDelegateModeParams).unwrap_some(error="BACKED_TOKEN_SetDelegateMode_CannotUnpackParams")
 
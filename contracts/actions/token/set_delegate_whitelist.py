@@ -5,24 +5,24 @@ from contracts.storage.backed_token import BackedTokenStorageModule
 def SetDelegateWhitelistModule():
     SetDelegateWhitelistParams: type = sp.record(address=sp.address, status=sp.bool)
     
-    @sp.effects()
+    @sp.effects(with_operations=True)
     def setDelegateWhitelist(storage, data):
         '''
         EIP-712 Function to change the delegate status. Allowed only for owner
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken cold storage) - current cold section of the BackedToken storage
         data (sp.bytes) - packed SetDelegateModeParams
             whitelistAddress (sp.bool) - the address for which to change the delegate status
             status (sp.bool) - the new delegate status
 
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken cold storage: Updated cold section
 
-        # Emits:
-        # DelegateWhitelistChange event
+        Emits:
+        DelegateWhitelistChange event
         '''
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenCold)
         sp.cast(data, sp.bytes)
         params = sp.unpack(data, SetDelegateWhitelistParams).unwrap_some(error="BACKED_TOKEN_SetDelegateMode_CannotUnpackParams")
 
@@ -30,6 +30,6 @@ def SetDelegateWhitelistModule():
         
         updated_storage.delegateWhitelist[params.address] = params.status
 
-        # sp.emit(sp.record(address=params.address, status=params.status), tag="DelegateWhitelistChange")
+        sp.emit(sp.record(address=params.address, status=params.status), tag="DelegateWhitelistChange")
 
         return updated_storage
\ No newline at end of file
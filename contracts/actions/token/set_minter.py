@@ -5,23 +5,23 @@ from contracts.storage.backed_token import BackedTokenStorageModule
 def SetMinterModule():
     SetMinterParams: type = sp.address
 
-    @sp.effects()
+    @sp.effects(with_operations=True)
     def setMinter(storage, data):
         '''
         Function to change the contract minter. Allowed only for owner
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
         data (sp.bytes) - packed SetMinterParams
             newMinter (sp.address) - the address of the new minter
 
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken hot storage: Updated hot section
 
         # Emits:
         # NewMinter event
         '''
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
         sp.cast(data, sp.bytes)
         newMinter = sp.unpack(data, SetMinterParams).unwrap_some(error="BACKED_TOKEN_SetMinter_CannotUnpackParams")
 
@@ -0,0 +1,47 @@
+import smartpy as sp
+from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.ownable import OwnableModule
+from contracts.utils.shares import SharesModule
+
+@sp.module
+def SetMultiplierModule():
+    SetMultiplierParams: type = sp.nat
+
+    @sp.effects(with_operations=True)
+    def setMultiplier(storage, data):
+        '''
+        Function to change the balance multiplier, scaling every balance and the total supply at once,
+        e.g. a multiplier doubled for a 2:1 stock split. Allowed only for owner or minter
+
+        The multiplier has 18 decimals (SharesModule.MULTIPLIER_BASE is 1.0). Allowances are kept in token
+        amounts, so they are not scaled.
+
+        Params:
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
+        data (sp.bytes) - packed SetMultiplierParams
+            multiplier (sp.nat) - the new multiplier, greater than zero
+
+        Returns:
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        MultiplierUpdated event
+        '''
+        assert sp.sender == storage.roles.minter or OwnableModule.isContractOwner(sp.sender), "BACKED_TOKEN_SetMultiplier_NotAllowed"
+
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.cast(data, sp.bytes)
+        multiplier = sp.unpack(data, SetMultiplierParams).unwrap_some(error="BACKED_TOKEN_SetMultiplier_CannotUnpackParams")
+
+        assert multiplier > 0, "BACKED_TOKEN_SetMultiplier_InvalidMultiplier"
+
+        updated_storage = storage
+
+        updated_storage.multiplier = multiplier
+
+        sp.emit(sp.cast(sp.record(
+            multiplier=multiplier,
+            totalSupply=SharesModule.toBalance(sp.record(shares=updated_storage.total_supply, multiplier=multiplier))
+        ), BackedTokenStorageModule.MultiplierEvent), tag="MultiplierUpdated")
+
+        return updated_storage
@@ -5,22 +5,22 @@ from contracts.storage.backed_token import BackedTokenStorageModule
 def SetTermsModule():
     SetTermsParams: type = sp.string
     
-    @sp.effects()
+    @sp.effects(with_operations=True)
     def setTerms(storage, data):
         '''
         Function to change the contract terms. Allowed only for owner
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken cold storage) - current cold section of the BackedToken storage
         data (sp.bytes) - packed SetTermsParams
             newTerms (sp.string) - a string with the terms. Usually a web or IPFS link.
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken cold storage: Updated cold section
 
         # Emits:
         # NewTerms event
         '''
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenCold)
         sp.cast(data, sp.bytes)
         newTerms = sp.unpack(data, SetTermsParams).unwrap_some(error="BACKED_TOKEN_SetBurner_CannotUnpackParams")
 
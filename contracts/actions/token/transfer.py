@@ -1,55 +1,96 @@
 import smartpy as sp
 from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.shares import SharesModule
+from contracts.utils.token_events import TokenEventsModule
 
 @sp.module
 def TransferModule():
-    TransferParams: type = sp.record(from_=sp.address, to_=sp.address, value=sp.nat).layout(("from_ as from", ("to_ as to", "value")))
+    TransferParams: type = BackedTokenStorageModule.TransferParams
 
-    @sp.effects()
+    @sp.effects(with_operations=True)
+    def applyTransfer(storage, params):
+        '''
+        Typed core of the `transfer` action. Used directly by the native entrypoint
+        of the BackedToken contract, so no packing of the parameters is needed.
+        Can also be registered as the typed lambda of the action.
+
+        Params:
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
+        params (TransferParams) - unpacked transfer parameters
+
+        Returns:
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Transfer event
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.cast(params, TransferParams)
+
+        updated_storage = storage
+
+        # The shares for `value` are rounded up, so the sender never sends less than `value`
+        shares = SharesModule.toSharesUp(sp.record(value=params.value, multiplier=updated_storage.multiplier))
+
+        # Entries that drop to zero are removed, so their storage is freed
+        balance_from = sp.as_nat(
+            updated_storage.balances.get(params.from_, default=0) - shares,
+            error="BACKED_TOKEN_Transfer_InsufficientBalance"
+        )
+        if balance_from == 0:
+            del updated_storage.balances[params.from_]
+        else:
+            updated_storage.balances[params.from_] = balance_from
+
+        balance_to = updated_storage.balances.get(params.to_, default=0) + shares
+        if balance_to == 0:
+            del updated_storage.balances[params.to_]
+        else:
+            updated_storage.balances[params.to_] = balance_to
+
+        if params.from_ != sp.sender:
+            allowance_key = sp.record(owner=params.from_, spender=sp.sender)
+            allowance = updated_storage.allowances.get(allowance_key, default=0)
+            if allowance != BackedTokenStorageModule.UNLIMITED_ALLOWANCE:
+                remaining = sp.as_nat(allowance - params.value, error="BACKED_TOKEN_Transfer_NotAllowed")
+                if remaining == 0:
+                    del updated_storage.allowances[allowance_key]
+                else:
+                    updated_storage.allowances[allowance_key] = remaining
+
+        TokenEventsModule.emitTransfer(sp.record(
+            transfer=params,
+            fromShares=updated_storage.balances.get(params.from_, default=0),
+            toShares=balance_to,
+            multiplier=updated_storage.multiplier
+        ))
+
+        return updated_storage
+
+    @sp.effects(with_operations=True)
     def transfer(storage, data):
         '''
         Moves a `value` amount of tokens from `from` to `to` using the
-        allowance mechanism. `value` is then deducted from the caller's allowance.
+        allowance mechanism. `value` is then deducted from the caller's allowance,
+        unless the allowance is unlimited.
 
         Params:
-        storage (BackedToken storage) - current storage of the BackedToken contract
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
         data (sp.bytes) - packed TransferParams
             from_ (sp.address) - the address from which the tokens will sent from
             to_ (sp.address) - the address to which the tokens will sent
             value (sp.nat) - the amount of the tokens that will be sent
 
         Returns:
-        BackedToken storage: Updated storage object
+        BackedToken hot storage: Updated hot section
 
-        # Emits:
-        # Transfer event
+        Emits:
+        Transfer event
         '''
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
         sp.cast(data, sp.bytes)
         transferParams = sp.unpack(data, TransferParams).unwrap_some(error="BACKED_TOKEN_Transfer_CannotUnpackParams")
-      
-        updated_storage = storage
-
-        balance_from = updated_storage.balances.get(
-            transferParams.from_, default=sp.record(balance=0, approvals={})
-        )
-        balance_to = updated_storage.balances.get(
-            transferParams.to_, default=sp.record(balance=0, approvals={})
-        )
-        balance_from.balance = sp.as_nat(
-            balance_from.balance - transferParams.value, error="BACKED_TOKEN_Transfer_InsufficientBalance"
-        )
 
-        balance_to.balance += transferParams.value 
-       
-        if transferParams.from_ != sp.sender:
-            balance_from.approvals[sp.sender] = sp.as_nat(
-                balance_from.approvals[sp.sender] - transferParams.value,
-                error="BACKED_TOKEN_Transfer_NotAllowed",
-            )
-       
-        updated_storage.balances[transferParams.from_] = balance_from
-        updated_storage.balances[transferParams.to_] = balance_to
-        return updated_storage
+        return applyTransfer(sp.record(storage=storage, params=transferParams))
 
 
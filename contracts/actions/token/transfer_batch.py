@@ -0,0 +1,82 @@
+import smartpy as sp
+from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.actions.token.transfer import TransferModule
+from contracts.utils.shares import SharesModule
+from contracts.utils.token_events import TokenEventsModule
+
+@sp.module
+def TransferBatchModule():
+    TransferBatchParams: type = sp.list[TransferModule.TransferParams]
+
+    @sp.effects(with_operations=True)
+    def transferBatch(storage, data):
+        '''
+        Moves tokens for every transfer in the list, in order, using the same rules as `transfer`.
+        Balances of the touched accounts are cached while the list is processed, so every balance
+        and allowance is written only once. Fails as a whole if any of the transfers is invalid.
+
+        Params:
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
+        data (sp.bytes) - packed TransferBatchParams
+            list of TransferParams
+                from_ (sp.address) - the address from which the tokens will sent from
+                to_ (sp.address) - the address to which the tokens will sent
+                value (sp.nat) - the amount of the tokens that will be sent
+
+        Returns:
+        BackedToken hot storage: Updated hot section
+
+        Emits:
+        Transfer event for every transfer, with the balances after that transfer
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.cast(data, sp.bytes)
+        transfers = sp.unpack(data, TransferBatchParams).unwrap_some(error="BACKED_TOKEN_TransferBatch_CannotUnpackParams")
+
+        updated_storage = storage
+
+        # Balances are cached in shares, allowances are spent in token amounts
+        balances = sp.cast({}, sp.map[sp.address, sp.nat])
+        spent = sp.cast({}, sp.map[sp.address, sp.nat])
+
+        for transferParams in transfers:
+            if not balances.contains(transferParams.from_):
+                balances[transferParams.from_] = updated_storage.balances.get(transferParams.from_, default=0)
+            if not balances.contains(transferParams.to_):
+                balances[transferParams.to_] = updated_storage.balances.get(transferParams.to_, default=0)
+
+            shares = SharesModule.toSharesUp(sp.record(value=transferParams.value, multiplier=updated_storage.multiplier))
+            balances[transferParams.from_] = sp.as_nat(
+                balances[transferParams.from_] - shares,
+                error="BACKED_TOKEN_TransferBatch_InsufficientBalance"
+            )
+            balances[transferParams.to_] += shares
+
+            if transferParams.from_ != sp.sender:
+                spent[transferParams.from_] = spent.get(transferParams.from_, default=0) + transferParams.value
+
+            TokenEventsModule.emitTransfer(sp.record(
+                transfer=transferParams,
+                fromShares=balances[transferParams.from_],
+                toShares=balances[transferParams.to_],
+                multiplier=updated_storage.multiplier
+            ))
+
+        # Entries that drop to zero are removed, so their storage is freed
+        for balance in balances.items():
+            if balance.value == 0:
+                del updated_storage.balances[balance.key]
+            else:
+                updated_storage.balances[balance.key] = balance.value
+
+        for allowance in spent.items():
+            allowance_key = sp.record(owner=allowance.key, spender=sp.sender)
+            approved = updated_storage.allowances.get(allowance_key, default=0)
+            if approved != BackedTokenStorageModule.UNLIMITED_ALLOWANCE:
+                remaining = sp.as_nat(approved - allowance.value, error="BACKED_TOKEN_TransferBatch_NotAllowed")
+                if remaining == 0:
+                    del updated_storage.allowances[allowance_key]
+                else:
+                    updated_storage.allowances[allowance_key] = remaining
+
+        return updated_storage
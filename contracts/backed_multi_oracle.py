@@ -0,0 +1,261 @@
+import smartpy as sp
+
+from contracts.storage.backed_oracle import BackedOracleStorageModule
+from contracts.storage.backed_multi_oracle import BackedMultiOracleStorageModule
+
+from contracts.utils.ownable import OwnableModule
+from contracts.utils.round_buffer import RoundBufferModule
+
+@sp.module
+def BackedMultiOracleModule():
+    FeedRound: type = sp.record(feedId=sp.string, roundId=sp.nat).layout(("feedId", "roundId"))
+
+    def readFeed(storage, feedId):
+        '''
+        Returns the state of a feed, failing if the feed does not exist or has no round yet.
+
+        Params:
+        storage (BackedMultiOracle storage) - current storage of the BackedMultiOracle contract
+        feedId (sp.string) - the id of the feed
+        '''
+        sp.cast(storage, BackedMultiOracleStorageModule.BackedMultiOracle)
+        sp.cast(feedId, sp.string)
+        feed = storage.feeds.get_opt(feedId).unwrap_some(error="BACKED_ORACLE_UnknownFeed")
+        assert feed.latestRoundNumber != 0, "No data present"
+
+        return feed
+
+    def readFeedRound(storage, params):
+        '''
+        Returns the data of a round of a feed, failing if the round does not exist yet or has been evicted.
+
+        Params:
+        storage (BackedMultiOracle storage) - current storage of the BackedMultiOracle contract
+        params (FeedRound) - the id of the feed and the round number
+        '''
+        sp.cast(storage, BackedMultiOracleStorageModule.BackedMultiOracle)
+        sp.cast(params, FeedRound)
+        feed = storage.feeds.get_opt(params.feedId).unwrap_some(error="BACKED_ORACLE_UnknownFeed")
+        assert params.roundId != 0 and params.roundId <= feed.latestRoundNumber, "No data present"
+        assert storage.retention == 0 or params.roundId + storage.retention > feed.latestRoundNumber, "Round pruned"
+
+        return storage.roundData[sp.record(feedId=params.feedId, roundId=RoundBufferModule.roundKey(sp.record(retention=storage.retention, roundId=params.roundId)))]
+
+    def readFeedRoundRange(storage, params):
+        '''
+        Returns up to `count` consecutive rounds of a feed starting at `fromRound`, capped like `readRoundRange`
+        of RoundBufferModule. When the cap cut the requested range, `nextRound` is the round to continue from.
+
+        Params:
+        storage (BackedMultiOracle storage) - current storage of the BackedMultiOracle contract
+        params (FeedRoundRangeParams) - the id of the feed, the first round and the number of rounds to return
+        '''
+        sp.cast(storage, BackedMultiOracleStorageModule.BackedMultiOracle)
+        sp.cast(params, BackedMultiOracleStorageModule.FeedRoundRangeParams)
+        feed = storage.feeds.get_opt(params.feedId).unwrap_some(error="BACKED_ORACLE_UnknownFeed")
+
+        end = params.fromRound + params.count
+        if params.count > RoundBufferModule.MAX_ROUND_RANGE:
+            end = params.fromRound + RoundBufferModule.MAX_ROUND_RANGE
+        if end > feed.latestRoundNumber + 1:
+            end = feed.latestRoundNumber + 1
+
+        rounds = []
+        roundId = params.fromRound
+        while roundId < end:
+            roundData = readFeedRound(sp.record(storage=storage, params=sp.record(feedId=params.feedId, roundId=roundId)))
+            rounds.push(sp.record(
+                roundId=roundId,
+                answer=roundData.answer,
+                startedAt=roundData.timestamp,
+                updatedAt=roundData.timestamp,
+                answeredInRound=roundId
+            ))
+            roundId += 1
+
+        nextRound = None
+        if roundId < params.fromRound + params.count and roundId <= feed.latestRoundNumber:
+            nextRound = sp.Some(roundId)
+
+        return sp.cast(
+            sp.record(rounds=reversed(rounds), nextRound=nextRound),
+            BackedOracleStorageModule.RoundRange
+        )
+
+    class BackedMultiOracle(OwnableModule.Ownable):
+        '''
+        Oracle contract serving many price feeds, keyed by feed id, that are all updated in one operation.
+        Each feed can be read with the single feed interface through its own BackedMultiOracleForwarder.
+
+        The contract contains two roles:
+        - An owner, which can add feeds and update the implementation
+        - An updater, which can update the answers of the feeds
+        '''
+        def __init__(self, owner, metadata, implementation, updater, retention):
+            '''
+            Params:
+            owner (sp.address) - the address of the account that will be set as owner of the contract
+            metadata (sp.big_map) - contract-specific metadata
+            implementation (sp.big_map) - implementation of the actions in form of lambdas that take storage and return updated one
+            updater (sp.address) - the address of the account that will be set as updater of the contract
+            retention (sp.nat) - number of rounds kept per feed, older rounds are overwritten. 0 keeps all rounds
+            '''
+            OwnableModule.Ownable.__init__(self, owner)
+
+            self.data.metadata = metadata
+
+            self.data.storage = sp.record(
+                updater=updater,
+                feeds=sp.big_map(),
+                retention=retention,
+                roundData=sp.big_map()
+            )
+            sp.cast(self.data.storage, BackedMultiOracleStorageModule.BackedMultiOracle)
+
+            sp.cast(implementation, sp.big_map[sp.string, BackedMultiOracleStorageModule.BackedMultiOracleAction])
+            self.data.implementation = implementation
+
+        @sp.onchain_view()
+        def decimals(self, feedId):
+            sp.cast(feedId, sp.string)
+            return self.data.storage.feeds.get_opt(feedId).unwrap_some(error="BACKED_ORACLE_UnknownFeed").decimals
+
+        @sp.onchain_view()
+        def description(self, feedId):
+            sp.cast(feedId, sp.string)
+            return self.data.storage.feeds.get_opt(feedId).unwrap_some(error="BACKED_ORACLE_UnknownFeed").description
+
+        @sp.onchain_view()
+        def retention(self):
+            return self.data.storage.retention
+
+        @sp.onchain_view()
+        def latestAnswer(self, feedId):
+            return readFeed(sp.record(storage=self.data.storage, feedId=feedId)).latest.answer
+
+        @sp.onchain_view()
+        def latestTimestamp(self, feedId):
+            return readFeed(sp.record(storage=self.data.storage, feedId=feedId)).latest.timestamp
+
+        @sp.onchain_view()
+        def latestRound(self, feedId):
+            return readFeed(sp.record(storage=self.data.storage, feedId=feedId)).latestRoundNumber
+
+        @sp.onchain_view()
+        def latestRoundData(self, feedId):
+            feed = readFeed(sp.record(storage=self.data.storage, feedId=feedId))
+
+            return sp.record(
+                roundId=feed.latestRoundNumber,
+                answer=feed.latest.answer,
+                startedAt=feed.latest.timestamp,
+                updatedAt=feed.latest.timestamp,
+                answeredInRound=feed.latestRoundNumber
+            )
+
+        @sp.onchain_view()
+        def getAnswer(self, params):
+            return readFeedRound(sp.record(storage=self.data.storage, params=params)).answer
+
+        @sp.onchain_view()
+        def getRoundData(self, params):
+            roundData = readFeedRound(sp.record(storage=self.data.storage, params=params))
+
+            return sp.record(
+                roundId=params.roundId,
+                answer=roundData.answer,
+                startedAt=roundData.timestamp,
+                updatedAt=roundData.timestamp,
+                answeredInRound=params.roundId
+            )
+
+        @sp.onchain_view()
+        def twap(self, params):
+            '''
+            Returns the time-weighted average answer of a feed between the timestamps of `fromRound` and `toRound`,
+            each answer being weighted by the time until the next round. Rounded down.
+            '''
+            sp.cast(params, BackedMultiOracleStorageModule.FeedTwapParams)
+            assert params.fromRound < params.toRound, "Invalid round range"
+
+            fromRoundData = readFeedRound(sp.record(storage=self.data.storage, params=sp.record(feedId=params.feedId, roundId=params.fromRound)))
+            toRoundData = readFeedRound(sp.record(storage=self.data.storage, params=sp.record(feedId=params.feedId, roundId=params.toRound)))
+
+            return (toRoundData.cumulativePrice - fromRoundData.cumulativePrice) / (toRoundData.timestamp - fromRoundData.timestamp)
+
+        @sp.onchain_view()
+        def getRoundRange(self, params):
+            # At most MAX_ROUND_RANGE rounds, `nextRound` tells where to continue
+            return readFeedRoundRange(sp.record(storage=self.data.storage, params=params))
+
+        @sp.entrypoint
+        def execute(self, params):
+            '''
+            Executes action registered in the implementation.
+
+            Params:
+            actionName (sp.string) - action's name registered in the implementation
+            data (sp.bytes) - packed action data in proper format
+
+            Emits:
+            The events emitted by the action
+            '''
+            sp.cast(params, sp.record(actionName=sp.string, data=sp.bytes))
+
+            action = self.data.implementation.get_opt(params.actionName).unwrap_some(error="BACKED_ORACLE_UnknownAction")
+
+            if action.only_admin:
+                assert self.isOwner(sp.sender), "BACKED_ORACLE_NotAdmin"
+
+            self.data.storage = action.action(sp.record(storage=self.data.storage, data=params.data))
+
+        @sp.entrypoint
+        def updateMetadata(self, key, value):
+            '''
+            An entrypoint to allow the contract metadata to be updated
+
+            Params:
+            key (sp.string) - metadata's key for entry that will be changed
+            value (sp.bytes) - updated metadata data
+            '''
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_NotOwner"
+            self.data.metadata[key] = value
+
+        @sp.entrypoint
+        def updateImplementation(self, implementation):
+            '''
+            Update the implementation. Callable only by the owner
+
+            Params:
+            implementation (sp.big_map) - New implementation of the actions in form of lambdas that take storage and return updated one
+            '''
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_NotOwner"
+
+            self.data.implementation = implementation
+
+        @sp.entrypoint
+        def setAction(self, name, entry):
+            '''
+            Adds or replaces a single action in the implementation. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in the implementation
+            entry (sp.record) - implementation of the action in form of lambda that takes storage and returns updated one,
+                together with the `only_admin` flag
+            '''
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_NotOwner"
+
+            self.data.implementation[name] = entry
+
+        @sp.entrypoint
+        def removeAction(self, name):
+            '''
+            Removes a single action from the implementation. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in the implementation
+            '''
+            sp.cast(name, sp.string)
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_NotOwner"
+
+            del self.data.implementation[name]
@@ -0,0 +1,160 @@
+import smartpy as sp
+
+from contracts.storage.backed_multi_oracle import BackedMultiOracleStorageModule
+from contracts.utils.ownable import OwnableModule
+
+@sp.module
+def BackedMultiOracleForwarderModule():
+    class BackedMultiOracleForwarder(OwnableModule.Ownable):
+        '''
+        Forwarder contract, used as facade for a single feed of a multi-feed oracle.
+        It exposes the same views as BackedOracleForwarder, so consumers do not need to know the feed id
+
+        The contract contains one role:
+        - An owner, which can change upstream oracle and feed
+        '''
+        def __init__(self, owner, upstreamOracle, feedId):
+            OwnableModule.Ownable.__init__(self, owner)
+
+            self.data.upstreamOracle = upstreamOracle
+            self.data.feedId = sp.cast(feedId, sp.string)
+
+        @sp.onchain_view()
+        def decimals(self):
+            return sp.view(
+                "decimals",
+                self.data.upstreamOracle,
+                self.data.feedId,
+                sp.string
+            ).unwrap_some(error="Invalid view")
+
+        @sp.onchain_view()
+        def description(self):
+            return sp.view(
+                "description",
+                self.data.upstreamOracle,
+                self.data.feedId,
+                sp.string
+            ).unwrap_some(error="Invalid view")
+
+        @sp.onchain_view()
+        def latestAnswer(self):
+            return sp.view(
+                "latestAnswer",
+                self.data.upstreamOracle,
+                self.data.feedId,
+                sp.int
+            ).unwrap_some(error="Invalid view")
+
+        @sp.onchain_view()
+        def latestTimestamp(self):
+            return sp.view(
+                "latestTimestamp",
+                self.data.upstreamOracle,
+                self.data.feedId,
+                sp.timestamp
+            ).unwrap_some(error="Invalid view")
+
+        @sp.onchain_view()
+        def latestRound(self):
+            return sp.view(
+                "latestRound",
+                self.data.upstreamOracle,
+                self.data.feedId,
+                sp.nat
+            ).unwrap_some(error="Invalid view")
+
+        @sp.onchain_view()
+        def latestRoundData(self):
+            return sp.view(
+                "latestRoundData",
+                self.data.upstreamOracle,
+                self.data.feedId,
+                sp.record(
+                    roundId=sp.nat,
+                    answer=sp.int,
+                    startedAt=sp.timestamp,
+                    updatedAt=sp.timestamp,
+                    answeredInRound=sp.nat
+                )
+            ).unwrap_some(error="Invalid view")
+
+        @sp.onchain_view()
+        def getAnswer(self, roundId):
+            sp.cast(roundId, sp.nat)
+
+            return sp.view(
+                "getAnswer",
+                self.data.upstreamOracle,
+                sp.record(feedId=self.data.feedId, roundId=roundId),
+                sp.int
+            ).unwrap_some(error="Invalid view")
+
+        @sp.onchain_view()
+        def getRoundData(self, roundId):
+            sp.cast(roundId, sp.nat)
+
+            return sp.view(
+                "getRoundData",
+                self.data.upstreamOracle,
+                sp.record(feedId=self.data.feedId, roundId=roundId),
+                sp.record(
+                    roundId=sp.nat,
+                    answer=sp.int,
+                    startedAt=sp.timestamp,
+                    updatedAt=sp.timestamp,
+                    answeredInRound=sp.nat
+                )
+            ).unwrap_some(error="Invalid view")
+
+        @sp.onchain_view()
+        def twap(self, params):
+            sp.cast(params, sp.record(fromRound=sp.nat, toRound=sp.nat).layout(("fromRound", "toRound")))
+
+            return sp.view(
+                "twap",
+                self.data.upstreamOracle,
+                sp.cast(
+                    sp.record(feedId=self.data.feedId, fromRound=params.fromRound, toRound=params.toRound),
+                    BackedMultiOracleStorageModule.FeedTwapParams
+                ),
+                sp.int
+            ).unwrap_some(error="Invalid view")
+
+        @sp.onchain_view()
+        def getRoundRange(self, params):
+            sp.cast(params, sp.record(fromRound=sp.nat, count=sp.nat).layout(("fromRound", "count")))
+
+            return sp.view(
+                "getRoundRange",
+                self.data.upstreamOracle,
+                sp.cast(
+                    sp.record(feedId=self.data.feedId, fromRound=params.fromRound, count=params.count),
+                    BackedMultiOracleStorageModule.FeedRoundRangeParams
+                ),
+                sp.record(
+                    rounds=sp.list[sp.record(
+                        roundId=sp.nat,
+                        answer=sp.int,
+                        startedAt=sp.timestamp,
+                        updatedAt=sp.timestamp,
+                        answeredInRound=sp.nat
+                    )],
+                    nextRound=sp.option[sp.nat]
+                ).layout(("rounds", "nextRound"))
+            ).unwrap_some(error="Invalid view")
+
+        @sp.entrypoint
+        def setUpstreamOracle(self, upstreamOracle, feedId):
+            '''
+            Points the forwarder to another multi-feed oracle or feed. Callable only by the owner
+
+            Params:
+            upstreamOracle (sp.address) - the address of the multi-feed oracle
+            feedId (sp.string) - the id of the feed in the oracle
+            '''
+            sp.cast(feedId, sp.string)
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_FORWARDER_NotOwner"
+
+            self.data.upstreamOracle = upstreamOracle
+            self.data.feedId = feedId
@@ -0,0 +1,294 @@
+# Multi Asset - FA2
+# Inspired by https://gitlab.com/tzip/tzip/-/blob/master/proposals/tzip-12/tzip-12.md
+
+import smartpy as sp
+from contracts.utils.ownable import OwnableModule
+from contracts.utils.pausable import PausableModule
+from contracts.utils.nonce import NonceModule
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+from contracts.actions.multi_token.transfer import MultiTokenTransferModule
+from contracts.actions.multi_token.update_operators import MultiTokenUpdateOperatorsModule
+
+@sp.module
+def BackedMultiTokenModule():
+    BACKED_TERMS = "https://www.backedassets.fi/legal-documentation"
+
+    class CommonInterface(OwnableModule.OwnableInterface, PausableModule.PausableInterface, NonceModule.NonceInterface):
+        def __init__(self):
+            OwnableModule.OwnableInterface.__init__(self)
+            PausableModule.PausableInterface.__init__(self)
+            NonceModule.NonceInterface.__init__(self)
+            self.data.metadata = sp.big_map()
+            self.data.storage = sp.record(
+                hot=sp.record(
+                    ledger=sp.big_map(),
+                    operators=sp.big_map(),
+                    supply=sp.big_map(),
+                    roles=sp.big_map()
+                ),
+                cold=sp.record(
+                    token_metadata=sp.big_map(),
+                    terms=BACKED_TERMS,
+                    nonce=sp.big_map(),
+                    delegateMode=False,
+                    delegateWhitelist=sp.big_map()
+                )
+            )
+            sp.cast(self.data.storage, BackedMultiTokenStorageModule.BackedMultiToken)
+
+    class Fa2(CommonInterface):
+        def __init__(self, metadata, implementation):
+            """
+            token_metadata spec: https://gitlab.com/tzip/tzip/-/blob/master/proposals/tzip-12/tzip-12.md#token-metadata
+            contract_metadata spec: https://gitlab.com/tzip/tzip/-/blob/master/proposals/tzip-16/tzip-16.md
+
+            Assets are added by the owner with `addToken`, no asset exists at origination.
+            """
+            CommonInterface.__init__(self)
+            sp.cast(implementation, sp.big_map[sp.string, BackedMultiTokenStorageModule.BackedMultiTokenAction])
+
+            self.data.implementation = implementation
+            self.data.metadata = metadata
+
+        @sp.private(with_storage='read-write')
+        def applyAction(self, params):
+            '''
+            Runs an action lambda on the storage section it was registered with,
+            so hot actions do not carry the cold fields through the lambda and back.
+
+            Params:
+            action (sp.variant) - lambda of the action, tagged with its storage section
+            data (sp.bytes) - packed action data in proper format
+            '''
+            if params.action.is_variant.hot():
+                self.data.storage.hot = params.action.unwrap.hot()(sp.record(storage=self.data.storage.hot, data=params.data))
+            else:
+                if params.action.is_variant.cold():
+                    self.data.storage.cold = params.action.unwrap.cold()(sp.record(storage=self.data.storage.cold, data=params.data))
+                else:
+                    self.data.storage = params.action.unwrap.full()(sp.record(storage=self.data.storage, data=params.data))
+
+        @sp.entrypoint
+        def execute(self, actionName, data):
+            '''
+            Executes action registered in implementation registry.
+
+            Params:
+            actionName (sp.string) - action's name registered in implementation registry
+            data (sp.bytes) - packed action data in proper format
+            '''
+            assert not self.isPaused(), "BACKED_TOKEN_Paused"
+
+            actionEntry = self.data.implementation.get(actionName, error="BACKED_TOKEN_UnknownAction")
+
+            if actionEntry.only_admin:
+                assert self.isOwner(sp.sender), "BACKED_TOKEN_NotAdmin"
+
+            self.applyAction(sp.record(action=actionEntry.action, data=data))
+
+        @sp.entrypoint
+        def transfer(self, param):
+            '''
+            Moves tokens of one or more assets for every transfer in the list, following TZIP-12.
+            Uses the compiled-in implementation, unless a `transfer` action is registered in the implementation.
+            '''
+            assert not self.isPaused(), "BACKED_TOKEN_Paused"
+
+            sp.cast(param, BackedMultiTokenStorageModule.TransferParams)
+            if self.data.implementation.contains('transfer'):
+                data = sp.pack(param)
+
+                self.applyAction(sp.record(action=self.data.implementation['transfer'].action, data=data))
+            else:
+                self.data.storage.hot = MultiTokenTransferModule.applyTransfer(sp.record(storage=self.data.storage.hot, params=param))
+
+        @sp.entrypoint
+        def update_operators(self, param):
+            '''
+            Adds or removes operators of the sender's tokens, following TZIP-12.
+            Uses the compiled-in implementation, unless an `updateOperators` action is registered in the implementation.
+            '''
+            assert not self.isPaused(), "BACKED_TOKEN_Paused"
+
+            sp.cast(param, BackedMultiTokenStorageModule.UpdateOperatorsParams)
+            if self.data.implementation.contains('updateOperators'):
+                data = sp.pack(param)
+
+                self.applyAction(sp.record(action=self.data.implementation['updateOperators'].action, data=data))
+            else:
+                self.data.storage.hot = MultiTokenUpdateOperatorsModule.applyUpdateOperators(sp.record(storage=self.data.storage.hot, params=param))
+
+        @sp.entrypoint
+        def balance_of(self, param):
+            '''
+            Sends the balances of all the requested (owner, token_id) pairs to the callback, in the order of the requests.
+            '''
+            sp.cast(param, BackedMultiTokenStorageModule.BalanceOfParams)
+
+            balances = []
+            for request in param.requests:
+                assert self.data.storage.hot.supply.contains(request.token_id), "FA2_TOKEN_UNDEFINED"
+                balances.push(sp.cast(
+                    sp.record(request=request, balance=self.data.storage.hot.ledger.get(request, default=0)),
+                    BackedMultiTokenStorageModule.BalanceOfResponse
+                ))
+
+            sp.transfer(reversed(balances), sp.tez(0), param.callback)
+
+        @sp.offchain_view()
+        def token_metadata(self, token_id):
+            '''
+            Return the token-metadata of the given asset.
+            '''
+            sp.cast(token_id, sp.nat)
+            return self.data.storage.cold.token_metadata.get(token_id, error="FA2_TOKEN_UNDEFINED")
+
+    class BackedMultiToken(OwnableModule.Ownable, PausableModule.Pausable, NonceModule.Nonce, Fa2):
+        '''
+        This token contract is following the FA2 standard and hosts many assets, each identified by its token_id.
+        It can be paused by the pauser, which freezes all actions. It is upgradeable by adding or replacing lambdas for specific actions.
+        The contract contains these roles:
+        - A minter per asset, that can mint new tokens of the asset.
+        - A burner per asset, that can burn tokens of the asset.
+        - A pauser, that can pause or restore all transfers in the contract.
+        - An owner, that can add assets and set the roles above.
+        - An upgrader, that can update actions in the implementation. Initially the owner.
+        '''
+
+        def __init__(self, owner, metadata, implementation, pauser):
+            '''
+            Params:
+            owner (sp.address) - the address of the account that will be set as owner of the contract
+            metadata (sp.big_map) - contract-specific metadata
+            implementation (sp.big_map) - implementation of the actions in form of lambdas that take storage and return updated one,
+            pauser (sp.address) - the address of the account that will be set as pauser of the contract
+            '''
+            OwnableModule.Ownable.__init__(self, owner)
+            PausableModule.Pausable.__init__(self, pauser)
+            NonceModule.Nonce.__init__(self)
+            Fa2.__init__(self, metadata, implementation)
+            self.data.upgrader = owner
+
+        @sp.entrypoint
+        def addToken(self, token_id, token_info, minter, burner):
+            '''
+            Adds a new asset to the contract, with zero supply. Callable only by the owner
+
+            Params:
+            token_id (sp.nat) - id of the new asset
+            token_info (sp.map) - token-specific metadata of the asset
+            minter (sp.address) - the address of the account that will be set as minter of the asset
+            burner (sp.address) - the address of the account that will be set as burner of the asset
+
+            Emits:
+            TokenAdded event
+            '''
+            sp.cast(token_id, sp.nat)
+            sp.cast(token_info, sp.map[sp.string, sp.bytes])
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+            assert not self.data.storage.hot.supply.contains(token_id), "BACKED_TOKEN_TokenAlreadyExists"
+
+            self.data.storage.hot.supply[token_id] = 0
+            self.data.storage.hot.roles[token_id] = sp.record(minter=minter, burner=burner)
+            self.data.storage.cold.token_metadata[token_id] = sp.record(token_id=token_id, token_info=token_info)
+
+            sp.emit(sp.record(token_id=token_id), tag="TokenAdded")
+
+        @sp.entrypoint
+        def updateTokenMetadata(self, token_id, token_info):
+            '''
+            Replaces the token-specific metadata of an asset. Callable only by the owner
+
+            Params:
+            token_id (sp.nat) - id of the asset
+            token_info (sp.map) - new token-specific metadata of the asset
+            '''
+            sp.cast(token_id, sp.nat)
+            sp.cast(token_info, sp.map[sp.string, sp.bytes])
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+            assert self.data.storage.hot.supply.contains(token_id), "FA2_TOKEN_UNDEFINED"
+
+            self.data.storage.cold.token_metadata[token_id] = sp.record(token_id=token_id, token_info=token_info)
+
+        @sp.entrypoint
+        def updateMetadata(self, key, value):
+            '''
+            An entrypoint to allow the contract metadata to be updated
+
+            Params:
+            key (sp.string) - metadata's key for entry that will be changed
+            value (sp.bytes) - updated metadata data
+            '''
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+            self.data.metadata[key] = value
+
+        @sp.entrypoint
+        def updateImplementation(self, implementation):
+            '''
+            Update the implementation. Callable only by the owner
+
+            Params:
+            implementation (sp.big_map) - New implementation of the actions in form of lambdas that take storage and return updated one
+            '''
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+
+            self.data.implementation = implementation
+
+        @sp.entrypoint
+        def setAction(self, name, entry):
+            '''
+            Adds or replaces a single action in the implementation. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in implementation registry
+            entry (sp.record) - implementation of the action in form of lambda that takes storage and returns updated one,
+                together with the `only_admin` flag
+            '''
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+
+            self.data.implementation[name] = entry
+
+        @sp.entrypoint
+        def removeAction(self, name):
+            '''
+            Removes a single action from the implementation. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in implementation registry
+            '''
+            sp.cast(name, sp.string)
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+
+            del self.data.implementation[name]
+
+        @sp.entrypoint
+        def updateActions(self, updates):
+            '''
+            Adds, replaces or removes several actions in the implementation. Callable by the owner or the upgrader
+
+            Params:
+            updates (sp.list) - list of updates
+                name (sp.string) - action's name in implementation registry
+                entry (sp.option) - new implementation of the action, or None to remove it
+            '''
+            sp.cast(updates, BackedMultiTokenStorageModule.ActionUpdates)
+            assert self.isOwner(sp.sender) or sp.sender == self.data.upgrader, "BACKED_TOKEN_NotUpgrader"
+
+            for update in updates:
+                if update.entry.is_some():
+                    self.data.implementation[update.name] = update.entry.unwrap_some()
+                else:
+                    del self.data.implementation[update.name]
+
+        @sp.entrypoint
+        def setUpgrader(self, param):
+            '''
+            Sets the account allowed to update actions in the implementation. Callable only by the owner
+
+            Params:
+            param (sp.address) - new upgrader
+            '''
+            sp.cast(param, sp.address)
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+
+            self.data.upgrader = param
@@ -3,6 +3,8 @@ import smartpy as sp
 from contracts.storage.backed_oracle import BackedOracleStorageModule
 
 from contracts.utils.ownable import OwnableModule
+from contracts.utils.round_buffer import RoundBufferModule
+from contracts.implementation_registry import ImplementationRegistryModule
 
 @sp.module
 def BackedOracleModule():
@@ -13,7 +15,11 @@ def BackedOracleModule():
         The contract contains one role:
         - An owner, which can deploy new tokens
         '''
-        def __init__(self, owner, metadata, implementation, updater, decimals, description):
+        def __init__(self, owner, metadata, implementation, updater, decimals, description, retention):
+            '''
+            Params:
+            retention (sp.nat) - number of rounds kept by the oracle, older rounds are overwritten. 0 keeps all rounds
+            '''
             OwnableModule.Ownable.__init__(self, owner)
 
             self.data.metadata = metadata
@@ -21,23 +27,27 @@ def BackedOracleModule():
             self.data.storage.updater = updater
             self.data.storage.decimals = decimals
             self.data.storage.description = description
+            self.data.storage.retention = retention
 
             sp.cast(self.data.storage, BackedOracleStorageModule.BackedOracle)
 
             self.data.storage.latestRoundNumber = 0
+            self.data.storage.latest = sp.record(answer=0, timestamp=sp.timestamp(0), cumulativePrice=0)
             self.data.storage.roundData = sp.big_map()
 
             sp.cast(implementation, sp.big_map[
                 sp.string,
                 sp.record(
-                    action=sp.lambda_[
+                    action=sp.lambda_(
                         sp.record(storage=BackedOracleStorageModule.BackedOracle, data=sp.bytes),
-                        BackedOracleStorageModule.BackedOracle
-                    ],
+                        BackedOracleStorageModule.BackedOracle,
+                        with_operations=True
+                    ),
                     only_admin=sp.bool
             )])
 
             self.data.implementation = implementation
+            self.data.registry = sp.cast(None, sp.option[ImplementationRegistryModule.RegistryPin])
 
         @sp.onchain_view()
         def decimals(self):
@@ -51,13 +61,13 @@ def BackedOracleModule():
         def latestAnswer(self):
             assert self.data.storage.latestRoundNumber != 0, "No data present"
 
-            return self.data.storage.roundData[self.data.storage.latestRoundNumber].answer
+            return self.data.storage.latest.answer
 
         @sp.onchain_view()
         def latestTimestamp(self):
             assert self.data.storage.latestRoundNumber != 0, "No data present"
 
-            return self.data.storage.roundData[self.data.storage.latestRoundNumber].timestamp
+            return self.data.storage.latest.timestamp
 
         @sp.onchain_view()
         def latestRound(self):
@@ -71,40 +81,90 @@ def BackedOracleModule():
 
             return sp.record(
                 roundId=self.data.storage.latestRoundNumber,
-                answer=self.data.storage.roundData[self.data.storage.latestRoundNumber].answer,
-                startedAt=self.data.storage.roundData[self.data.storage.latestRoundNumber].timestamp,
-                updatedAt=self.data.storage.roundData[self.data.storage.latestRoundNumber].timestamp,
+                answer=self.data.storage.latest.answer,
+                startedAt=self.data.storage.latest.timestamp,
+                updatedAt=self.data.storage.latest.timestamp,
                 answeredInRound=self.data.storage.latestRoundNumber
             )
 
         @sp.onchain_view()
-        def getAnswer(self, roundId):
-            assert roundId <= self.data.storage.latestRoundNumber, "No data present"
+        def retention(self):
+            return self.data.storage.retention
 
-            return self.data.storage.roundData[roundId].answer
+        @sp.onchain_view()
+        def getAnswer(self, roundId):
+            # Fails with "Round pruned" for rounds evicted from the buffer
+            return RoundBufferModule.readRound(sp.record(storage=self.data.storage, roundId=roundId)).answer
 
         @sp.onchain_view()
         def getRoundData(self, roundId):
-            assert  roundId <= self.data.storage.latestRoundNumber, "No data present"
+            roundData = RoundBufferModule.readRound(sp.record(storage=self.data.storage, roundId=roundId))
 
             return sp.record(
                 roundId=roundId,
-                answer=self.data.storage.roundData[roundId].answer,
-                startedAt=self.data.storage.roundData[roundId].timestamp,
-                updatedAt=self.data.storage.roundData[roundId].timestamp,
+                answer=roundData.answer,
+                startedAt=roundData.timestamp,
+                updatedAt=roundData.timestamp,
                 answeredInRound=roundId
             )
 
+        @sp.onchain_view()
+        def twap(self, params):
+            '''
+            Returns the time-weighted average answer between the timestamps of `fromRound` and `toRound`,
+            each answer being weighted by the time until the next round. Rounded down.
+            '''
+            sp.cast(params, BackedOracleStorageModule.TwapParams)
+            assert params.fromRound < params.toRound, "Invalid round range"
+
+            fromRoundData = RoundBufferModule.readRound(sp.record(storage=self.data.storage, roundId=params.fromRound))
+            toRoundData = RoundBufferModule.readRound(sp.record(storage=self.data.storage, roundId=params.toRound))
+
+            return (toRoundData.cumulativePrice - fromRoundData.cumulativePrice) / (toRoundData.timestamp - fromRoundData.timestamp)
+
+        @sp.onchain_view()
+        def getRoundRange(self, params):
+            # At most MAX_ROUND_RANGE rounds, `nextRound` tells where to continue
+            return RoundBufferModule.readRoundRange(sp.record(storage=self.data.storage, params=params))
+
         @sp.entrypoint
         def execute(self, params):
-            sp.cast(params, sp.record(actionName=sp.string, data=sp.bytes))
+            '''
+            Executes action registered in implementation registry.
 
-            actionEntry = self.data.implementation.get(params.actionName, error="BACKED_ORACLE_UnknownAction")
+            Params:
+            actionName (sp.string) - action's name registered in implementation registry
+            data (sp.bytes) - packed action data in proper format
 
-            if actionEntry.only_admin:
+            Emits:
+            The events emitted by the action
+            '''
+            sp.cast(params, sp.record(actionName=sp.string, data=sp.bytes))
+
+            actionEntry = self.data.implementation.get_opt(params.actionName)
+
+            if actionEntry.is_none() and self.data.registry.is_some():
+                registry = self.data.registry.unwrap_some()
+                actionEntry = sp.view(
+                    "getAction",
+                    registry.address,
+                    sp.record(version=registry.version, name=params.actionName),
+                    sp.option[sp.record(
+                        action=sp.lambda_(
+                            sp.record(storage=BackedOracleStorageModule.BackedOracle, data=sp.bytes),
+                            BackedOracleStorageModule.BackedOracle,
+                            with_operations=True
+                        ),
+                        only_admin=sp.bool
+                    )]
+                ).unwrap_some(error="BACKED_ORACLE_InvalidRegistry")
+
+            action = actionEntry.unwrap_some(error="BACKED_ORACLE_UnknownAction")
+
+            if action.only_admin:
                 assert self.isOwner(sp.sender), "BACKED_ORACLE_NotAdmin"
 
-            updated_storage = self.data.implementation[params.actionName].action(sp.record(storage=self.data.storage, data=params.data))
+            updated_storage = action.action(sp.record(storage=self.data.storage, data=params.data))
 
             self.data.storage = updated_storage
 
@@ -132,4 +192,43 @@ def BackedOracleModule():
 
             self.data.implementation = implementation
 
-            
+        @sp.entrypoint
+        def setAction(self, name, entry):
+            '''
+            Adds or replaces a single action in the implementation. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in implementation registry
+            entry (sp.record) - implementation of the action in form of lambda that takes storage and returns updated one,
+                together with the `only_admin` flag
+            '''
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_NotOwner"
+
+            self.data.implementation[name] = entry
+
+        @sp.entrypoint
+        def removeAction(self, name):
+            '''
+            Removes a single action from the implementation. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in implementation registry
+            '''
+            sp.cast(name, sp.string)
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_NotOwner"
+
+            del self.data.implementation[name]
+
+        @sp.entrypoint
+        def setRegistry(self, param):
+            '''
+            Pins a version of a shared implementation registry, used for the actions that are not registered
+            in the contract's own implementation, or unpins it with None. Callable only by the owner
+
+            Params:
+            param (sp.option) - address and version of the implementation registry
+            '''
+            sp.cast(param, sp.option[ImplementationRegistryModule.RegistryPin])
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_NotOwner"
+
+            self.data.registry = param
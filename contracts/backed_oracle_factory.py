@@ -4,6 +4,7 @@ from contracts.backed_oracle import BackedOracleModule
 from contracts.backed_oracle_forwarder import BackedOracleForwarderModule
 
 from contracts.utils.ownable import OwnableModule
+from contracts.implementation_registry import ImplementationRegistryModule
 
 @sp.module
 def BackedOracleFactoryModule():
@@ -24,9 +25,10 @@ def BackedOracleFactoryModule():
             OwnableModule.Ownable.__init__(self, owner)
             self.data.metadata=metadata
             self.data.implementation = implementation
+            self.data.registry = sp.cast(None, sp.option[ImplementationRegistryModule.RegistryPin])
         
         @sp.entrypoint
-        def deployOracle(self, owner, updater, decimals, description, metadata):
+        def deployOracle(self, owner, updater, decimals, description, metadata, retention):
             '''
             Deploy and configures new instance of BackedFi Token. Callable only by the factory owner
 
@@ -35,6 +37,7 @@ def BackedOracleFactoryModule():
             updater (sp.address) - the address of the account to which the updater role will be assigned
             decimals (sp.string) - the number of decimals that the oracle's token has
             description (sp.string) - the description of the oracle
+            retention (sp.nat) - the number of rounds kept by the oracle, older rounds are overwritten. 0 keeps all rounds
 
             Emits:
             NewOracle event
@@ -42,10 +45,16 @@ def BackedOracleFactoryModule():
             '''
             sp.cast(decimals, sp.string)
             sp.cast(description, sp.string)
+            sp.cast(retention, sp.nat)
             assert self.isOwner(sp.sender), "BACKED_TOKEN_Factory_NotOwner"
 
             metadata_storage = sp.big_map({"" : metadata})
 
+            # Actions are resolved through the registry, so they are not copied into the new contract
+            implementation = self.data.implementation
+            if self.data.registry.is_some():
+                implementation = sp.big_map()
+
             newOracle = sp.create_contract(
                 BackedOracleModule.BackedOracle,
                 None,
@@ -54,13 +63,16 @@ def BackedOracleFactoryModule():
                     owner=owner,
                     storage=sp.record(
                         latestRoundNumber=0,
+                        latest=sp.record(answer=0, timestamp=sp.timestamp(0), cumulativePrice=0),
+                        retention=retention,
                         roundData=sp.big_map(),
                         updater=updater,
                         decimals=decimals,
                         description=description,
                     ),
                     metadata=metadata_storage,
-                    implementation=self.data.implementation
+                    implementation=implementation,
+                    registry=self.data.registry
                 )
             )
             sp.emit(sp.record(address=newOracle), tag="NewOracle")
@@ -101,4 +113,45 @@ def BackedOracleFactoryModule():
 
             self.data.implementation = implementation
 
+        @sp.entrypoint
+        def setAction(self, name, entry):
+            '''
+            Adds or replaces a single action in the implementation for future deployments. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in implementation registry
+            entry (sp.record) - implementation of the action in form of lambda that takes storage and returns updated one,
+                together with the `only_admin` flag
+            '''
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_FACTORY_NotOwner"
+
+            self.data.implementation[name] = entry
+
+        @sp.entrypoint
+        def removeAction(self, name):
+            '''
+            Removes a single action from the implementation for future deployments. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in implementation registry
+            '''
+            sp.cast(name, sp.string)
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_FACTORY_NotOwner"
+
+            del self.data.implementation[name]
+
+        @sp.entrypoint
+        def setRegistry(self, param):
+            '''
+            Sets the implementation registry pinned in future deployments, or unsets it with None.
+            While a registry is set, new contracts are deployed with an empty implementation. Callable only by the owner
+
+            Params:
+            param (sp.option) - address and version of the implementation registry
+            '''
+            sp.cast(param, sp.option[ImplementationRegistryModule.RegistryPin])
+            assert self.isOwner(sp.sender), "BACKED_ORACLE_FACTORY_NotOwner"
+
+            self.data.registry = param
+
             
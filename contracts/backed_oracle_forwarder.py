@@ -105,6 +105,37 @@ def BackedOracleForwarderModule():
                 )
             ).unwrap_some(error="Invalid view")
 
+        @sp.onchain_view()
+        def twap(self, params):
+            sp.cast(params, sp.record(fromRound=sp.nat, toRound=sp.nat).layout(("fromRound", "toRound")))
+
+            return sp.view(
+                "twap",
+                self.data.upstreamOracle,
+                params,
+                sp.int
+            ).unwrap_some(error="Invalid view")
+
+        @sp.onchain_view()
+        def getRoundRange(self, params):
+            sp.cast(params, sp.record(fromRound=sp.nat, count=sp.nat).layout(("fromRound", "count")))
+
+            return sp.view(
+                "getRoundRange",
+                self.data.upstreamOracle,
+                params,
+                sp.record(
+                    rounds=sp.list[sp.record(
+                        roundId=sp.nat,
+                        answer=sp.int,
+                        startedAt=sp.timestamp,
+                        updatedAt=sp.timestamp,
+                        answeredInRound=sp.nat
+                    )],
+                    nextRound=sp.option[sp.nat]
+                ).layout(("rounds", "nextRound"))
+            ).unwrap_some(error="Invalid view")
+
         @sp.entrypoint
         def setUpstreamOracle(self, param):
             assert self.isOwner(sp.sender), "BACKED_ORACLE_FORWARDER_NotOwner"
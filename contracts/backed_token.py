@@ -5,27 +5,74 @@ import smartpy as sp
 from contracts.utils.ownable import OwnableModule
 from contracts.utils.pausable import PausableModule
 from contracts.utils.nonce import NonceModule
+from contracts.utils.shares import SharesModule
+from contracts.implementation_registry import ImplementationRegistryModule
 from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.actions.token.transfer import TransferModule
+from contracts.actions.token.approve import ApproveModule
+from contracts.actions.token.increase_allowance import IncreaseAllowanceModule
+from contracts.actions.token.decrease_allowance import DecreaseAllowanceModule
+from contracts.actions.token.relay_bundle import RelayBundleModule
 
 @sp.module
 def BackedTokenModule():
     BACKED_TERMS = "https://www.backedassets.fi/legal-documentation"
 
+    def readBalances(storage, params):
+        '''
+        Reads the balances and allowances requested by the `balances_of` views, keeping the order of the request.
+
+        Params:
+        storage (BackedToken hot storage) - current hot section of the BackedToken storage
+        params (BalancesOfParams) - owners and (owner, spender) pairs to read
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.cast(params, BackedTokenStorageModule.BalancesOfParams)
+
+        balances = []
+        for owner in params.owners:
+            balances.push(sp.record(owner=owner, balance=SharesModule.toBalance(sp.record(shares=storage.balances.get(owner, default=0), multiplier=storage.multiplier))))
+
+        allowances = []
+        for key in params.allowances:
+            allowances.push(sp.record(
+                owner=key.owner,
+                spender=key.spender,
+                value=storage.allowances.get(sp.record(owner=key.owner, spender=key.spender), default=0)
+            ))
+
+        return sp.cast(
+            sp.record(balances=reversed(balances), allowances=reversed(allowances)),
+            BackedTokenStorageModule.BalancesOfResult
+        )
+
     class CommonInterface(OwnableModule.OwnableInterface, PausableModule.PausableInterface, NonceModule.NonceInterface):
         def __init__(self, minter, burner):
             OwnableModule.OwnableInterface.__init__(self)
             PausableModule.PausableInterface.__init__(self)
             NonceModule.NonceInterface.__init__(self)
             self.data.metadata = sp.big_map()
+            self.data.storage = sp.record(
+                hot=sp.record(
+                    balances=sp.big_map(),
+                    allowances=sp.big_map(),
+                    total_supply=0,
+                    multiplier=1000000000000000000,  # 1.0, see SharesModule.MULTIPLIER_BASE
+                    roles=sp.record(minter=minter, burner=burner)
+                ),
+                cold=sp.record(
+                    token_metadata=sp.big_map(),
+                    terms=BACKED_TERMS,
+                    nonce=sp.big_map(),
+                    nonceBitmap=sp.big_map(),
+                    delegateMode=False,
+                    delegateWhitelist=sp.big_map(),
+                    importedChunks=0,
+                    importChecksums=sp.big_map(),
+                    importFinalized=False
+                )
+            )
             sp.cast(self.data.storage, BackedTokenStorageModule.BackedToken)
-            self.data.storage.terms = BACKED_TERMS
-            self.data.storage.balances = sp.big_map()
-            self.data.storage.total_supply = 0
-            self.data.storage.token_metadata = sp.big_map()
-            self.data.storage.roles = sp.record(minter=minter, burner=burner)
-            self.data.storage.delegateWhitelist= sp.big_map()
-            self.data.storage.nonce = sp.big_map()
-            self.data.storage.delegateMode=False
            
     class Fa1_2(CommonInterface):
         def __init__(self, metadata, ledger, token_metadata, implementation, minter, burner):
@@ -43,34 +90,95 @@ def BackedTokenModule():
             contract_metadata spec: https://gitlab.com/tzip/tzip/-/blob/master/proposals/tzip-16/tzip-16.md
             """
             CommonInterface.__init__(self, minter, burner)
-            sp.cast(implementation, 
-                    sp.big_map[
-                        sp.string,
-                        sp.record(
-                            action=sp.lambda_[
-                                sp.record(storage=BackedTokenStorageModule.BackedToken, data=sp.bytes),
-                                BackedTokenStorageModule.BackedToken
-                            ],
-                            only_admin=sp.bool
-            )])
+            sp.cast(implementation, sp.big_map[sp.string, BackedTokenStorageModule.BackedTokenAction])
 
             self.data.implementation = implementation
+            self.data.registry = sp.cast(None, sp.option[ImplementationRegistryModule.RegistryPin])
+            self.data.typedActions = sp.cast(
+                sp.record(transfer=None, approve=None, increaseAllowance=None, decreaseAllowance=None),
+                BackedTokenStorageModule.TypedActions
+            )
+            self.data.nativeActions = False
             self.data.metadata = metadata
-            self.data.storage.token_metadata = sp.big_map(
+            self.data.storage.cold.token_metadata = sp.big_map(
                 {0: sp.record(token_id=0, token_info=token_metadata)}
             )
 
+            # The initial multiplier is 1.0, so the initial balances are stored as they are
             for owner in ledger.items():
-                self.data.storage.balances[owner.key] = owner.value
-                self.data.storage.total_supply += owner.value.balance
+                self.data.storage.hot.balances[owner.key] = owner.value
+                self.data.storage.hot.total_supply += owner.value
+
+        @sp.private(with_storage='read-only')
+        def resolveAction(self, actionName):
+            '''
+            Returns the action registered under `actionName`. Actions registered in the contract's own
+            implementation take precedence over the ones of the pinned implementation registry.
+
+            Params:
+            actionName (sp.string) - name of the action
+            '''
+            sp.cast(actionName, sp.string)
+            actionEntry = self.data.implementation.get_opt(actionName)
+
+            if actionEntry.is_none() and self.data.registry.is_some():
+                registry = self.data.registry.unwrap_some()
+                actionEntry = sp.view(
+                    "getAction",
+                    registry.address,
+                    sp.record(version=registry.version, name=actionName),
+                    sp.option[BackedTokenStorageModule.BackedTokenAction]
+                ).unwrap_some(error="BACKED_TOKEN_InvalidRegistry")
+
+            return actionEntry.unwrap_some(error="BACKED_TOKEN_UnknownAction")
+
+        @sp.private(with_storage='read-write', with_operations=True)
+        def applyAction(self, params):
+            '''
+            Runs an action lambda on the storage section it was registered with,
+            so hot actions do not carry the cold fields through the lambda and back.
+
+            Params:
+            action (sp.variant) - lambda of the action, tagged with its storage section
+            data (sp.bytes) - packed action data in proper format
+            '''
+            if params.action.is_variant.hot():
+                self.data.storage.hot = params.action.unwrap.hot()(sp.record(storage=self.data.storage.hot, data=params.data))
+            else:
+                if params.action.is_variant.cold():
+                    self.data.storage.cold = params.action.unwrap.cold()(sp.record(storage=self.data.storage.cold, data=params.data))
+                else:
+                    self.data.storage = params.action.unwrap.full()(sp.record(storage=self.data.storage, data=params.data))
 
         @sp.private(with_storage='read-write')
-        def invoke(self, params):
-            sp.cast(params, sp.record(actionName=sp.string, data=sp.bytes))
+        def clearTypedAction(self, actionName):
+            '''
+            Clears the typed lambda of an action whose implementation is set or removed, so the entrypoint
+            of the action runs the new implementation. The typed lambda can be set again with `setTypedActions`.
 
-            updated_storage = self.data.implementation[params.actionName].action(sp.record(storage=self.data.storage, data=params.data))
+            Params:
+            actionName (sp.string) - name of the action
+            '''
+            sp.cast(actionName, sp.string)
+            if actionName == "transfer":
+                self.data.typedActions.transfer = None
+            if actionName == "approve":
+                self.data.typedActions.approve = None
+            if actionName == "increaseAllowance":
+                self.data.typedActions.increaseAllowance = None
+            if actionName == "decreaseAllowance":
+                self.data.typedActions.decreaseAllowance = None
+
+        @sp.private(with_storage='read-only')
+        def isNative(self, actionName):
+            '''
+            Returns true if the compiled-in implementation of the action should be used.
+            A lambda registered under the same name in the contract's own implementation always takes precedence.
 
-            self.data.storage = updated_storage
+            Params:
+            actionName (sp.string) - name of the action
+            '''
+            return self.data.nativeActions and not self.data.implementation.contains(actionName)
 
         @sp.entrypoint
         def execute(self, actionName, data):
@@ -80,20 +188,26 @@ def BackedTokenModule():
             Params:
             actionName (sp.string) - action's name registered in implementation registry
             data (sp.bytes) - packed action data in proper format
+
+            Emits:
+            The events emitted by the action
             '''
             assert not self.isPaused(), "BACKED_TOKEN_Paused"
 
-            actionEntry = self.data.implementation.get(actionName, error="BACKED_TOKEN_UnknownAction")
+            actionEntry = self.resolveAction(actionName)
 
             if actionEntry.only_admin:
                 assert self.isOwner(sp.sender), "BACKED_TOKEN_NotAdmin"
 
-            self.invoke(sp.record(actionName=actionName, data=data))
+            self.applyAction(sp.record(action=actionEntry.action, data=data))
   
         @sp.entrypoint
         def transfer(self, param):
             '''
             Moves a `value` amount of tokens from the 'from' account to `to`.
+
+            Emits:
+            Transfer event
             '''
             assert not self.isPaused(), "BACKED_TOKEN_Paused"
 
@@ -103,14 +217,71 @@ def BackedTokenModule():
                     ("from_ as from", ("to_ as to", "value"))
                 ),
             )
+            if self.data.typedActions.transfer.is_some():
+                self.data.storage.hot = self.data.typedActions.transfer.unwrap_some()(sp.record(storage=self.data.storage.hot, params=param))
+            else:
+                if self.isNative('transfer'):
+                    self.data.storage.hot = TransferModule.applyTransfer(sp.record(storage=self.data.storage.hot, params=param))
+                else:
+                    data = sp.pack(param)
+
+                    self.applyAction(sp.record(action=self.resolveAction('transfer').action, data=data))
+
+        @sp.entrypoint
+        def transferBatch(self, param):
+            '''
+            Moves tokens for every transfer in the list in a single action. Fails if any of the transfers fails.
+
+            Emits:
+            Transfer event for every transfer
+            '''
+            assert not self.isPaused(), "BACKED_TOKEN_Paused"
+
+            sp.cast(
+                param,
+                sp.list[
+                    sp.record(from_=sp.address, to_=sp.address, value=sp.nat).layout(
+                        ("from_ as from", ("to_ as to", "value"))
+                    )
+                ],
+            )
             data = sp.pack(param)
 
-            self.invoke(sp.record(actionName='transfer', data=data))
+            self.applyAction(sp.record(action=self.resolveAction('transferBatch').action, data=data))
 
         @sp.entrypoint
         def approve(self, param):
             '''
             Sets a `value` amount of tokens as the allowance of `spender` over the caller's tokens.
+            A `value` of 2^256 - 1 sets an unlimited allowance, which is never decremented by transfers.
+
+            Emits:
+            Approval event
+            '''
+            assert not self.isPaused(), "BACKED_TOKEN_Paused"
+
+            sp.cast(
+                param,
+                sp.record(spender=sp.address, value=sp.nat).layout(
+                    ("spender", "value")
+                ),
+            )
+            if self.data.typedActions.approve.is_some():
+                self.data.storage.hot = self.data.typedActions.approve.unwrap_some()(sp.record(storage=self.data.storage.hot, params=param))
+            else:
+                if self.isNative('approve'):
+                    self.data.storage.hot = ApproveModule.applyApprove(sp.record(storage=self.data.storage.hot, params=param))
+                else:
+                    data = sp.pack(param)
+                    self.applyAction(sp.record(action=self.resolveAction('approve').action, data=data))
+
+        @sp.entrypoint
+        def increaseAllowance(self, param):
+            '''
+            Increases by `value` amount of tokens the allowance of `spender` over the caller's tokens.
+
+            Emits:
+            Approval event
             '''
             assert not self.isPaused(), "BACKED_TOKEN_Paused"
 
@@ -120,8 +291,54 @@ def BackedTokenModule():
                     ("spender", "value")
                 ),
             )
+            if self.data.typedActions.increaseAllowance.is_some():
+                self.data.storage.hot = self.data.typedActions.increaseAllowance.unwrap_some()(sp.record(storage=self.data.storage.hot, params=param))
+            else:
+                if self.isNative('increaseAllowance'):
+                    self.data.storage.hot = IncreaseAllowanceModule.applyIncreaseAllowance(sp.record(storage=self.data.storage.hot, params=param))
+                else:
+                    data = sp.pack(param)
+                    self.applyAction(sp.record(action=self.resolveAction('increaseAllowance').action, data=data))
+
+        @sp.entrypoint
+        def decreaseAllowance(self, param):
+            '''
+            Decreases by `value` amount of tokens the allowance of `spender` over the caller's tokens.
+
+            Emits:
+            Approval event
+            '''
+            assert not self.isPaused(), "BACKED_TOKEN_Paused"
+
+            sp.cast(
+                param,
+                sp.record(spender=sp.address, value=sp.nat).layout(
+                    ("spender", "value")
+                ),
+            )
+            if self.data.typedActions.decreaseAllowance.is_some():
+                self.data.storage.hot = self.data.typedActions.decreaseAllowance.unwrap_some()(sp.record(storage=self.data.storage.hot, params=param))
+            else:
+                if self.isNative('decreaseAllowance'):
+                    self.data.storage.hot = DecreaseAllowanceModule.applyDecreaseAllowance(sp.record(storage=self.data.storage.hot, params=param))
+                else:
+                    data = sp.pack(param)
+                    self.applyAction(sp.record(action=self.resolveAction('decreaseAllowance').action, data=data))
+
+        @sp.entrypoint
+        def relayBundle(self, param):
+            '''
+            Applies a bundle of signed permits and delegated transfers.
+
+            Emits:
+            RelayResult event for every item, Approval or Transfer event for every applied item
+            '''
+            assert not self.isPaused(), "BACKED_TOKEN_Paused"
+
+            sp.cast(param, RelayBundleModule.RelayBundleParams)
             data = sp.pack(param)
-            self.invoke(sp.record(actionName='approve', data=data))
+
+            self.applyAction(sp.record(action=self.resolveAction('relayBundle').action, data=data))
 
         @sp.entrypoint
         def getBalance(self, param):
@@ -129,9 +346,7 @@ def BackedTokenModule():
             Returns the value of tokens owned by `address`.
             '''
             (address, callback) = param
-            result = self.data.storage.balances.get(
-                address, default=sp.record(balance=0, approvals={})
-            ).balance
+            result = SharesModule.toBalance(sp.record(shares=self.data.storage.hot.balances.get(address, default=0), multiplier=self.data.storage.hot.multiplier))
             sp.transfer(result, sp.tez(0), callback)
 
         @sp.entrypoint
@@ -141,9 +356,9 @@ def BackedTokenModule():
             allowed to spend on behalf of `owner`. This is zero by default.
             '''
             (args, callback) = param
-            result = self.data.storage.balances.get(
-                args.owner, default=sp.record(balance=0, approvals={})
-            ).approvals.get(args.spender, default=0)
+            result = self.data.storage.hot.allowances.get(
+                sp.record(owner=args.owner, spender=args.spender), default=0
+            )
             sp.transfer(result, sp.tez(0), callback)
 
         @sp.entrypoint
@@ -152,7 +367,127 @@ def BackedTokenModule():
             Returns the value of tokens in existence.
             '''
             sp.cast(param, sp.pair[sp.unit, sp.contract[sp.nat]])
-            sp.transfer(self.data.storage.total_supply, sp.tez(0), sp.snd(param))
+            sp.transfer(SharesModule.toBalance(sp.record(shares=self.data.storage.hot.total_supply, multiplier=self.data.storage.hot.multiplier)), sp.tez(0), sp.snd(param))
+
+        @sp.onchain_view()
+        def balance_of(self, owner):
+            '''
+            Returns the value of tokens owned by `owner`.
+            '''
+            sp.cast(owner, sp.address)
+            return SharesModule.toBalance(sp.record(shares=self.data.storage.hot.balances.get(owner, default=0), multiplier=self.data.storage.hot.multiplier))
+
+        @sp.onchain_view()
+        def allowance(self, params):
+            '''
+            Returns the remaining number of tokens that `spender` will be
+            allowed to spend on behalf of `owner`. This is zero by default.
+            '''
+            sp.cast(params, sp.record(owner=sp.address, spender=sp.address))
+            return self.data.storage.hot.allowances.get(params, default=0)
+
+        @sp.onchain_view()
+        def total_supply(self):
+            '''
+            Returns the value of tokens in existence.
+            '''
+            return SharesModule.toBalance(sp.record(shares=self.data.storage.hot.total_supply, multiplier=self.data.storage.hot.multiplier))
+
+        @sp.onchain_view()
+        def get_nonce(self, owner):
+            '''
+            Returns the next ordered nonce of `owner`, to be signed in permits and delegated transfers.
+            '''
+            sp.cast(owner, sp.address)
+            return self.data.storage.cold.nonce.get(owner, default=0)
+
+        @sp.onchain_view()
+        def roles(self):
+            '''
+            Returns the minter and the burner of the token.
+            '''
+            return self.data.storage.hot.roles
+
+        @sp.onchain_view()
+        def multiplier(self):
+            '''
+            Returns the multiplier converting the stored shares into balances, with 18 decimals.
+            '''
+            return self.data.storage.hot.multiplier
+
+        @sp.onchain_view()
+        def imported_chunks(self):
+            '''
+            Returns the number of chunks of balances imported so far, the position of the next chunk to import.
+            '''
+            return self.data.storage.cold.importedChunks
+
+        @sp.onchain_view()
+        def balances_of(self, params):
+            '''
+            Returns the balances of all the `owners` and the values of all the requested `allowances`,
+            in the order of the request. Missing entries are returned as zero.
+            '''
+            sp.cast(params, BackedTokenStorageModule.BalancesOfParams)
+            return readBalances(sp.record(storage=self.data.storage.hot, params=params))
+
+        # Off-chain (TZIP-16) counterparts of the views above, listed in the contract metadata.
+        # They can not share the names of the on-chain views, so they are prefixed with `get_`.
+
+        @sp.offchain_view()
+        def get_balance(self, owner):
+            '''
+            Returns the value of tokens owned by `owner`.
+            '''
+            sp.cast(owner, sp.address)
+            return SharesModule.toBalance(sp.record(shares=self.data.storage.hot.balances.get(owner, default=0), multiplier=self.data.storage.hot.multiplier))
+
+        @sp.offchain_view()
+        def get_allowance(self, params):
+            '''
+            Returns the remaining number of tokens that `spender` will be
+            allowed to spend on behalf of `owner`. This is zero by default.
+            '''
+            sp.cast(params, sp.record(owner=sp.address, spender=sp.address))
+            return self.data.storage.hot.allowances.get(params, default=0)
+
+        @sp.offchain_view()
+        def get_total_supply(self):
+            '''
+            Returns the value of tokens in existence.
+            '''
+            return SharesModule.toBalance(sp.record(shares=self.data.storage.hot.total_supply, multiplier=self.data.storage.hot.multiplier))
+
+        @sp.offchain_view()
+        def get_current_nonce(self, owner):
+            '''
+            Returns the next ordered nonce of `owner`, to be signed in permits and delegated transfers.
+            '''
+            sp.cast(owner, sp.address)
+            return self.data.storage.cold.nonce.get(owner, default=0)
+
+        @sp.offchain_view()
+        def get_roles(self):
+            '''
+            Returns the minter and the burner of the token.
+            '''
+            return self.data.storage.hot.roles
+
+        @sp.offchain_view()
+        def get_multiplier(self):
+            '''
+            Returns the multiplier converting the stored shares into balances, with 18 decimals.
+            '''
+            return self.data.storage.hot.multiplier
+
+        @sp.offchain_view()
+        def get_balances_of(self, params):
+            '''
+            Returns the balances of all the `owners` and the values of all the requested `allowances`,
+            in the order of the request. Missing entries are returned as zero.
+            '''
+            sp.cast(params, BackedTokenStorageModule.BalancesOfParams)
+            return readBalances(sp.record(storage=self.data.storage.hot, params=params))
 
         @sp.offchain_view()
         def token_metadata(self, token_id):
@@ -160,7 +495,7 @@ def BackedTokenModule():
             Return the token-metadata URI for the given token. (token_id must be 0).
             '''
             sp.cast(token_id, sp.nat)
-            return self.data.storage.token_metadata[token_id]
+            return self.data.storage.cold.token_metadata[token_id]
 
     class BackedToken(OwnableModule.Ownable, PausableModule.Pausable, NonceModule.Nonce, Fa1_2):
         '''
@@ -170,6 +505,7 @@ def BackedTokenModule():
         - A burner, that can burn its own tokens, or contract's tokens.
         - A pauser, that can pause or restore all transfers in the contract.
         - An owner, that can set the three above.
+        - An upgrader, that can update actions in the implementation. Initially the owner, or the factory for deployed tokens.
         '''
         
         def __init__(self, owner, metadata, ledger, token_metadata, implementation, minter, burner, pauser):
@@ -177,7 +513,7 @@ def BackedTokenModule():
             Params:
             owner (sp.address) - the address of the account that will be set as owner of the contract
             metadata (sp.big_map) - contract-specific metadata
-            ledger (sp.big_map) - initial balances
+            ledger (sp.big_map) - initial balances, keyed by owner address
             token_metadata (sp.big_map) - token-specific metadata
             implementation (sp.big_map) - implementation of the actions in form of lambdas that take storage and return updated one,
             minter (sp.address) - the address of the account that will be set as minter of the contract
@@ -188,6 +524,7 @@ def BackedTokenModule():
             PausableModule.Pausable.__init__(self, pauser)
             NonceModule.Nonce.__init__(self)
             Fa1_2.__init__(self, metadata, ledger, token_metadata, implementation, minter, burner)
+            self.data.upgrader = owner
        
         @sp.entrypoint
         def updateMetadata(self, key, value):
@@ -205,7 +542,7 @@ def BackedTokenModule():
         @sp.entrypoint
         def updateImplementation(self, implementation):
             '''
-            Update the implementation. Callable only by the owner
+            Update the implementation, and clear the typed lambdas of the hot actions. Callable only by the owner
 
             Params:
             implementation (sp.big_map) - New implementation of the actions in form of lambdas that take storage and return updated one
@@ -213,5 +550,124 @@ def BackedTokenModule():
             assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
 
             self.data.implementation = implementation
+            self.data.typedActions = sp.record(transfer=None, approve=None, increaseAllowance=None, decreaseAllowance=None)
+
+        @sp.entrypoint
+        def setAction(self, name, entry):
+            '''
+            Adds or replaces a single action in the implementation, and clears its typed lambda. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in implementation registry
+            entry (sp.record) - implementation of the action in form of lambda that takes storage and returns updated one,
+                together with the `only_admin` flag
+            '''
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+
+            self.data.implementation[name] = entry
+            self.clearTypedAction(name)
+
+        @sp.entrypoint
+        def removeAction(self, name):
+            '''
+            Removes a single action from the implementation, and clears its typed lambda. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in implementation registry
+            '''
+            sp.cast(name, sp.string)
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+
+            del self.data.implementation[name]
+            self.clearTypedAction(name)
+
+        @sp.entrypoint
+        def updateActions(self, updates):
+            '''
+            Adds, replaces or removes several actions in the implementation, and clears their typed lambdas.
+            Callable by the owner or the upgrader
+
+            Params:
+            updates (sp.list) - list of updates
+                name (sp.string) - action's name in implementation registry
+                entry (sp.option) - new implementation of the action, or None to remove it
+            '''
+            sp.cast(updates, BackedTokenStorageModule.ActionUpdates)
+            assert self.isOwner(sp.sender) or sp.sender == self.data.upgrader, "BACKED_TOKEN_NotUpgrader"
+
+            for update in updates:
+                if update.entry.is_some():
+                    self.data.implementation[update.name] = update.entry.unwrap_some()
+                else:
+                    del self.data.implementation[update.name]
+                self.clearTypedAction(update.name)
+
+        @sp.entrypoint
+        def setUpgrader(self, param):
+            '''
+            Sets the account, or factory contract, allowed to update actions in the implementation. Callable only by the owner
+
+            Params:
+            param (sp.address) - new upgrader
+            '''
+            sp.cast(param, sp.address)
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+
+            self.data.upgrader = param
+
+        @sp.onchain_view()
+        def upgrader(self):
+            '''
+            Returns the account, or factory contract, allowed to update actions in the implementation.
+            '''
+            return self.data.upgrader
+
+        @sp.entrypoint
+        def setRegistry(self, param):
+            '''
+            Pins a version of a shared implementation registry, used for the actions that are not registered
+            in the contract's own implementation, or unpins it with None. The typed lambdas of the hot actions
+            are cleared. Callable only by the owner
+
+            Params:
+            param (sp.option) - address and version of the implementation registry
+            '''
+            sp.cast(param, sp.option[ImplementationRegistryModule.RegistryPin])
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+
+            self.data.registry = param
+            self.data.typedActions = sp.record(transfer=None, approve=None, increaseAllowance=None, decreaseAllowance=None)
+
+        @sp.entrypoint
+        def setTypedActions(self, param):
+            '''
+            Sets the typed lambdas of the hot actions, which take their parameters unpacked and are used by
+            the `transfer`, `approve`, `increaseAllowance` and `decreaseAllowance` entrypoints before any
+            other implementation. None falls back to the native or the packed implementation. A typed lambda is
+            cleared whenever its action is set or removed in the implementation, so an upgrade always takes effect.
+            Callable by the owner or the upgrader
+
+            Params:
+            param (sp.record) - optional typed lambda of each hot action
+            '''
+            sp.cast(param, BackedTokenStorageModule.TypedActions)
+            assert self.isOwner(sp.sender) or sp.sender == self.data.upgrader, "BACKED_TOKEN_NotUpgrader"
+
+            self.data.typedActions = param
+
+        @sp.entrypoint
+        def setNativeActions(self, param):
+            '''
+            Enables or disables the compiled-in implementation of `transfer`, `approve`,
+            `increaseAllowance` and `decreaseAllowance`. While enabled, an action is still
+            executed through its lambda if one is registered under its name. Callable only by the owner
+
+            Params:
+            param (sp.bool) - the new native actions mode
+            '''
+            sp.cast(param, sp.bool)
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_NotOwner"
+
+            self.data.nativeActions = param
 
   
@@ -1,9 +1,11 @@
 import smartpy as sp
 
 from contracts.backed_token import BackedTokenModule
+from contracts.storage.backed_token import BackedTokenStorageModule
 
 from contracts.utils.ownable import OwnableModule
 from contracts.utils.pausable import PausableModule
+from contracts.implementation_registry import ImplementationRegistryModule
 
 @sp.module
 def BackedTokenFactoryModule():
@@ -13,7 +15,7 @@ def BackedTokenFactoryModule():
         Factory contract, used for creating new, upgradable tokens.
 
         The contract contains one role:
-        - An owner, which can deploy new tokens
+        - An owner, which can deploy new tokens and upgrade the deployed ones
         '''
         def __init__(self, implementation, metadata, owner):
             '''
@@ -24,7 +26,15 @@ def BackedTokenFactoryModule():
             '''
             OwnableModule.Ownable.__init__(self, owner)
             self.data.implementation = implementation
+            self.data.registry = sp.cast(None, sp.option[ImplementationRegistryModule.RegistryPin])
+            self.data.typedActions = sp.cast(
+                sp.record(transfer=None, approve=None, increaseAllowance=None, decreaseAllowance=None),
+                BackedTokenStorageModule.TypedActions
+            )
+            self.data.nativeActions = False
             self.data.metadata = metadata
+            self.data.tokens = sp.cast(sp.big_map(), sp.big_map[sp.nat, sp.address])
+            self.data.tokenCount = 0
         
         @sp.entrypoint
         def deployToken(self, tokenOwner, minter, burner, pauser, metadata, name, symbol, icon, decimals):
@@ -57,12 +67,25 @@ def BackedTokenFactoryModule():
 
             balances = sp.cast(
                 sp.big_map(),
-                sp.big_map[
-                    sp.address,
-                    sp.record(approvals=sp.map[sp.address, sp.nat], balance=sp.nat),
-                ],
+                sp.big_map[sp.address, sp.nat],
+            )
+            allowances = sp.cast(
+                sp.big_map(),
+                sp.big_map[sp.record(owner=sp.address, spender=sp.address), sp.nat],
             )
             
+            # Actions are resolved through the registry, so they are not copied into the new contract
+            implementation = self.data.implementation
+            if self.data.registry.is_some():
+                implementation = sp.big_map()
+
+            # A lambda registered under the name of a native action takes precedence over it, so they are not copied
+            if self.data.nativeActions:
+                del implementation["transfer"]
+                del implementation["approve"]
+                del implementation["increaseAllowance"]
+                del implementation["decreaseAllowance"]
+
             newToken = sp.create_contract(
                 BackedTokenModule.BackedToken,
                 None,
@@ -73,18 +96,34 @@ def BackedTokenFactoryModule():
                     paused=False,
                     metadata=metadata_storage,
                     storage=sp.record(
-                        balances=balances,
-                        total_supply=0,
-                        token_metadata=token_metadata_storage,
-                        terms=BACKED_TERMS,
-                        roles=sp.record(minter=minter, burner=burner),
-                        nonce=sp.big_map(),
-                        delegateMode=False,
-                        delegateWhitelist=sp.big_map()
+                        hot=sp.record(
+                            balances=balances,
+                            allowances=allowances,
+                            total_supply=0,
+                            multiplier=1000000000000000000,  # 1.0, see SharesModule.MULTIPLIER_BASE
+                            roles=sp.record(minter=minter, burner=burner)
+                        ),
+                        cold=sp.record(
+                            token_metadata=token_metadata_storage,
+                            terms=BACKED_TERMS,
+                            nonce=sp.big_map(),
+                            nonceBitmap=sp.big_map(),
+                            delegateMode=False,
+                            delegateWhitelist=sp.big_map(),
+                            importedChunks=0,
+                            importChecksums=sp.big_map(),
+                            importFinalized=False
+                        )
                     ),
-                    implementation=self.data.implementation
+                    implementation=implementation,
+                    registry=self.data.registry,
+                    typedActions=self.data.typedActions,
+                    nativeActions=self.data.nativeActions,
+                    upgrader=sp.self_address
                 )
             )
+            self.data.tokens[self.data.tokenCount] = newToken
+            self.data.tokenCount += 1
             sp.emit(sp.record(address=newToken, name=name, symbol=symbol), tag="NewToken")
 
         @sp.entrypoint
@@ -112,4 +151,115 @@ def BackedTokenFactoryModule():
 
             self.data.implementation = implementation
 
-            
+        @sp.entrypoint
+        def setAction(self, name, entry):
+            '''
+            Adds or replaces a single action in the implementation for future deployments. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in implementation registry
+            entry (sp.record) - implementation of the action in form of lambda that takes storage and returns updated one,
+                together with the `only_admin` flag
+            '''
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_Factory_NotOwner"
+
+            self.data.implementation[name] = entry
+
+        @sp.entrypoint
+        def removeAction(self, name):
+            '''
+            Removes a single action from the implementation for future deployments. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name in implementation registry
+            '''
+            sp.cast(name, sp.string)
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_Factory_NotOwner"
+
+            del self.data.implementation[name]
+
+        @sp.entrypoint
+        def setTypedActions(self, param):
+            '''
+            Sets the typed lambdas of the hot actions for future deployments. Callable only by the owner
+
+            Params:
+            param (sp.record) - optional typed lambda of each hot action
+            '''
+            sp.cast(param, BackedTokenStorageModule.TypedActions)
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_Factory_NotOwner"
+
+            self.data.typedActions = param
+
+        @sp.entrypoint
+        def setNativeActions(self, param):
+            '''
+            Enables or disables the compiled-in implementation of `transfer`, `approve`, `increaseAllowance`
+            and `decreaseAllowance` in future deployments. While enabled, the lambdas of these actions are not
+            copied into the new contracts. Callable only by the owner
+
+            Params:
+            param (sp.bool) - the native actions mode of future deployments
+            '''
+            sp.cast(param, sp.bool)
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_Factory_NotOwner"
+
+            self.data.nativeActions = param
+
+        @sp.entrypoint
+        def setRegistry(self, param):
+            '''
+            Sets the implementation registry pinned in future deployments, or unsets it with None.
+            While a registry is set, new contracts are deployed with an empty implementation. Callable only by the owner
+
+            Params:
+            param (sp.option) - address and version of the implementation registry
+            '''
+            sp.cast(param, sp.option[ImplementationRegistryModule.RegistryPin])
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_Factory_NotOwner"
+
+            self.data.registry = param
+
+        @sp.entrypoint
+        def upgradeTokens(self, updates, fromIndex, count):
+            '''
+            Pushes action updates to up to `count` deployed tokens, starting at `fromIndex` in the tokens registry.
+            Large fleets can be upgraded in several calls, continuing from the `nextIndex` of the emitted event.
+            Tokens whose owner replaced the factory as upgrader are skipped and listed in the `skipped` indexes of the event,
+            so they do not block the rest of the range. Callable only by the factory owner
+
+            Params:
+            updates (sp.list) - list of updates
+                name (sp.string) - action's name in implementation registry
+                entry (sp.option) - new implementation of the action, or None to remove it
+            fromIndex (sp.nat) - index of the first token to upgrade
+            count (sp.nat) - maximum number of tokens to upgrade
+
+            Emits:
+            TokensUpgraded event
+            '''
+            sp.cast(updates, BackedTokenStorageModule.ActionUpdates)
+            sp.cast(fromIndex, sp.nat)
+            sp.cast(count, sp.nat)
+            assert self.isOwner(sp.sender), "BACKED_TOKEN_Factory_NotOwner"
+            assert fromIndex <= self.data.tokenCount, "BACKED_TOKEN_Factory_InvalidIndex"
+
+            toIndex = fromIndex + count
+            if toIndex > self.data.tokenCount:
+                toIndex = self.data.tokenCount
+
+            skipped = []
+            index = fromIndex
+            while index < toIndex:
+                tokenAddress = self.data.tokens[index]
+                # The upgrader is read before the call, as `updateActions` would fail the whole batch for an opted-out token
+                if sp.view("upgrader", tokenAddress, (), sp.address) == sp.Some(sp.self_address):
+                    token = sp.contract(
+                        BackedTokenStorageModule.ActionUpdates, tokenAddress, entrypoint="updateActions"
+                    ).unwrap_some(error="BACKED_TOKEN_Factory_InvalidToken")
+                    sp.transfer(updates, sp.mutez(0), token)
+                else:
+                    skipped.push(index)
+                index += 1
+
+            sp.emit(sp.record(fromIndex=fromIndex, nextIndex=toIndex, skipped=reversed(skipped)), tag="TokensUpgraded")
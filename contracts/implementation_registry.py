@@ -0,0 +1,105 @@
+import smartpy as sp
+
+from contracts.utils.ownable import OwnableModule
+
+@sp.module
+def ImplementationRegistryModule():
+    RegistryPin: type = sp.record(address=sp.address, version=sp.nat)
+
+    class ImplementationRegistry(OwnableModule.Ownable):
+        '''
+        Registry contract, used for sharing one set of action lambdas between many tokens or oracles.
+        Contracts pin a published version and resolve their actions through the `getAction` view,
+        so the lambdas are stored once instead of being copied into every contract.
+
+        Actions are staged in the draft version (latest published version + 1) and become
+        immutable once the version is published.
+
+        The contract contains one role:
+        - An owner, which can stage and publish versions
+        '''
+        def __init__(self, owner, metadata, actions):
+            '''
+            Params:
+            owner (sp.address) - the address of the account that will be set as owner of the contract
+            metadata (sp.big_map) - contract-specific metadata
+            actions (sp.big_map) - initial actions, keyed by version and action's name
+            '''
+            OwnableModule.Ownable.__init__(self, owner)
+            self.data.metadata = metadata
+            self.data.actions = actions
+            self.data.latestVersion = 0
+
+        @sp.onchain_view()
+        def getAction(self, params):
+            '''
+            Returns the action registered under `name` in a published `version`, or None if there is no such action.
+            '''
+            sp.cast(params, sp.record(version=sp.nat, name=sp.string))
+            assert params.version != 0 and params.version <= self.data.latestVersion, "IMPLEMENTATION_REGISTRY_UnpublishedVersion"
+
+            return self.data.actions.get_opt(params)
+
+        @sp.onchain_view()
+        def latestVersion(self):
+            return self.data.latestVersion
+
+        @sp.entrypoint
+        def setAction(self, name, entry):
+            '''
+            Adds or replaces an action in the draft version. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name
+            entry (sp.record) - implementation of the action, together with the `only_admin` flag
+            '''
+            assert self.isOwner(sp.sender), "IMPLEMENTATION_REGISTRY_NotOwner"
+
+            self.data.actions[sp.record(version=self.data.latestVersion + 1, name=name)] = entry
+
+        @sp.entrypoint
+        def removeAction(self, name):
+            '''
+            Removes an action from the draft version. Callable only by the owner
+
+            Params:
+            name (sp.string) - action's name
+            '''
+            sp.cast(name, sp.string)
+            assert self.isOwner(sp.sender), "IMPLEMENTATION_REGISTRY_NotOwner"
+
+            del self.data.actions[sp.record(version=self.data.latestVersion + 1, name=name)]
+
+        @sp.entrypoint
+        def copyActions(self, fromVersion, names):
+            '''
+            Copies unchanged actions from a published version into the draft version,
+            so they do not have to be sent again. Callable only by the owner
+
+            Params:
+            fromVersion (sp.nat) - published version to copy from
+            names (sp.list) - names of the actions to copy
+            '''
+            sp.cast(fromVersion, sp.nat)
+            sp.cast(names, sp.list[sp.string])
+            assert self.isOwner(sp.sender), "IMPLEMENTATION_REGISTRY_NotOwner"
+            assert fromVersion <= self.data.latestVersion, "IMPLEMENTATION_REGISTRY_UnpublishedVersion"
+
+            for name in names:
+                self.data.actions[sp.record(version=self.data.latestVersion + 1, name=name)] = self.data.actions.get(
+                    sp.record(version=fromVersion, name=name), error="IMPLEMENTATION_REGISTRY_UnknownAction"
+                )
+
+        @sp.entrypoint
+        def publishVersion(self):
+            '''
+            Publishes the draft version, which can not be changed afterwards. Callable only by the owner
+
+            Emits:
+            VersionPublished event
+            '''
+            assert self.isOwner(sp.sender), "IMPLEMENTATION_REGISTRY_NotOwner"
+
+            self.data.latestVersion += 1
+
+            sp.emit(sp.record(version=self.data.latestVersion), tag="VersionPublished")
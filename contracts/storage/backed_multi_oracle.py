@@ -0,0 +1,34 @@
+import smartpy as sp
+
+@sp.module
+def BackedMultiOracleStorageModule():
+    # `cumulativePrice` is the answer integrated over time (answer x seconds) from the first round of the feed, see `twap`
+    RoundData: type = sp.record(answer=sp.int, timestamp=sp.timestamp, cumulativePrice=sp.int)
+
+    # State of a single price feed, with a copy of its latest round so the latest* views do not read `roundData`
+    Feed: type = sp.record(
+        decimals=sp.string,
+        description=sp.string,
+        latestRoundNumber=sp.nat,
+        latest=RoundData
+    )
+
+    RoundKey: type = sp.record(feedId=sp.string, roundId=sp.nat).layout(("feedId", "roundId"))
+
+    FeedRoundRangeParams: type = sp.record(feedId=sp.string, fromRound=sp.nat, count=sp.nat).layout(("feedId", ("fromRound", "count")))
+    FeedTwapParams: type = sp.record(feedId=sp.string, fromRound=sp.nat, toRound=sp.nat).layout(("feedId", ("fromRound", "toRound")))
+
+    BackedMultiOracle: type = sp.record(
+        updater=sp.address,
+        feeds=sp.big_map[sp.string, Feed],
+        # Number of rounds kept per feed, keyed by round number modulo `retention` (see RoundBufferModule), 0 keeps all rounds
+        retention=sp.nat,
+        roundData=sp.big_map[RoundKey, RoundData]
+    )
+
+    BackedMultiOracleAction: type = sp.record(
+        action=sp.lambda_(sp.record(storage=BackedMultiOracle, data=sp.bytes), BackedMultiOracle, with_operations=True),
+        only_admin=sp.bool
+    )
+
+    FeedRoundUpdatedEvent: type = sp.record(feedId=sp.string, roundId=sp.nat, answer=sp.int, timestamp=sp.timestamp, updatedBy=sp.address)
@@ -0,0 +1,55 @@
+import smartpy as sp
+
+@sp.module
+def BackedMultiTokenStorageModule():
+    LedgerKey: type = sp.record(owner=sp.address, token_id=sp.nat).layout(("owner", "token_id"))
+    OperatorKey: type = sp.record(owner=sp.address, operator=sp.address, token_id=sp.nat).layout(("owner", ("operator", "token_id")))
+    Roles: type = sp.record(minter=sp.address, burner=sp.address)
+
+    # Fields used by the frequent actions (transfers, operators, mint and burn).
+    # `supply` and `roles` have an entry for every asset added to the contract, even with zero supply
+    BackedMultiTokenHot: type = sp.record(
+        ledger=sp.big_map[LedgerKey, sp.nat],
+        operators=sp.big_map[OperatorKey, sp.unit],
+        supply=sp.big_map[sp.nat, sp.nat],
+        roles=sp.big_map[sp.nat, Roles]
+    )
+
+    # Fields read by the rare actions (terms, delegation and permits) and by the metadata views
+    BackedMultiTokenCold: type = sp.record(
+        token_metadata=sp.big_map[sp.nat, sp.record(token_id=sp.nat, token_info=sp.map[sp.string, sp.bytes])],
+        terms=sp.string,
+        nonce=sp.big_map[sp.address, sp.nat],
+        delegateMode=sp.bool,
+        delegateWhitelist=sp.big_map[sp.address, sp.bool]
+    )
+
+    BackedMultiToken: type = sp.record(hot=BackedMultiTokenHot, cold=BackedMultiTokenCold)
+
+    BackedMultiTokenAction: type = sp.record(
+        action=sp.variant(
+            hot=sp.lambda_[sp.record(storage=BackedMultiTokenHot, data=sp.bytes), BackedMultiTokenHot],
+            cold=sp.lambda_[sp.record(storage=BackedMultiTokenCold, data=sp.bytes), BackedMultiTokenCold],
+            full=sp.lambda_[sp.record(storage=BackedMultiToken, data=sp.bytes), BackedMultiToken]
+        ),
+        only_admin=sp.bool
+    )
+
+    ActionUpdates: type = sp.list[sp.record(name=sp.string, entry=sp.option[BackedMultiTokenAction])]
+
+    # TZIP-12 parameter types
+    TransferTx: type = sp.record(to_=sp.address, token_id=sp.nat, amount=sp.nat).layout(("to_", ("token_id", "amount")))
+    TransferParams: type = sp.list[sp.record(from_=sp.address, txs=sp.list[TransferTx]).layout(("from_", "txs"))]
+
+    UpdateOperatorsParams: type = sp.list[
+        sp.variant(
+            add_operator=OperatorKey,
+            remove_operator=OperatorKey
+        )
+    ]
+
+    BalanceOfResponse: type = sp.record(request=LedgerKey, balance=sp.nat).layout(("request", "balance"))
+    BalanceOfParams: type = sp.record(
+        requests=sp.list[LedgerKey],
+        callback=sp.contract[sp.list[BalanceOfResponse]]
+    ).layout(("requests", "callback"))
@@ -2,10 +2,33 @@ import smartpy as sp
 
 @sp.module
 def BackedOracleStorageModule():
+    # `cumulativePrice` is the answer integrated over time (answer x seconds) from the first round, see `twap`
+    RoundData: type = sp.record(answer=sp.int, timestamp=sp.timestamp, cumulativePrice=sp.int)
+
     BackedOracle: type = sp.record(
         updater=sp.address,
         decimals=sp.string,
         description=sp.string,
         latestRoundNumber=sp.nat,
-        roundData=sp.big_map[sp.nat, sp.record(answer=sp.int, timestamp=sp.timestamp)]
-    )
\ No newline at end of file
+        # Copy of the latest round, so the latest* views do not read `roundData`
+        latest=RoundData,
+        # Number of rounds kept in `roundData`, keyed by round number modulo `retention` (see RoundBufferModule), 0 keeps all rounds
+        retention=sp.nat,
+        roundData=sp.big_map[sp.nat, RoundData]
+    )
+
+    RoundDataResult: type = sp.record(
+        roundId=sp.nat,
+        answer=sp.int,
+        startedAt=sp.timestamp,
+        updatedAt=sp.timestamp,
+        answeredInRound=sp.nat
+    )
+
+    # Slice of historical rounds, `nextRound` is the round to continue from when the requested count was capped
+    RoundRangeParams: type = sp.record(fromRound=sp.nat, count=sp.nat).layout(("fromRound", "count"))
+    RoundRange: type = sp.record(rounds=sp.list[RoundDataResult], nextRound=sp.option[sp.nat]).layout(("rounds", "nextRound"))
+
+    TwapParams: type = sp.record(fromRound=sp.nat, toRound=sp.nat).layout(("fromRound", "toRound"))
+
+    RoundUpdatedEvent: type = sp.record(roundId=sp.nat, answer=sp.int, timestamp=sp.timestamp, updatedBy=sp.address)
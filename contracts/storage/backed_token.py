@@ -2,13 +2,75 @@ import smartpy as sp
 
 @sp.module
 def BackedTokenStorageModule():
-    BackedToken: type = sp.record(
-        balances=sp.big_map[sp.address, sp.record(approvals=sp.map[sp.address, sp.nat], balance=sp.nat)],
+    # Allowance that is never decremented by transfers (2^256 - 1). Approving it, or increasing an allowance
+    # up to it, gives an unlimited allowance
+    UNLIMITED_ALLOWANCE = sp.nat(115792089237316195423570985008687907853269984665640564039457584007913129639935)
+
+    # Fields used by the frequent actions (transfers, allowances, mint and burn).
+    # `balances` and `total_supply` are kept in shares, converted to token amounts through `multiplier` (see SharesModule),
+    # allowances are kept in token amounts
+    BackedTokenHot: type = sp.record(
+        balances=sp.big_map[sp.address, sp.nat],
+        allowances=sp.big_map[sp.record(owner=sp.address, spender=sp.address), sp.nat],
         total_supply=sp.nat,
+        multiplier=sp.nat,
+        roles=sp.record(minter=sp.address, burner=sp.address)
+    )
+
+    # Fields used only by the configuration and the signed (delegated) actions
+    BackedTokenCold: type = sp.record(
         token_metadata=sp.big_map[sp.nat, sp.record(token_id=sp.nat, token_info=sp.map[sp.string, sp.bytes])],
         terms=sp.string,
-        roles=sp.record(minter=sp.address, burner=sp.address),
         nonce=sp.big_map[sp.address, sp.nat],
+        nonceBitmap=sp.big_map[sp.record(owner=sp.address, word=sp.nat), sp.nat],
         delegateMode=sp.bool,
-        delegateWhitelist=sp.big_map[sp.address, sp.bool]
+        delegateWhitelist=sp.big_map[sp.address, sp.bool],
+        importedChunks=sp.nat,
+        importChecksums=sp.big_map[sp.nat, sp.bytes],
+        # Set once the migration of balances is done, disables `importBalances` for good
+        importFinalized=sp.bool
+    )
+
+    BackedToken: type = sp.record(hot=BackedTokenHot, cold=BackedTokenCold)
+
+    # Each action is registered with the storage section it reads and updates.
+    # Actions emit their own events, so the lambdas are typed with operations
+    BackedTokenAction: type = sp.record(
+        action=sp.variant(
+            hot=sp.lambda_(sp.record(storage=BackedTokenHot, data=sp.bytes), BackedTokenHot, with_operations=True),
+            cold=sp.lambda_(sp.record(storage=BackedTokenCold, data=sp.bytes), BackedTokenCold, with_operations=True),
+            full=sp.lambda_(sp.record(storage=BackedToken, data=sp.bytes), BackedToken, with_operations=True)
+        ),
+        only_admin=sp.bool
+    )
+
+    ActionUpdates: type = sp.list[sp.record(name=sp.string, entry=sp.option[BackedTokenAction])]
+
+    TransferParams: type = sp.record(from_=sp.address, to_=sp.address, value=sp.nat).layout(("from_ as from", ("to_ as to", "value")))
+    AllowanceParams: type = sp.record(spender=sp.address, value=sp.nat).layout(("spender", "value"))
+
+    # Events, carrying the balances after the action so indexers do not have to read the storage
+    TransferEvent: type = sp.record(from_=sp.address, to_=sp.address, value=sp.nat, fromBalance=sp.nat, toBalance=sp.nat)
+    ApprovalEvent: type = sp.record(owner=sp.address, spender=sp.address, value=sp.nat)
+    MintEvent: type = sp.record(to_=sp.address, value=sp.nat, balance=sp.nat, totalSupply=sp.nat)
+    BurnEvent: type = sp.record(from_=sp.address, value=sp.nat, balance=sp.nat, totalSupply=sp.nat)
+    MultiplierEvent: type = sp.record(multiplier=sp.nat, totalSupply=sp.nat)
+    RelayResultEvent: type = sp.record(index=sp.nat, applied=sp.bool)
+
+    # Batched read of many balances and allowances in one view call
+    AllowanceKey: type = sp.record(owner=sp.address, spender=sp.address).layout(("owner", "spender"))
+    BalancesOfParams: type = sp.record(
+        owners=sp.list[sp.address],
+        allowances=sp.list[AllowanceKey]
+    ).layout(("owners", "allowances"))
+    BalancesOfResult: type = sp.record(
+        balances=sp.list[sp.record(owner=sp.address, balance=sp.nat).layout(("owner", "balance"))],
+        allowances=sp.list[sp.record(owner=sp.address, spender=sp.address, value=sp.nat).layout(("owner", ("spender", "value")))]
+    ).layout(("balances", "allowances"))
+
+    TypedActions: type = sp.record(
+        transfer=sp.option[sp.lambda_(sp.record(storage=BackedTokenHot, params=TransferParams), BackedTokenHot, with_operations=True)],
+        approve=sp.option[sp.lambda_(sp.record(storage=BackedTokenHot, params=AllowanceParams), BackedTokenHot, with_operations=True)],
+        increaseAllowance=sp.option[sp.lambda_(sp.record(storage=BackedTokenHot, params=AllowanceParams), BackedTokenHot, with_operations=True)],
+        decreaseAllowance=sp.option[sp.lambda_(sp.record(storage=BackedTokenHot, params=AllowanceParams), BackedTokenHot, with_operations=True)]
     )
\ No newline at end of file
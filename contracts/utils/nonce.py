@@ -2,6 +2,22 @@ import smartpy as sp
 
 @sp.module
 def NonceModule():
+    def unorderedNonceSlot(owner, nonce):
+        '''
+        Returns the nonce bitmap key and the bit mask of an unordered nonce.
+        Each bitmap word tracks 256 consecutive nonces of the owner.
+
+        Params:
+        owner (sp.address) - the owner of the nonce
+        nonce (sp.nat) - the unordered nonce
+        '''
+        sp.cast(owner, sp.address)
+        sp.cast(nonce, sp.nat)
+        return sp.record(
+            key=sp.record(owner=owner, word=nonce >> 8),
+            mask=sp.nat(1) << sp.mod(nonce, 256)
+        )
+
     class NonceInterface(sp.Contract):
         @sp.private(with_storage="read-only")
         def getNonce(self, owner):
@@ -15,15 +31,15 @@ def NonceModule():
 
     class Nonce(sp.Contract):
         def __init__(self):
-            self.data.storage.nonce = sp.big_map()
+            """Nonces are kept in the cold section of the storage, initialised by the contract."""
 
         @sp.private(with_storage="read-only")
         def getNonce(self, owner):
-            return self.data.storage.nonce.get(owner, default = 0)
+            return self.data.storage.cold.nonce.get(owner, default = 0)
         
         @sp.private(with_storage="read-write")
         def useNonce(self, owner):
-            nonce = self.data.storage.nonce.get(owner, default = 0)
+            nonce = self.data.storage.cold.nonce.get(owner, default = 0)
 
-            self.data.storage.nonce[owner] = nonce + 1
+            self.data.storage.cold.nonce[owner] = nonce + 1
         
\ No newline at end of file
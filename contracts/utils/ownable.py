@@ -2,6 +2,17 @@ import smartpy as sp
 
 @sp.module
 def OwnableModule():
+    def isContractOwner(sender):
+        '''
+        Verifies sender as owner of the running contract, through its `get_owner` view.
+        Used by action lambdas, which only receive the storage record and not the owner.
+
+        Params:
+        sender (sp.address) - address that will be checked
+        '''
+        sp.cast(sender, sp.address)
+        return sender == sp.view("get_owner", sp.self_address, (), sp.address).unwrap_some(error="Ownable_NoOwnerView")
+
     class OwnableInterface(sp.Contract):
         @sp.private(with_storage="read-only")
         def isOwner(self, sender):
@@ -0,0 +1,81 @@
+import smartpy as sp
+from contracts.storage.backed_oracle import BackedOracleStorageModule
+
+@sp.module
+def RoundBufferModule():
+    # Rounds are kept in a ring buffer of `retention` slots, so a new round overwrites the oldest one
+    # in place instead of allocating new storage. A retention of 0 keeps every round.
+
+    # Maximum number of rounds returned by a single `getRoundRange` call, so the view stays within the gas limit
+    MAX_ROUND_RANGE = sp.nat(50)
+
+    def roundKey(retention, roundId):
+        '''
+        Returns the `roundData` key of a round.
+
+        Params:
+        retention (sp.nat) - number of rounds kept by the oracle, 0 for all of them
+        roundId (sp.nat) - the round number
+        '''
+        sp.cast(retention, sp.nat)
+        sp.cast(roundId, sp.nat)
+        key = roundId
+        if retention > 0:
+            key = sp.mod(roundId, retention)
+        return key
+
+    def readRound(storage, roundId):
+        '''
+        Returns the data of a round, failing if the round does not exist yet or has been evicted.
+
+        Params:
+        storage (BackedOracle storage) - current storage of the BackedOracle contract
+        roundId (sp.nat) - the round number
+        '''
+        sp.cast(storage, BackedOracleStorageModule.BackedOracle)
+        sp.cast(roundId, sp.nat)
+        assert roundId != 0 and roundId <= storage.latestRoundNumber, "No data present"
+        assert storage.retention == 0 or roundId + storage.retention > storage.latestRoundNumber, "Round pruned"
+
+        return storage.roundData[roundKey(sp.record(retention=storage.retention, roundId=roundId))]
+
+    def readRoundRange(storage, params):
+        '''
+        Returns up to `count` consecutive rounds starting at `fromRound`, capped to MAX_ROUND_RANGE rounds
+        and to the latest round. When the cap cut the requested range, `nextRound` is the round to continue from.
+        Fails like `readRound` if `fromRound` is 0 or has been evicted, a range starting after the latest round is empty.
+
+        Params:
+        storage (BackedOracle storage) - current storage of the BackedOracle contract
+        params (RoundRangeParams) - the first round and the number of rounds to return
+        '''
+        sp.cast(storage, BackedOracleStorageModule.BackedOracle)
+        sp.cast(params, BackedOracleStorageModule.RoundRangeParams)
+
+        end = params.fromRound + params.count
+        if params.count > MAX_ROUND_RANGE:
+            end = params.fromRound + MAX_ROUND_RANGE
+        if end > storage.latestRoundNumber + 1:
+            end = storage.latestRoundNumber + 1
+
+        rounds = []
+        roundId = params.fromRound
+        while roundId < end:
+            roundData = readRound(sp.record(storage=storage, roundId=roundId))
+            rounds.push(sp.record(
+                roundId=roundId,
+                answer=roundData.answer,
+                startedAt=roundData.timestamp,
+                updatedAt=roundData.timestamp,
+                answeredInRound=roundId
+            ))
+            roundId += 1
+
+        nextRound = None
+        if roundId < params.fromRound + params.count and roundId <= storage.latestRoundNumber:
+            nextRound = sp.Some(roundId)
+
+        return sp.cast(
+            sp.record(rounds=reversed(rounds), nextRound=nextRound),
+            BackedOracleStorageModule.RoundRange
+        )
@@ -0,0 +1,49 @@
+import smartpy as sp
+
+@sp.module
+def SharesModule():
+    # Fixed point precision of the balance multiplier, a multiplier of MULTIPLIER_BASE converts shares 1:1
+    MULTIPLIER_BASE = sp.nat(1000000000000000000)
+
+    # Balances are stored as shares and converted through the multiplier of the token.
+    # Rounding always favours the holders that are not part of the action:
+    # - shares credited for an amount (mint, import) are rounded down,
+    # - shares debited for an amount (transfer, burn) are rounded up,
+    # - amounts read from shares (balances, total supply) are rounded down.
+    # So a holder can always move its whole balance, and the sum of the balances never exceeds the total supply.
+
+    def toBalance(shares, multiplier):
+        '''
+        Returns the token amount of `shares`, rounded down.
+
+        Params:
+        shares (sp.nat) - amount of shares
+        multiplier (sp.nat) - current multiplier of the token
+        '''
+        sp.cast(shares, sp.nat)
+        sp.cast(multiplier, sp.nat)
+        return shares * multiplier / MULTIPLIER_BASE
+
+    def toShares(value, multiplier):
+        '''
+        Returns the shares credited for a token amount, rounded down.
+
+        Params:
+        value (sp.nat) - token amount
+        multiplier (sp.nat) - current multiplier of the token
+        '''
+        sp.cast(value, sp.nat)
+        sp.cast(multiplier, sp.nat)
+        return value * MULTIPLIER_BASE / multiplier
+
+    def toSharesUp(value, multiplier):
+        '''
+        Returns the shares debited for a token amount, rounded up.
+
+        Params:
+        value (sp.nat) - token amount
+        multiplier (sp.nat) - current multiplier of the token
+        '''
+        sp.cast(value, sp.nat)
+        sp.cast(multiplier, sp.nat)
+        return (value * MULTIPLIER_BASE + sp.as_nat(multiplier - 1)) / multiplier
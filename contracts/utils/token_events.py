@@ -0,0 +1,82 @@
+import smartpy as sp
+from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.utils.shares import SharesModule
+
+@sp.module
+def TokenEventsModule():
+    # Events are emitted by the action lambdas, where the parameters are already unpacked.
+    # They carry the state after the action, so indexers do not have to read the storage.
+
+    @sp.effects(with_operations=True)
+    def emitTransfer(transfer, fromShares, toShares, multiplier):
+        '''
+        Emits a Transfer event, with the balances of both accounts after the transfer.
+
+        Params:
+        transfer (TransferParams) - the applied transfer
+        fromShares (sp.nat) - shares of the sender after the transfer
+        toShares (sp.nat) - shares of the receiver after the transfer
+        multiplier (sp.nat) - current multiplier of the token
+        '''
+        sp.cast(transfer, BackedTokenStorageModule.TransferParams)
+        sp.emit(sp.cast(sp.record(
+            from_=transfer.from_,
+            to_=transfer.to_,
+            value=transfer.value,
+            fromBalance=SharesModule.toBalance(sp.record(shares=fromShares, multiplier=multiplier)),
+            toBalance=SharesModule.toBalance(sp.record(shares=toShares, multiplier=multiplier))
+        ), BackedTokenStorageModule.TransferEvent), tag="Transfer")
+
+    @sp.effects(with_operations=True)
+    def emitApproval(owner, spender, value):
+        '''
+        Emits an Approval event, with the allowance after the change.
+
+        Params:
+        owner (sp.address) - owner of the tokens
+        spender (sp.address) - spender of the allowance
+        value (sp.nat) - the new allowance
+        '''
+        sp.emit(sp.cast(sp.record(
+            owner=owner,
+            spender=spender,
+            value=value
+        ), BackedTokenStorageModule.ApprovalEvent), tag="Approval")
+
+    @sp.effects(with_operations=True)
+    def emitMint(storage, to_, shares):
+        '''
+        Emits a Mint event, with the balance of the account and the total supply after the mint.
+        The value is the amount of the credited shares, which may be lower than the requested amount
+        once the shares are rounded down.
+
+        Params:
+        storage (BackedToken hot storage) - hot section of the BackedToken storage after the mint
+        to_ (sp.address) - the account the tokens were minted to
+        shares (sp.nat) - the credited shares
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.emit(sp.cast(sp.record(
+            to_=to_,
+            value=SharesModule.toBalance(sp.record(shares=shares, multiplier=storage.multiplier)),
+            balance=SharesModule.toBalance(sp.record(shares=storage.balances.get(to_, default=0), multiplier=storage.multiplier)),
+            totalSupply=SharesModule.toBalance(sp.record(shares=storage.total_supply, multiplier=storage.multiplier))
+        ), BackedTokenStorageModule.MintEvent), tag="Mint")
+
+    @sp.effects(with_operations=True)
+    def emitBurn(storage, from_, value):
+        '''
+        Emits a Burn event, with the balance of the account and the total supply after the burn.
+
+        Params:
+        storage (BackedToken hot storage) - hot section of the BackedToken storage after the burn
+        from_ (sp.address) - the account the tokens were burned from
+        value (sp.nat) - the amount of the burned tokens
+        '''
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.emit(sp.cast(sp.record(
+            from_=from_,
+            value=value,
+            balance=SharesModule.toBalance(sp.record(shares=storage.balances.get(from_, default=0), multiplier=storage.multiplier)),
+            totalSupply=SharesModule.toBalance(sp.record(shares=storage.total_supply, multiplier=storage.multiplier))
+        ), BackedTokenStorageModule.BurnEvent), tag="Burn")
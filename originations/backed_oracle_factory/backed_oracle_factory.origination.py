@@ -5,8 +5,10 @@ from contracts.backed_oracle_forwarder import BackedOracleForwarderModule
 from contracts.backed_oracle_factory import BackedOracleFactoryModule
 
 from contracts.utils.ownable import OwnableModule
+from contracts.implementation_registry import ImplementationRegistryModule
 
 from contracts.storage.backed_oracle import BackedOracleStorageModule
+from contracts.utils.round_buffer import RoundBufferModule
 
 from contracts.actions.oracle.update_answer import UpdateAnswerModule
 
@@ -21,7 +23,9 @@ if "templates" not in __name__:
     def test():
         sc = sp.test_scenario([
             OwnableModule,
+            ImplementationRegistryModule,
             BackedOracleStorageModule,
+            RoundBufferModule,
             UpdateAnswerModule,
             BackedOracleModule,
             BackedOracleForwarderModule,
@@ -0,0 +1,86 @@
+import json
+import os
+
+import smartpy as sp
+from contracts.backed_token import BackedTokenModule
+from contracts.utils.ownable import OwnableModule
+from contracts.implementation_registry import ImplementationRegistryModule
+from contracts.utils.pausable import PausableModule
+from contracts.utils.nonce import NonceModule
+from contracts.utils.shares import SharesModule
+from contracts.utils.token_events import TokenEventsModule
+from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.actions.token.transfer import TransferModule
+from contracts.actions.token.approve import ApproveModule
+from contracts.actions.token.increase_allowance import IncreaseAllowanceModule
+from contracts.actions.token.decrease_allowance import DecreaseAllowanceModule
+from contracts.actions.token.relay_bundle import RelayBundleModule
+from contracts.actions.token.mint import MintModule
+from contracts.actions.token.burn import BurnModule
+from contracts.actions.token.permit import PermitModule
+from contracts.actions.token.permit_unordered import PermitUnorderedModule
+from contracts.actions.token.delegated_transfer import DelegatedTransferModule
+from contracts.actions.token.delegated_transfer_unordered import DelegatedTransferUnorderedModule
+from contracts.actions.token.set_delegate_whitelist import SetDelegateWhitelistModule
+from contracts.actions.token.import_balances import ImportBalancesModule
+from contracts.actions.token.set_multiplier import SetMultiplierModule
+
+# TZIP-16 metadata of the tokens deployed by the factory, with the off-chain views of the BackedToken contract.
+# Pin the generated JSON on IPFS and pass its URI as `metadata` to `deployToken`.
+METADATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backed_token.metadata.json")
+
+if "templates" not in __name__:
+    @sp.add_test(name="backed_token_metadata")
+    def test():
+        sc = sp.test_scenario([
+            OwnableModule,
+            ImplementationRegistryModule,
+            PausableModule,
+            NonceModule,
+            SharesModule,
+            TokenEventsModule,
+            BackedTokenStorageModule,
+            TransferModule,
+            ApproveModule,
+            IncreaseAllowanceModule,
+            DecreaseAllowanceModule,
+            PermitModule,
+            DelegatedTransferModule,
+            RelayBundleModule,
+            MintModule,
+            BurnModule,
+            PermitUnorderedModule,
+            DelegatedTransferUnorderedModule,
+            SetDelegateWhitelistModule,
+            ImportBalancesModule,
+            SetMultiplierModule,
+            BackedTokenModule
+        ])
+
+        admin = sp.test_account("Administrator")
+
+        token = BackedTokenModule.BackedToken(
+            owner=admin.address,
+            metadata=sp.big_map(),
+            token_metadata={},
+            ledger={},
+            implementation=sp.big_map({}),
+            minter=admin.address,
+            burner=admin.address,
+            pauser=admin.address
+        )
+        sc += token
+
+        metadata = sp.create_tzip16_metadata(
+            name="Backed Token",
+            description="Backed tokenized assets (FA1.2)",
+            version="1.0.0",
+            license_name="ISC",
+            interfaces=["TZIP-007", "TZIP-016"],
+            authors=["Backed Finance <https://backed.fi>"],
+            homepage="https://github.com/backed-fi/backed-tezos-token-contracts",
+            offchain_views=token.get_offchain_views(),
+        )
+
+        with open(METADATA_PATH, "w") as metadata_file:
+            json.dump(metadata, metadata_file, indent=2)
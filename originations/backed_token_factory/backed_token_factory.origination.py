@@ -2,8 +2,11 @@ import smartpy as sp
 from contracts.backed_token_factory import BackedTokenFactoryModule
 from contracts.backed_token import BackedTokenModule 
 from contracts.utils.ownable import OwnableModule 
+from contracts.implementation_registry import ImplementationRegistryModule
 from contracts.utils.pausable import PausableModule
 from contracts.utils.nonce import NonceModule
+from contracts.utils.shares import SharesModule
+from contracts.utils.token_events import TokenEventsModule
 
 from contracts.actions.token.mint import MintModule 
 from contracts.actions.token.set_minter import SetMinterModule 
@@ -11,13 +14,19 @@ from contracts.actions.token.burn import BurnModule
 from contracts.actions.token.set_burner import SetBurnerModule 
 from contracts.actions.token.approve import ApproveModule
 from contracts.actions.token.transfer import TransferModule
+from contracts.actions.token.transfer_batch import TransferBatchModule
 from contracts.actions.token.delegated_transfer import DelegatedTransferModule
 from contracts.actions.token.permit import PermitModule
+from contracts.actions.token.relay_bundle import RelayBundleModule
+from contracts.actions.token.permit_unordered import PermitUnorderedModule
+from contracts.actions.token.delegated_transfer_unordered import DelegatedTransferUnorderedModule
 from contracts.actions.token.increase_allowance import IncreaseAllowanceModule
 from contracts.actions.token.decrease_allowance import DecreaseAllowanceModule
 from contracts.actions.token.set_terms import SetTermsModule
 from contracts.actions.token.set_delegate_mode import SetDelegateModeModule
 from contracts.actions.token.set_delegate_whitelist import SetDelegateWhitelistModule
+from contracts.actions.token.import_balances import ImportBalancesModule
+from contracts.actions.token.set_multiplier import SetMultiplierModule
 
 from contracts.storage.backed_token import BackedTokenStorageModule
 
@@ -32,8 +41,11 @@ if "templates" not in __name__:
     def test():
         sc = sp.test_scenario([
             OwnableModule,
+            ImplementationRegistryModule,
             PausableModule,
             NonceModule,
+            SharesModule,
+            TokenEventsModule,
             BackedTokenStorageModule,
             MintModule,
             SetMinterModule,
@@ -41,32 +53,47 @@ if "templates" not in __name__:
             SetBurnerModule,
             ApproveModule,
             TransferModule,
+            TransferBatchModule,
             DelegatedTransferModule,
             PermitModule,
+            RelayBundleModule,
+            PermitUnorderedModule,
+            DelegatedTransferUnorderedModule,
             SetTermsModule,
             IncreaseAllowanceModule,
             DecreaseAllowanceModule,
             SetDelegateModeModule,
             SetDelegateWhitelistModule,
+            ImportBalancesModule,
+            SetMultiplierModule,
             BackedTokenModule,
             BackedTokenFactoryModule,
             OriginationsModule
         ])
        
         implementation = sp.big_map({
-            "mint": sp.record(action=MintModule.mint, only_admin=False),
-            "burn": sp.record(action=BurnModule.burn, only_admin=False),
-            "approve": sp.record(action=ApproveModule.approve, only_admin=False),
-            "transfer": sp.record(action=TransferModule.transfer, only_admin=False),
-            "delegatedTransfer": sp.record(action=DelegatedTransferModule.delegatedTransfer, only_admin=False),
-            "permit": sp.record(action=PermitModule.permit, only_admin=False),
-            "setMinter": sp.record(action=SetMinterModule.setMinter, only_admin=True),
-            "setBurner": sp.record(action=SetBurnerModule.setBurner, only_admin=True),
-            "setTerms": sp.record(action=SetTermsModule.setTerms, only_admin=True),
-            "increaseAllowance": sp.record(action=IncreaseAllowanceModule.increaseAllowance, only_admin=False),
-            "decreaseAllowance": sp.record(action=DecreaseAllowanceModule.decreaseAllowance, only_admin=False),
-            "setDelegateMode": sp.record(action=SetDelegateModeModule.setDelegateMode, only_admin=True),
-            "setDelegateWhitelist": sp.record(action=SetDelegateWhitelistModule.setDelegateWhitelist, only_admin=True),
+            "mint": sp.record(action=sp.variant("hot", MintModule.mint), only_admin=False),
+            "mintBatch": sp.record(action=sp.variant("hot", MintModule.mintBatch), only_admin=False),
+            "burn": sp.record(action=sp.variant("hot", BurnModule.burn), only_admin=False),
+            "burnBatch": sp.record(action=sp.variant("hot", BurnModule.burnBatch), only_admin=False),
+            "approve": sp.record(action=sp.variant("hot", ApproveModule.approve), only_admin=False),
+            "transfer": sp.record(action=sp.variant("hot", TransferModule.transfer), only_admin=False),
+            "transferBatch": sp.record(action=sp.variant("hot", TransferBatchModule.transferBatch), only_admin=False),
+            "delegatedTransfer": sp.record(action=sp.variant("full", DelegatedTransferModule.delegatedTransfer), only_admin=False),
+            "permit": sp.record(action=sp.variant("full", PermitModule.permit), only_admin=False),
+            "relayBundle": sp.record(action=sp.variant("full", RelayBundleModule.relayBundle), only_admin=False),
+            "permitUnordered": sp.record(action=sp.variant("full", PermitUnorderedModule.permitUnordered), only_admin=False),
+            "delegatedTransferUnordered": sp.record(action=sp.variant("full", DelegatedTransferUnorderedModule.delegatedTransferUnordered), only_admin=False),
+            "setMinter": sp.record(action=sp.variant("hot", SetMinterModule.setMinter), only_admin=True),
+            "setBurner": sp.record(action=sp.variant("hot", SetBurnerModule.setBurner), only_admin=True),
+            "setTerms": sp.record(action=sp.variant("cold", SetTermsModule.setTerms), only_admin=True),
+            "increaseAllowance": sp.record(action=sp.variant("hot", IncreaseAllowanceModule.increaseAllowance), only_admin=False),
+            "decreaseAllowance": sp.record(action=sp.variant("hot", DecreaseAllowanceModule.decreaseAllowance), only_admin=False),
+            "setDelegateMode": sp.record(action=sp.variant("cold", SetDelegateModeModule.setDelegateMode), only_admin=True),
+            "setDelegateWhitelist": sp.record(action=sp.variant("cold", SetDelegateWhitelistModule.setDelegateWhitelist), only_admin=True),
+            "importBalances": sp.record(action=sp.variant("full", ImportBalancesModule.importBalances), only_admin=True),
+            "finalizeImport": sp.record(action=sp.variant("full", ImportBalancesModule.finalizeImport), only_admin=True),
+            "setMultiplier": sp.record(action=sp.variant("hot", SetMultiplierModule.setMultiplier), only_admin=False),
         })
 
         factory = BackedTokenFactoryModule.BackedFactory(owner=sp.address("tz1exRAv3HPgWEm89BDZarhY9A6AYFXoxxxd"), implementation=implementation)
@@ -0,0 +1,50 @@
+"""
+Copies the Michelson code and storage generated by an origination scenario to the paths read by the
+deploy scripts, the constants build and the implementation diff.
+
+The generated files are committed. They are rebuilt from the current contracts on every
+`npm run <contract>:originate`, so commit them together with the contract changes.
+
+Usage:
+    python originations/collect_output.py \\
+        --output originations/backed_token_factory/output \\
+        --name originations/backed_token_factory/backed_token_factory
+
+writes `<name>.json` and `<name>.storage.json`.
+"""
+
+import argparse
+import pathlib
+import shutil
+import sys
+
+CONTRACT_SUFFIX = "_contract.json"
+STORAGE_SUFFIX = "_storage.json"
+
+
+def collect(output, name):
+    contracts = sorted(pathlib.Path(output).rglob("*_cont_*" + CONTRACT_SUFFIX))
+    if len(contracts) != 1:
+        raise ValueError(f"expected exactly one originated contract in {output}, found {len(contracts)}")
+
+    contract = contracts[0]
+    storage = contract.with_name(contract.name[: -len(CONTRACT_SUFFIX)] + STORAGE_SUFFIX)
+    if not storage.exists():
+        raise ValueError(f"missing storage {storage} of {contract}")
+
+    shutil.copyfile(contract, name + ".json")
+    shutil.copyfile(storage, name + ".storage.json")
+    print(f"{contract} -> {name}.json", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", required=True, help="output directory of the origination scenario")
+    parser.add_argument("--name", required=True, help="path of the generated files, without extension")
+    args = parser.parse_args()
+
+    collect(args.output, args.name)
+
+
+if __name__ == "__main__":
+    main()
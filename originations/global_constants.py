@@ -0,0 +1,205 @@
+"""
+Moves the lambdas of a generated contract into Tezos global constants, to shrink the origination.
+
+Every lambda in the generated Michelson code (`LAMBDA` instructions and pushed lambdas) and in the
+generated storage (the action lambdas of the implementation registry) whose binary size is at least
+`--min-size` bytes is replaced by a `constant "<hash>"` reference. Lambdas are replaced bottom-up,
+so nested lambdas become constants of their own and identical lambdas are registered only once.
+
+The build writes, next to the inputs:
+    <name>.constants.json       - constants to register, in registration order ({hash, value} list)
+    <name>.const.json           - code referring to the constants
+    <name>.storage.const.json   - storage referring to the constants
+
+Before anything is written the constants are expanded back into the code and storage, which must
+give exactly the original Michelson, so the originated contract behaves the same.
+
+Usage:
+    python originations/global_constants.py \\
+        --code originations/backed_token_factory/backed_token_factory.json \\
+        --storage originations/backed_token_factory/backed_token_factory.storage.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from implementation_diff import EXPR_PREFIX, base58check, storage_type_of
+
+# Michelson primitives in the order of their binary tags (Michelson_v1_primitives)
+PRIMITIVES = [
+    "parameter", "storage", "code", "False", "Elt", "Left", "None", "Pair", "Right", "Some", "True", "Unit",
+    "PACK", "UNPACK", "BLAKE2B", "SHA256", "SHA512", "ABS", "ADD", "AMOUNT", "AND", "BALANCE", "CAR", "CDR",
+    "CHECK_SIGNATURE", "COMPARE", "CONCAT", "CONS", "CREATE_ACCOUNT", "CREATE_CONTRACT", "IMPLICIT_ACCOUNT",
+    "DIP", "DROP", "DUP", "EDIV", "EMPTY_MAP", "EMPTY_SET", "EQ", "EXEC", "FAILWITH", "GE", "GET", "GT",
+    "HASH_KEY", "IF", "IF_CONS", "IF_LEFT", "IF_NONE", "INT", "LAMBDA", "LE", "LEFT", "LOOP", "LSL", "LSR",
+    "LT", "MAP", "MEM", "MUL", "NEG", "NEQ", "NIL", "NONE", "NOT", "NOW", "OR", "PAIR", "PUSH", "RIGHT",
+    "SIZE", "SOME", "SOURCE", "SENDER", "SELF", "STEPS_TO_QUOTA", "SUB", "SWAP", "TRANSFER_TOKENS",
+    "SET_DELEGATE", "UNIT", "UPDATE", "XOR", "ITER", "LOOP_LEFT", "ADDRESS", "CONTRACT", "ISNAT", "CAST",
+    "RENAME", "bool", "contract", "int", "key", "key_hash", "lambda", "list", "map", "big_map", "nat",
+    "option", "or", "pair", "set", "signature", "string", "bytes", "mutez", "timestamp", "unit",
+    "operation", "address", "SLICE", "DIG", "DUG", "EMPTY_BIG_MAP", "APPLY", "chain_id", "CHAIN_ID",
+    "LEVEL", "SELF_ADDRESS", "never", "NEVER", "UNPAIR", "VOTING_POWER", "TOTAL_VOTING_POWER", "KECCAK",
+    "SHA3", "PAIRING_CHECK", "bls12_381_g1", "bls12_381_g2", "bls12_381_fr", "sapling_state",
+    "sapling_transaction_deprecated", "SAPLING_EMPTY_STATE", "SAPLING_VERIFY_UPDATE", "ticket",
+    "TICKET_DEPRECATED", "READ_TICKET", "SPLIT_TICKET", "JOIN_TICKETS", "GET_AND_UPDATE", "chest",
+    "chest_key", "OPEN_CHEST", "VIEW", "view", "constant", "SUB_MUTEZ", "tx_rollup_l2_address",
+    "MIN_BLOCK_TIME", "sapling_transaction", "EMIT", "Lambda_rec", "LAMBDA_REC", "TICKET", "BYTES", "NAT",
+]
+PRIMITIVE_TAGS = {prim: tag for tag, prim in enumerate(PRIMITIVES)}
+
+
+def zarith(number):
+    sign = 0x40 if number < 0 else 0
+    number = abs(number)
+    encoded = bytearray([(number & 0x3F) | sign])
+    number >>= 6
+    while number:
+        encoded[-1] |= 0x80
+        encoded.append(number & 0x7F)
+        number >>= 7
+    return bytes(encoded)
+
+
+def sized(payload):
+    return len(payload).to_bytes(4, "big") + payload
+
+
+def encode(node):
+    """Binary encoding of a Micheline expression, as used for global constant hashes."""
+    if isinstance(node, list):
+        return b"\x02" + sized(b"".join(encode(item) for item in node))
+    if "int" in node:
+        return b"\x00" + zarith(int(node["int"]))
+    if "string" in node:
+        return b"\x01" + sized(node["string"].encode())
+    if "bytes" in node:
+        return b"\x0a" + sized(bytes.fromhex(node["bytes"]))
+
+    prim = bytes([PRIMITIVE_TAGS[node["prim"]]])
+    args = node.get("args", [])
+    annots = node.get("annots", [])
+    if len(args) > 2:
+        return b"\x09" + prim + sized(b"".join(encode(arg) for arg in args)) + sized(" ".join(annots).encode())
+    encoded = bytes([3 + 2 * len(args) + (1 if annots else 0)]) + prim + b"".join(encode(arg) for arg in args)
+    return encoded + (sized(" ".join(annots).encode()) if annots else b"")
+
+
+def constant_hash(value):
+    return base58check(EXPR_PREFIX + hashlib.blake2b(encode(value), digest_size=32).digest())
+
+
+class ConstantsBuilder:
+    def __init__(self, min_size):
+        self.min_size = min_size
+        self.constants = {}
+
+    def extract(self, value):
+        """Registers `value` as a constant if it is big enough and returns the replacement expression."""
+        if len(encode(value)) < self.min_size:
+            return value
+        expr_hash = constant_hash(value)
+        self.constants.setdefault(expr_hash, value)
+        return {"prim": "constant", "args": [{"string": expr_hash}]}
+
+    def code(self, node):
+        """Replaces the bodies of `LAMBDA` instructions and pushed lambdas in Michelson code."""
+        if isinstance(node, list):
+            return [self.code(item) for item in node]
+        if "prim" not in node:
+            return node
+        args = node.get("args", [])
+        if node["prim"] in ("LAMBDA", "LAMBDA_REC"):
+            args = args[:2] + [self.extract(self.code(args[2]))]
+        elif node["prim"] == "PUSH":
+            args = [args[0], self.data(args[0], args[1])]
+        else:
+            args = [self.code(arg) for arg in args]
+        return {**node, "args": args} if "args" in node else node
+
+    def pair(self, types, values):
+        """Walks the fields of a right comb, written either as `Pair a b ...` or as a sequence."""
+        if len(values) < len(types):
+            types = types[:len(values) - 1] + [{"prim": "pair", "args": types[len(values) - 1:]}]
+        if len(values) > len(types):
+            rest = self.data(types[-1], {"prim": "Pair", "args": values[len(types) - 1:]})
+            return [self.data(t, v) for t, v in zip(types[:-1], values)] + rest["args"]
+        return [self.data(t, v) for t, v in zip(types, values)]
+
+    def data(self, value_type, value):
+        """Replaces the lambdas of a Michelson value of type `value_type`."""
+        prim, type_args = value_type["prim"], value_type.get("args", [])
+        if prim == "lambda":
+            return self.extract(self.code(value))
+        if prim == "pair":
+            values = value if isinstance(value, list) else value["args"]
+            values = self.pair(type_args, values)
+            return values if isinstance(value, list) else {**value, "args": values}
+        if prim in ("map", "big_map") and isinstance(value, list):
+            return [
+                {**elt, "args": [self.data(type_args[0], elt["args"][0]), self.data(type_args[1], elt["args"][1])]}
+                for elt in value
+            ]
+        if prim in ("list", "set"):
+            return [self.data(type_args[0], item) for item in value]
+        if prim == "option" and value["prim"] == "Some":
+            return {**value, "args": [self.data(type_args[0], value["args"][0])]}
+        if prim == "or":
+            branch = type_args[0] if value["prim"] == "Left" else type_args[1]
+            return {**value, "args": [self.data(branch, value["args"][0])]}
+        return value
+
+
+def expand(node, constants):
+    if isinstance(node, list):
+        return [expand(item, constants) for item in node]
+    if node.get("prim") == "constant":
+        return expand(constants[node["args"][0]["string"]], constants)
+    if "args" in node:
+        return {**node, "args": [expand(arg, constants) for arg in node["args"]]}
+    return node
+
+
+def output_path(path, suffix):
+    return os.path.splitext(path)[0] + suffix
+
+
+def build(code_path, storage_path, min_size):
+    with open(code_path) as code_file, open(storage_path) as storage_file:
+        code, storage = json.load(code_file), json.load(storage_file)
+
+    builder = ConstantsBuilder(min_size)
+    new_code = builder.code(code)
+    new_storage = builder.data(storage_type_of(code), storage)
+
+    # The original contract must be restored exactly once the constants are expanded
+    if expand(new_code, builder.constants) != code or expand(new_storage, builder.constants) != storage:
+        raise ValueError("expanded constants do not match the original contract")
+
+    name = output_path(code_path, "")
+    with open(name + ".constants.json", "w") as constants_file:
+        json.dump([{"hash": h, "value": v} for h, v in builder.constants.items()], constants_file, indent=2)
+    with open(name + ".const.json", "w") as code_file:
+        json.dump(new_code, code_file)
+    with open(output_path(storage_path, ".const.json"), "w") as storage_file:
+        json.dump(new_storage, storage_file)
+
+    before = len(encode(code)) + len(encode(storage))
+    after = len(encode(new_code)) + len(encode(new_storage))
+    print(f"{len(builder.constants)} constant(s), origination {before} -> {after} bytes", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--code", required=True, help="generated Michelson code of the contract (JSON)")
+    parser.add_argument("--storage", required=True, help="generated storage of the contract (JSON)")
+    parser.add_argument("--min-size", type=int, default=128, help="smallest lambda (in bytes) moved to a constant")
+    args = parser.parse_args()
+
+    build(args.code, args.storage, args.min_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Computes the minimal set of `setAction` / `removeAction` calls needed to bring the implementation
+registry of a deployed contract in line with a locally generated one.
+
+The local registry is read from the generated origination files (Michelson code and storage JSON),
+the deployed one from a Tezos node. Both sides are normalized by the node before they are compared,
+so only actions whose lambda or `only_admin` flag actually changed are reported.
+
+Usage:
+    python originations/implementation_diff.py \\
+        --rpc https://ghostnet.tezos.marigold.dev \\
+        --contract KT1... \\
+        --code originations/backed_token_factory/backed_token_factory.json \\
+        --storage originations/backed_token_factory/backed_token_factory.storage.json \\
+        [--known-action oldAction ...] > update.json
+
+Deployed keys cannot be listed through the node RPC, so actions which were removed locally are only
+detected if they are passed with `--known-action`.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import urllib.error
+import urllib.request
+
+REGISTRY_ANNOT = "%implementation"
+EXPR_PREFIX = bytes([13, 44, 64, 27])
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def rpc(base_url, path, payload=None):
+    data = None if payload is None else json.dumps(payload).encode()
+    request = urllib.request.Request(
+        base_url.rstrip("/") + path, data=data, headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def base58check(payload):
+    payload += hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+    number = int.from_bytes(payload, "big")
+    encoded = ""
+    while number > 0:
+        number, remainder = divmod(number, 58)
+        encoded = BASE58_ALPHABET[remainder] + encoded
+    padding = len(payload) - len(payload.lstrip(b"\0"))
+    return BASE58_ALPHABET[0] * padding + encoded
+
+
+def string_key_hash(key):
+    """Script expression hash of a packed Michelson string, used to look up big_map values."""
+    raw = key.encode()
+    packed = b"\x05\x01" + len(raw).to_bytes(4, "big") + raw
+    return base58check(EXPR_PREFIX + hashlib.blake2b(packed, digest_size=32).digest())
+
+
+def comb(node):
+    """Unfolds right combs (`pair a b c`) into nested binary pairs."""
+    if isinstance(node, dict) and node.get("prim") in ("pair", "Pair") and len(node["args"]) > 2:
+        return {**node, "args": [node["args"][0], comb({**node, "args": node["args"][1:], "annots": []})]}
+    return node
+
+
+def find_registry(storage_type, storage_value):
+    """Returns the (type, value) of the field annotated with `%implementation`."""
+    storage_type, storage_value = comb(storage_type), comb(storage_value)
+    if REGISTRY_ANNOT in storage_type.get("annots", []):
+        return storage_type, storage_value
+    if storage_type.get("prim") == "pair":
+        for field_type, field_value in zip(storage_type["args"], storage_value["args"]):
+            found = find_registry(field_type, field_value)
+            if found is not None:
+                return found
+    return None
+
+
+def storage_type_of(code):
+    return next(section["args"][0] for section in code if section.get("prim") == "storage")
+
+
+def normalize(rpc_url, value, value_type):
+    return rpc(rpc_url, "/chains/main/blocks/head/helpers/scripts/normalize_data", {
+        "data": value, "type": value_type, "unparsing_mode": "Readable"
+    })["normalized"]
+
+
+def local_registry(code_path, storage_path):
+    with open(code_path) as code_file, open(storage_path) as storage_file:
+        registry_type, registry = find_registry(storage_type_of(json.load(code_file)), json.load(storage_file))
+    return registry_type, {elt["args"][0]["string"]: elt["args"][1] for elt in registry}
+
+
+def deployed_action(rpc_url, big_map_id, name):
+    try:
+        return rpc(rpc_url, f"/chains/main/blocks/head/context/big_maps/{big_map_id}/{string_key_hash(name)}")
+    except urllib.error.HTTPError as error:
+        if error.code == 404:
+            return None
+        raise
+
+
+def diff(rpc_url, contract, code_path, storage_path, known_actions=()):
+    registry_type, local = local_registry(code_path, storage_path)
+    value_type = registry_type["args"][1]
+
+    script = rpc(rpc_url, f"/chains/main/blocks/head/context/contracts/{contract}/script")
+    _, big_map_id = find_registry(storage_type_of(script["code"]), script["storage"])
+    big_map_id = big_map_id["int"]
+
+    operations = []
+    for name in sorted(local):
+        deployed = deployed_action(rpc_url, big_map_id, name)
+        entry = normalize(rpc_url, local[name], value_type)
+        if deployed is None or normalize(rpc_url, deployed, value_type) != entry:
+            operations.append({
+                "entrypoint": "setAction",
+                "value": {"prim": "Pair", "args": [{"string": name}, entry]},
+            })
+
+    for name in sorted(set(known_actions) - set(local)):
+        if deployed_action(rpc_url, big_map_id, name) is not None:
+            operations.append({"entrypoint": "removeAction", "value": {"string": name}})
+
+    return operations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rpc", required=True, help="Tezos node RPC url")
+    parser.add_argument("--contract", required=True, help="address of the deployed contract")
+    parser.add_argument("--code", required=True, help="generated Michelson code of the contract (JSON)")
+    parser.add_argument("--storage", required=True, help="generated storage containing the local registry (JSON)")
+    parser.add_argument("--known-action", action="append", default=[], help="deployed action to remove if missing locally")
+    args = parser.parse_args()
+
+    operations = diff(args.rpc, args.contract, args.code, args.storage, args.known_action)
+    json.dump(operations, sys.stdout, indent=2)
+    print(f"{len(operations)} action(s) to update", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
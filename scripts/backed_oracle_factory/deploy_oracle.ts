@@ -9,6 +9,8 @@ const ADMIN_ADDRESS = 'tz1exRAv3HPgWEm89BDZarhY9A6AYFXoxxxd'
 const UPDATER_ADDRESS = 'tz1exRAv3HPgWEm89BDZarhY9A6AYFXoxxxd'
 const ORACLE_DECIMALS = "18"
 const ORACLE_DESCRIPTION = "Backed Oracle"
+// Number of rounds kept by the oracle, older rounds are overwritten. 0 keeps all rounds
+const ORACLE_RETENTION = 0
 
 const main = async () => {
     const Tezos = new TezosToolkit(getEnv('TEZOS_RPC_URL', true));
@@ -28,7 +30,8 @@ const main = async () => {
             owner: ADMIN_ADDRESS,
             updater: UPDATER_ADDRESS,
             description: oracle_metadata.description,
-            decimals: oracle_metadata.decimals
+            decimals: oracle_metadata.decimals,
+            retention: ORACLE_RETENTION
         }).send();
 
 
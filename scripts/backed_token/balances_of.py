@@ -0,0 +1,140 @@
+"""
+Reads the balances (and optionally allowances) of many accounts of a deployed BackedToken
+through its `balances_of` on-chain view, without sending any operation.
+
+Addresses are sent in chunks, so a single view call stays within the gas limit of an operation.
+Chunks start at `--chunk-size` entries and are halved every time the node reports that the
+view ran out of gas, the smaller size is then kept for the remaining chunks.
+
+Usage:
+    python scripts/backed_token/balances_of.py \\
+        --rpc https://ghostnet.tezos.marigold.dev \\
+        --contract KT1... \\
+        --addresses addresses.txt \\
+        [--allowances allowances.csv] > balances.csv
+
+`addresses.txt` has one address per line, `allowances.csv` one `owner,spender` pair per line.
+The output is a CSV of `owner,spender,value` rows, with an empty spender for balances.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import urllib.error
+import urllib.request
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class GasExhausted(Exception):
+    pass
+
+
+def rpc(base_url, path, payload=None):
+    data = None if payload is None else json.dumps(payload).encode()
+    request = urllib.request.Request(
+        base_url.rstrip("/") + path, data=data, headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        body = error.read().decode(errors="replace")
+        if "gas_exhausted" in body:
+            raise GasExhausted(body) from error
+        raise
+
+
+def fields(node):
+    """Returns the fields of a right comb, written either as nested `Pair a (Pair b c)` or as `Pair a b c`."""
+    if isinstance(node, dict) and node.get("prim") == "Pair":
+        first, *rest = node["args"]
+        return [first] + fields(rest[0] if len(rest) == 1 else {"prim": "Pair", "args": rest})
+    return [node]
+
+
+def view_input(owners, allowances):
+    return {"prim": "Pair", "args": [
+        [{"string": owner} for owner in owners],
+        [{"prim": "Pair", "args": [{"string": owner}, {"string": spender}]} for owner, spender in allowances],
+    ]}
+
+
+def run_view(rpc_url, chain_id, gas, contract, owners, allowances):
+    result = rpc(rpc_url, "/chains/main/blocks/head/helpers/scripts/run_script_view", {
+        "contract": contract,
+        "view": "balances_of",
+        "input": view_input(owners, allowances),
+        "chain_id": chain_id,
+        "gas": str(gas),
+        "unparsing_mode": "Readable",
+    })["data"]
+    balances, allowance_values = result["args"]
+
+    rows = []
+    for entry in balances:
+        owner, balance = fields(entry)
+        rows.append((owner["string"], "", int(balance["int"])))
+    for entry in allowance_values:
+        owner, spender, value = fields(entry)
+        rows.append((owner["string"], spender["string"], int(value["int"])))
+    return rows
+
+
+def balances_of(rpc_url, contract, owners, allowances=(), chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Returns `(owner, spender, value)` rows for every owner (with an empty spender)
+    and every `(owner, spender)` pair, in the order of the request.
+    """
+    chain_id = rpc(rpc_url, "/chains/main/chain_id")
+    gas = rpc(rpc_url, "/chains/main/blocks/head/context/constants")["hard_gas_limit_per_operation"]
+
+    # Owners come first, so rows come back in the order of the request even when a chunk holds both kinds
+    requests = [(owner, None) for owner in owners] + [(None, pair) for pair in allowances]
+
+    rows = []
+    start = 0
+    while start < len(requests):
+        chunk = requests[start:start + chunk_size]
+        chunk_owners = [owner for owner, _ in chunk if owner is not None]
+        chunk_allowances = [pair for _, pair in chunk if pair is not None]
+        try:
+            rows += run_view(rpc_url, chain_id, gas, contract, chunk_owners, chunk_allowances)
+        except GasExhausted:
+            if chunk_size == 1:
+                raise
+            chunk_size = max(1, chunk_size // 2)
+            print(f"view ran out of gas, retrying with chunks of {chunk_size}", file=sys.stderr)
+            continue
+        start += len(chunk)
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rpc", required=True, help="Tezos node RPC url")
+    parser.add_argument("--contract", required=True, help="address of the deployed token")
+    parser.add_argument("--addresses", required=True, help="file with one owner address per line")
+    parser.add_argument("--allowances", help="CSV file with one owner,spender pair per line")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="initial number of entries per view call")
+    args = parser.parse_args()
+
+    with open(args.addresses) as addresses_file:
+        owners = [line.strip() for line in addresses_file if line.strip()]
+    allowances = []
+    if args.allowances:
+        with open(args.allowances) as allowances_file:
+            allowances = [(row[0].strip(), row[1].strip()) for row in csv.reader(allowances_file) if row]
+
+    rows = balances_of(args.rpc, args.contract, owners, allowances, args.chunk_size)
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(["owner", "spender", "value"])
+    writer.writerows(rows)
+    print(f"{len(rows)} value(s) read", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import { InMemorySigner } from '@taquito/signer';
+
+import { TezosToolkit } from '@taquito/taquito';
+
+import { getEnv } from "../helpers/config"
+
+// Estimates the same calls on a token executing the packed lambdas (BACKED_TOKEN)
+// and on a token deployed with native actions (BACKED_TOKEN_NATIVE).
+// The signer needs a balance of at least TRANSFER_VALUE on both tokens.
+const RECIPIENT = "tz1exRAv3HPgWEm89BDZarhY9A6AYFXoxxxd"
+const TRANSFER_VALUE = "1"
+
+const estimate = async (Tezos: TezosToolkit, tokenAddress: string, sender: string) => {
+    const contract = await Tezos.contract.at(tokenAddress);
+
+    const calls = {
+        transfer: contract.methodsObject.transfer({ from: sender, to: RECIPIENT, value: TRANSFER_VALUE }),
+        approve: contract.methodsObject.approve({ spender: RECIPIENT, value: "0" }),
+        increaseAllowance: contract.methodsObject.increaseAllowance({ spender: RECIPIENT, value: "1" }),
+    };
+
+    const result: { [name: string]: number } = {};
+    for (const [name, call] of Object.entries(calls)) {
+        const estimation = await Tezos.estimate.transfer(call.toTransferParams());
+        result[name] = estimation.consumedMilligas / 1000;
+    }
+    return result;
+};
+
+const main = async () => {
+    const Tezos = new TezosToolkit(getEnv('TEZOS_RPC_URL', true));
+
+    Tezos.setProvider({ signer: await InMemorySigner.fromSecretKey(getEnv("BACKED_TOKEN_ADMIN_PRIVATE_KEY")) });
+    const sender = await Tezos.signer.publicKeyHash();
+
+    const lambda = await estimate(Tezos, getEnv('BACKED_TOKEN', true), sender);
+    const native = await estimate(Tezos, getEnv('BACKED_TOKEN_NATIVE', true), sender);
+
+    console.log("action             lambda gas   native gas   saved");
+    for (const name of Object.keys(lambda)) {
+        const saved = lambda[name] - native[name];
+        console.log(`${name.padEnd(18)} ${lambda[name].toFixed(3).padStart(10)}   ${native[name].toFixed(3).padStart(10)}   ${saved.toFixed(3)}`);
+    }
+};
+
+main().catch((error) => {
+    console.log(`Error: ${JSON.stringify(error)}`)
+    process.exit(1)
+});
@@ -0,0 +1,122 @@
+"""
+Splits a CSV snapshot of balances into `importBalances` operations for a deployed BackedToken.
+
+The snapshot is streamed row by row (`address,balance`, balances in the smallest unit of the token,
+an optional header row is skipped) and cut into chunks of `--chunk-size` entries. Each chunk is packed
+by the node and written as an `execute` call, in the same JSON format as `implementation_diff.py`.
+
+The chunking only depends on the snapshot and the chunk size, so an interrupted import is resumed by
+running the driver again with the same arguments: chunks already imported by the token (read from its
+`imported_chunks` view) are skipped, and a chunk sent twice is a no-op for the token.
+
+Usage:
+    python scripts/backed_token/import_balances.py \\
+        --rpc https://ghostnet.tezos.marigold.dev \\
+        --contract KT1... \\
+        --snapshot holders.csv > import.json
+"""
+
+import argparse
+import csv
+import json
+import sys
+import urllib.request
+
+DEFAULT_CHUNK_SIZE = 300
+# Well below the 32 kB limit of an operation, leaving room for the rest of the `execute` call
+DEFAULT_MAX_BYTES = 16384
+
+CHUNK_TYPE = {"prim": "pair", "args": [
+    {"prim": "nat"},
+    {"prim": "list", "args": [{"prim": "pair", "args": [{"prim": "address"}, {"prim": "nat"}]}]},
+]}
+
+
+def rpc(base_url, path, payload=None):
+    data = None if payload is None else json.dumps(payload).encode()
+    request = urllib.request.Request(
+        base_url.rstrip("/") + path, data=data, headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def read_snapshot(path):
+    """Yields the `(address, balance)` rows of the snapshot."""
+    with open(path, newline="") as snapshot_file:
+        for line, row in enumerate(csv.reader(snapshot_file), start=1):
+            if not row:
+                continue
+            address, balance = row[0].strip(), row[1].strip()
+            if line == 1 and not balance.isdigit():
+                continue
+            if not address.startswith(("tz", "KT")) or not balance.isdigit():
+                raise ValueError(f"invalid row {line}: {row}")
+            yield address, int(balance)
+
+
+def chunks(rows, chunk_size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def imported_chunks(rpc_url, contract):
+    return int(rpc(rpc_url, "/chains/main/blocks/head/helpers/scripts/run_script_view", {
+        "contract": contract,
+        "view": "imported_chunks",
+        "input": {"prim": "Unit"},
+        "chain_id": rpc(rpc_url, "/chains/main/chain_id"),
+        "unparsing_mode": "Readable",
+    })["data"]["int"])
+
+
+def pack_chunk(rpc_url, index, entries):
+    data = {"prim": "Pair", "args": [
+        {"int": str(index)},
+        [{"prim": "Pair", "args": [{"string": address}, {"int": str(balance)}]} for address, balance in entries],
+    ]}
+    return rpc(rpc_url, "/chains/main/blocks/head/helpers/scripts/pack_data", {"data": data, "type": CHUNK_TYPE})["packed"]
+
+
+def operations(rpc_url, contract, snapshot, chunk_size=DEFAULT_CHUNK_SIZE, max_bytes=DEFAULT_MAX_BYTES):
+    start = imported_chunks(rpc_url, contract)
+    total = 0
+    for index, entries in enumerate(chunks(read_snapshot(snapshot), chunk_size)):
+        total += sum(balance for _, balance in entries)
+        if index < start:
+            continue
+
+        packed = pack_chunk(rpc_url, index, entries)
+        if len(packed) // 2 > max_bytes:
+            raise ValueError(f"chunk {index} is {len(packed) // 2} bytes, use a smaller --chunk-size")
+
+        yield {
+            "entrypoint": "execute",
+            "value": {"prim": "Pair", "args": [{"string": "importBalances"}, {"bytes": packed}]},
+        }
+
+    print(f"{start} chunk(s) already imported, snapshot total supply {total}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rpc", required=True, help="Tezos node RPC url")
+    parser.add_argument("--contract", required=True, help="address of the deployed token")
+    parser.add_argument("--snapshot", required=True, help="CSV file with one address,balance row per holder")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="number of holders per operation")
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES, help="largest packed chunk allowed")
+    args = parser.parse_args()
+
+    result = list(operations(args.rpc, args.contract, args.snapshot, args.chunk_size, args.max_bytes))
+    json.dump(result, sys.stdout, indent=2)
+    print(f"{len(result)} operation(s) to send", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
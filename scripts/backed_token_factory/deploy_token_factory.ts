@@ -1,15 +1,34 @@
-import { TezosDeployer } from '../helpers/deployer';
+import { TezosDeployer, checkGlobalConstants } from '../helpers/deployer';
+import { getEnv } from '../helpers/config';
 
-const sourceCode = require('../../originations/backed_token_factory/backed_token_factory.json')
-const storage = require('../../originations/backed_token_factory/backed_token_factory.storage.json')
+const useGlobalConstants = getEnv('USE_GLOBAL_CONSTANTS') === 'true'
+
+// Generated by `npm run backed_token_factory:originate` (and `npm run backed_token_factory:constants`), see README
+const BUILD = '../../originations/backed_token_factory/backed_token_factory'
 
 const main = async () => {
     const tezosDeployer = new TezosDeployer();
     await tezosDeployer.init()
 
+    let sourceCode = require(`${BUILD}.json`)
+    let storage = require(`${BUILD}.storage.json`)
+
+    if (useGlobalConstants) {
+        const constants = require(`${BUILD}.constants.json`)
+        const constSourceCode = require(`${BUILD}.const.json`)
+        const constStorage = require(`${BUILD}.storage.const.json`)
+
+        checkGlobalConstants(constants, constSourceCode, constStorage, sourceCode, storage)
+        await tezosDeployer.registerGlobalConstants(constants)
+        await tezosDeployer.checkOrigination(constSourceCode, constStorage)
+
+        sourceCode = constSourceCode
+        storage = constStorage
+    }
+
     await tezosDeployer.deploy(sourceCode, storage)
 };
 
 main().then(() => {
     console.log("🌱 Backed Token Factory sucessfully deployed");
-});
\ No newline at end of file
+});
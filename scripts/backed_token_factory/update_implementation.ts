@@ -2,7 +2,7 @@ import { InMemorySigner } from '@taquito/signer';
 
 import { TezosToolkit } from '@taquito/taquito';
 
-import { updateImplementationSchema } from './schemas/update_implementation.schema'
+import { entrypointSchema } from '../helpers/schema'
 import { getEnv } from "../helpers/config"
 
 const MICHELSON_CODE: any[] = []
@@ -12,13 +12,12 @@ const main = async () => {
 
     Tezos.setProvider({ signer: await InMemorySigner.fromSecretKey(getEnv("BACKED_TOKEN_FACTORY_ADMIN_PRIVATE_KEY")) });
 
-    const data = updateImplementationSchema.Execute(MICHELSON_CODE);
-
-    debugger
     try {
         const contract = await Tezos.contract
             .at(getEnv('BACKED_TOKEN_FACTORY'))
 
+        const data = entrypointSchema(contract, 'updateImplementation').Execute(MICHELSON_CODE);
+
         const operation = await contract.methods.updateImplementation(data).send();
 
 
@@ -13,6 +13,36 @@ export class TezosDeployer {
         this.tezos.setProvider({ signer: await InMemorySigner.fromSecretKey(getEnv("TEZOS_DEPLOYER_PRIVATE_KEY")) });
     }
 
+    async registerGlobalConstants(constants: { hash: string, value: any }[]) {
+        for (const constant of constants) {
+            try {
+                const registration = await this.tezos.contract.registerGlobalConstant({ value: constant.value });
+
+                await registration.confirmation();
+
+                if (registration.globalConstantHash !== constant.hash) {
+                    throw new Error(`Registered ${registration.globalConstantHash} instead of ${constant.hash}`);
+                }
+                console.log(`Global Constant: ${constant.hash}`);
+            } catch (err) {
+                // Constants are content-addressed, so one registered by a previous deployment is reused as is
+                if (!isAlreadyRegistered(err)) {
+                    throw err;
+                }
+                console.log(`Global Constant ${constant.hash} already registered`);
+            }
+        }
+    }
+
+    // Dry-runs the origination on the node, so code or storage referring to a missing constant fails before anything is originated
+    async checkOrigination(sourceCode: any, storage: any) {
+        const estimate = await this.tezos.estimate.originate({
+            code: sourceCode,
+            init: storage
+        });
+        console.log(`Origination check: ${estimate.storageLimit} bytes of storage`);
+    }
+
     async deploy(sourceCode: any, storage: string) {
         try {
             const origination = await this.tezos.contract
@@ -30,4 +60,40 @@ export class TezosDeployer {
             console.log(err)
         }
     }
-}
\ No newline at end of file
+}
+
+const isAlreadyRegistered = (err: any): boolean =>
+    /Expression_already_registered/.test(`${err?.id ?? ''} ${err?.message ?? ''} ${JSON.stringify(err?.errors ?? [])}`);
+
+const expandGlobalConstants = (node: any, constants: Map<string, any>): any => {
+    if (Array.isArray(node)) {
+        return node.map((item) => expandGlobalConstants(item, constants));
+    }
+    if (node.prim === 'constant') {
+        const hash = node.args[0].string;
+        if (!constants.has(hash)) {
+            throw new Error(`Unknown global constant ${hash}`);
+        }
+        return expandGlobalConstants(constants.get(hash), constants);
+    }
+    if (node.args) {
+        return { ...node, args: node.args.map((arg: any) => expandGlobalConstants(arg, constants)) };
+    }
+    return node;
+};
+
+// Fails unless expanding the constants in the code and storage gives back exactly the original contract
+export const checkGlobalConstants = (
+    constants: { hash: string, value: any }[],
+    constCode: any, constStorage: any,
+    code: any, storage: any
+) => {
+    const byHash = new Map(constants.map((constant): [string, any] => [constant.hash, constant.value]));
+
+    if (JSON.stringify(expandGlobalConstants(constCode, byHash)) !== JSON.stringify(code)) {
+        throw new Error('Code with global constants does not expand to the original code');
+    }
+    if (JSON.stringify(expandGlobalConstants(constStorage, byHash)) !== JSON.stringify(storage)) {
+        throw new Error('Storage with global constants does not expand to the original storage');
+    }
+};
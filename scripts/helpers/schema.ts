@@ -0,0 +1,14 @@
+import { Schema } from "@taquito/michelson-encoder";
+import { ContractAbstraction, ContractProvider } from "@taquito/taquito";
+
+// Schemas are built from the parameter type of the contract being called, so values are always
+// encoded against its current storage type instead of a copy that has to be kept in sync by hand
+export const entrypointSchema = (contract: ContractAbstraction<ContractProvider>, entrypoint: string): Schema => {
+    const parameterType = contract.entrypoints.entrypoints[entrypoint];
+
+    if (!parameterType) {
+        throw new Error(`Contract ${contract.address} has no %${entrypoint} entrypoint`);
+    }
+
+    return new Schema(parameterType);
+};
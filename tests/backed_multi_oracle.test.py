@@ -0,0 +1,184 @@
+import smartpy as sp
+
+from contracts.backed_multi_oracle import BackedMultiOracleModule
+from contracts.backed_multi_oracle_forwarder import BackedMultiOracleForwarderModule
+from contracts.storage.backed_oracle import BackedOracleStorageModule
+from contracts.storage.backed_multi_oracle import BackedMultiOracleStorageModule
+from contracts.utils.round_buffer import RoundBufferModule
+from contracts.utils.ownable import OwnableModule
+
+from contracts.actions.oracle.update_answer import UpdateAnswerModule
+from contracts.actions.multi_oracle.update_answers import UpdateAnswersModule
+from contracts.actions.multi_oracle.add_feed import AddFeedModule
+
+@sp.module
+def TestModule():
+    RANDOM_CONSTANT = "const"
+
+if "templates" not in __name__:
+    @sp.add_test(name="backed_multi_oracle")
+    def test():
+        sc = sp.test_scenario([
+            OwnableModule,
+            BackedOracleStorageModule,
+            BackedMultiOracleStorageModule,
+            RoundBufferModule,
+            UpdateAnswerModule,
+            UpdateAnswersModule,
+            AddFeedModule,
+            BackedMultiOracleModule,
+            BackedMultiOracleForwarderModule,
+            TestModule
+        ])
+        sc.h1("Backed Multi Oracle")
+
+        # sp.test_account generates ED25519 key-pairs deterministically:
+        admin = sp.test_account("Administrator")
+        alice = sp.test_account("Alice")
+
+        error = "No data present"
+        metadata = sp.utils.metadata_of_url(
+            "ipfs://QmaiAUj1FFNGYTu8rLBjc3eeN9cSKwaF8EGMBNDmhzPNFd"
+        )
+        oracle = BackedMultiOracleModule.BackedMultiOracle(
+            owner=admin.address,
+            metadata=metadata,
+            implementation=sp.big_map({
+                "updateAnswers": sp.record(action=UpdateAnswersModule.updateAnswers, only_admin=False),
+                "addFeed": sp.record(action=AddFeedModule.addFeed, only_admin=True),
+            }),
+            updater=admin.address,
+            retention=2
+        )
+        sc += oracle
+
+        forwarder = BackedMultiOracleForwarderModule.BackedMultiOracleForwarder(owner=admin.address, upstreamOracle=oracle.address, feedId="bIB01")
+        sc += forwarder
+
+        sc.h1("Add feeds")
+        sc.h2("Sender is not admin")
+        oracle.execute(actionName="addFeed", data=sp.pack(sp.record(feedId="bIB01", decimals="18", description="bIB01 / USD"))).run(sender=alice, valid=False, exception="BACKED_ORACLE_NotAdmin")
+
+        sc.h2("Sender is admin")
+        oracle.execute(actionName="addFeed", data=sp.pack(sp.record(feedId="bIB01", decimals="18", description="bIB01 / USD"))).run(sender=admin)
+        oracle.execute(actionName="addFeed", data=sp.pack(sp.record(feedId="bCSPX", decimals="8", description="bCSPX / USD"))).run(sender=admin)
+
+        sc.h2("Feed already exists")
+        oracle.execute(actionName="addFeed", data=sp.pack(sp.record(feedId="bIB01", decimals="8", description="bIB01 / EUR"))).run(sender=admin, valid=False, exception="BACKED_ORACLE_FeedAlreadyExists")
+
+        sc.h1("Views - no answer data")
+        sc.verify(sc.compute(oracle.decimals("bCSPX")) == "8")
+        sc.verify(sc.compute(forwarder.description()) == "bIB01 / USD")
+
+        e = sp.catch_exception(oracle.latestAnswer("bIB01"))
+        sc.verify(e == sp.some(error))
+        e = sp.catch_exception(forwarder.latestRoundData())
+        sc.verify(e == sp.some(error))
+        e = sp.catch_exception(oracle.latestAnswer("bTSLA"))
+        sc.verify(e == sp.some("BACKED_ORACLE_UnknownFeed"))
+
+        sc.h1("Update answers")
+        time = sp.timestamp(10000)
+        timestamp = time.add_seconds(-100)
+
+        sc.h2("Sender has not have an Updater role")
+        oracle.execute(actionName="updateAnswers", data=sp.pack([
+            sp.record(feedId="bIB01", newAnswer=100, newTimestamp=timestamp),
+        ])).run(sender=alice, now=time, valid=False, exception="BACKED_ORACLE_NotUpdater")
+
+        sc.h2("Unknown feed fails the whole update")
+        oracle.execute(actionName="updateAnswers", data=sp.pack([
+            sp.record(feedId="bIB01", newAnswer=100, newTimestamp=timestamp),
+            sp.record(feedId="bTSLA", newAnswer=200, newTimestamp=timestamp),
+        ])).run(sender=admin, now=time, valid=False, exception="BACKED_ORACLE_UnknownFeed")
+
+        sc.h2("All feeds in one operation")
+        oracle.execute(actionName="updateAnswers", data=sp.pack([
+            sp.record(feedId="bIB01", newAnswer=100, newTimestamp=timestamp),
+            sp.record(feedId="bCSPX", newAnswer=400, newTimestamp=timestamp),
+        ])).run(sender=admin, now=time)
+
+        sc.verify(sc.compute(oracle.latestAnswer("bIB01")) == 100)
+        sc.verify(sc.compute(oracle.latestAnswer("bCSPX")) == 400)
+        sc.verify(sc.compute(oracle.latestRound("bCSPX")) == 1)
+
+        sc.h2("Staleness is checked per feed")
+        time = time.add_seconds(3601)
+        timestamp = time.add_seconds(-100)
+        oracle.execute(actionName="updateAnswers", data=sp.pack([
+            sp.record(feedId="bIB01", newAnswer=101, newTimestamp=timestamp),
+            sp.record(feedId="bCSPX", newAnswer=401, newTimestamp=time.add_seconds(-301)),
+        ])).run(sender=admin, now=time, valid=False, exception="Timestamp is too old")
+
+        sc.h2("Feeds are updated independently")
+        oracle.execute(actionName="updateAnswers", data=sp.pack([
+            sp.record(feedId="bIB01", newAnswer=101, newTimestamp=timestamp),
+        ])).run(sender=admin, now=time)
+
+        sc.verify(sc.compute(oracle.latestRound("bIB01")) == 2)
+        sc.verify(sc.compute(oracle.latestRound("bCSPX")) == 1)
+
+        sc.h2("Deviation is limited per feed")
+        time = time.add_seconds(3601)
+        timestamp = time.add_seconds(-100)
+        oracle.execute(actionName="updateAnswers", data=sp.pack([
+            sp.record(feedId="bIB01", newAnswer=200, newTimestamp=timestamp),
+            sp.record(feedId="bCSPX", newAnswer=300, newTimestamp=timestamp),
+        ])).run(sender=admin, now=time)
+
+        sc.verify(sc.compute(oracle.latestAnswer("bIB01")) == 111)
+        sc.verify(sc.compute(oracle.latestAnswer("bCSPX")) == 360)
+
+        sc.h1("Views - data available")
+        sc.verify(sc.compute(oracle.latestRoundData("bIB01")) == sp.record(
+            roundId=sp.nat(3),
+            answer=sp.int(111),
+            startedAt=timestamp,
+            updatedAt=timestamp,
+            answeredInRound=sp.nat(3)
+        ))
+        sc.verify(sc.compute(oracle.getAnswer(sp.record(feedId="bCSPX", roundId=1))) == 400)
+        sc.verify(sc.compute(oracle.getRoundData(sp.record(feedId="bIB01", roundId=2))).answer == 101)
+
+        sc.h2("Evicted rounds")
+        e = sp.catch_exception(oracle.getAnswer(sp.record(feedId="bIB01", roundId=1)))
+        sc.verify(e == sp.some("Round pruned"))
+
+        sc.h2("Round range")
+        rounds = sc.compute(oracle.getRoundRange(sp.record(feedId="bIB01", fromRound=2, count=5)))
+        sc.verify_equal(rounds.rounds, [
+            sc.compute(oracle.getRoundData(sp.record(feedId="bIB01", roundId=2))),
+            sc.compute(oracle.getRoundData(sp.record(feedId="bIB01", roundId=3)))
+        ])
+        sc.verify(rounds.nextRound.is_none())
+        e = sp.catch_exception(oracle.getRoundRange(sp.record(feedId="bIB01", fromRound=1, count=2)))
+        sc.verify(e == sp.some("Round pruned"))
+
+        sc.h2("Time-weighted average per feed")
+        # bIB01 answered 101 for the 3601s between rounds 2 and 3, bCSPX answered 400 until its round 2
+        sc.verify(sc.compute(oracle.twap(sp.record(feedId="bIB01", fromRound=2, toRound=3))) == 101)
+        sc.verify(sc.compute(oracle.twap(sp.record(feedId="bCSPX", fromRound=1, toRound=2))) == 400)
+        e = sp.catch_exception(oracle.twap(sp.record(feedId="bIB01", fromRound=3, toRound=3)))
+        sc.verify(e == sp.some("Invalid round range"))
+        e = sp.catch_exception(oracle.twap(sp.record(feedId="bTSLA", fromRound=1, toRound=2)))
+        sc.verify(e == sp.some("BACKED_ORACLE_UnknownFeed"))
+
+        sc.h1("Forwarder")
+        sc.verify(sc.compute(forwarder.decimals()) == "18")
+        sc.verify(sc.compute(forwarder.latestAnswer()) == 111)
+        sc.verify(sc.compute(forwarder.latestTimestamp()) == timestamp)
+        sc.verify(sc.compute(forwarder.latestRound()) == 3)
+        sc.verify(sc.compute(forwarder.getAnswer(2)) == 101)
+        sc.verify(sc.compute(forwarder.getRoundData(3)).answer == 111)
+        e = sp.catch_exception(forwarder.getRoundData(1))
+        sc.verify(e == sp.some("Round pruned"))
+        sc.verify(sc.compute(forwarder.twap(sp.record(fromRound=2, toRound=3))) == 101)
+        rounds = sc.compute(forwarder.getRoundRange(sp.record(fromRound=2, count=1)))
+        sc.verify(sp.len(rounds.rounds) == 1)
+        sc.verify(rounds.nextRound.is_none())
+
+        sc.h2("Set upstream feed")
+        forwarder.setUpstreamOracle(upstreamOracle=oracle.address, feedId="bCSPX").run(sender=alice, valid=False, exception="BACKED_ORACLE_FORWARDER_NotOwner")
+        forwarder.setUpstreamOracle(upstreamOracle=oracle.address, feedId="bCSPX").run(sender=admin)
+        sc.verify(sc.compute(forwarder.latestAnswer()) == 360)
+        sc.verify(sc.compute(forwarder.decimals()) == "8")
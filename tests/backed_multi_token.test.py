@@ -0,0 +1,265 @@
+import smartpy as sp
+from contracts.backed_multi_token import BackedMultiTokenModule
+from contracts.utils.ownable import OwnableModule
+from contracts.utils.pausable import PausableModule
+from contracts.utils.nonce import NonceModule
+
+from contracts.actions.multi_token.transfer import MultiTokenTransferModule
+from contracts.actions.multi_token.update_operators import MultiTokenUpdateOperatorsModule
+from contracts.actions.multi_token.mint import MultiTokenMintModule
+from contracts.actions.multi_token.burn import MultiTokenBurnModule
+from contracts.actions.multi_token.set_minter import MultiTokenSetMinterModule
+from contracts.actions.multi_token.set_burner import MultiTokenSetBurnerModule
+from contracts.actions.multi_token.permit import MultiTokenPermitModule
+from contracts.actions.multi_token.delegated_transfer import MultiTokenDelegatedTransferModule
+from contracts.actions.multi_token.set_terms import MultiTokenSetTermsModule
+from contracts.actions.multi_token.set_delegate_mode import MultiTokenSetDelegateModeModule
+from contracts.actions.multi_token.set_delegate_whitelist import MultiTokenSetDelegateWhitelistModule
+from contracts.storage.backed_multi_token import BackedMultiTokenStorageModule
+
+@sp.module
+def TestModule():
+    class Viewer_balances(sp.Contract):
+        def __init__(self):
+            self.data.last = sp.cast(None, sp.option[sp.list[BackedMultiTokenStorageModule.BalanceOfResponse]])
+
+        @sp.entrypoint
+        def target(self, params):
+            self.data.last = sp.Some(params)
+
+    @sp.effects()
+    def transfer(storage, data):
+        sp.cast(storage, BackedMultiTokenStorageModule.BackedMultiTokenHot)
+        sp.cast(data, sp.bytes)
+
+        return storage
+
+if "templates" not in __name__:
+    @sp.add_test(name="backed_multi_token")
+    def test():
+        sc = sp.test_scenario([
+            OwnableModule,
+            PausableModule,
+            NonceModule,
+            BackedMultiTokenStorageModule,
+            MultiTokenTransferModule,
+            MultiTokenUpdateOperatorsModule,
+            MultiTokenMintModule,
+            MultiTokenBurnModule,
+            MultiTokenSetMinterModule,
+            MultiTokenSetBurnerModule,
+            MultiTokenPermitModule,
+            MultiTokenDelegatedTransferModule,
+            MultiTokenSetTermsModule,
+            MultiTokenSetDelegateModeModule,
+            MultiTokenSetDelegateWhitelistModule,
+            BackedMultiTokenModule,
+            TestModule
+        ])
+        sc.h1("Backed Multi Token Implementation")
+
+        # sp.test_account generates ED25519 key-pairs deterministically:
+        admin = sp.test_account("Administrator")
+        alice = sp.test_account("Alice")
+        bob = sp.test_account("Robert")
+        carl = sp.test_account("Carl")
+
+        sc.h1("Accounts")
+        sc.show([admin, alice, bob, carl])
+
+        sc.h1("Contract")
+        contract_metadata = sp.utils.metadata_of_url(
+            "ipfs://QmaiAUj1FFNGYTu8rLBjc3eeN9cSKwaF8EGMBNDmhzPNFd"
+        )
+        ib01_metadata = {
+            "decimals": sp.utils.bytes_of_string("18"),
+            "name": sp.utils.bytes_of_string("Backed IB01 $ Treasury Bond 0-1yr"),
+            "symbol": sp.utils.bytes_of_string("bIB01"),
+        }
+        cspx_metadata = {
+            "decimals": sp.utils.bytes_of_string("18"),
+            "name": sp.utils.bytes_of_string("Backed CSPX Core S&P 500"),
+            "symbol": sp.utils.bytes_of_string("bCSPX"),
+        }
+
+        c1 = BackedMultiTokenModule.BackedMultiToken(
+            owner=admin.address,
+            metadata=contract_metadata,
+            implementation=sp.big_map({
+                "mint": sp.record(action=sp.variant("hot", MultiTokenMintModule.mint), only_admin=False),
+                "burn": sp.record(action=sp.variant("hot", MultiTokenBurnModule.burn), only_admin=False),
+                "setMinter": sp.record(action=sp.variant("hot", MultiTokenSetMinterModule.setMinter), only_admin=True),
+                "setBurner": sp.record(action=sp.variant("hot", MultiTokenSetBurnerModule.setBurner), only_admin=True),
+                "permit": sp.record(action=sp.variant("full", MultiTokenPermitModule.permit), only_admin=False),
+                "delegatedTransfer": sp.record(action=sp.variant("full", MultiTokenDelegatedTransferModule.delegatedTransfer), only_admin=False),
+                "setTerms": sp.record(action=sp.variant("cold", MultiTokenSetTermsModule.setTerms), only_admin=True),
+                "setDelegateMode": sp.record(action=sp.variant("cold", MultiTokenSetDelegateModeModule.setDelegateMode), only_admin=True),
+                "setDelegateWhitelist": sp.record(action=sp.variant("cold", MultiTokenSetDelegateWhitelistModule.setDelegateWhitelist), only_admin=True),
+            }),
+            pauser=admin.address
+        )
+        sc += c1
+
+        sc.h2("Add assets")
+        c1.addToken(token_id=0, token_info=ib01_metadata, minter=admin.address, burner=admin.address).run(sender=alice, valid=False, exception="BACKED_TOKEN_NotOwner")
+        c1.addToken(token_id=0, token_info=ib01_metadata, minter=admin.address, burner=admin.address).run(sender=admin)
+        c1.addToken(token_id=1, token_info=cspx_metadata, minter=bob.address, burner=bob.address).run(sender=admin)
+        c1.addToken(token_id=1, token_info=cspx_metadata, minter=bob.address, burner=bob.address).run(sender=admin, valid=False, exception="BACKED_TOKEN_TokenAlreadyExists")
+
+        sc.verify(c1.data.storage.hot.supply[0] == 0)
+        sc.verify(c1.data.storage.cold.token_metadata[1].token_info["symbol"] == sp.utils.bytes_of_string("bCSPX"))
+
+        sc.h2("Mint")
+        c1.execute(actionName="mint", data=sp.pack(sp.record(token_id=0, address=alice.address, value=10))).run(sender=admin)
+        c1.execute(actionName="mint", data=sp.pack(sp.record(token_id=1, address=alice.address, value=20))).run(sender=admin, valid=False, exception="BACKED_TOKEN_Mint_NotMinter")
+        c1.execute(actionName="mint", data=sp.pack(sp.record(token_id=1, address=alice.address, value=20))).run(sender=bob)
+        c1.execute(actionName="mint", data=sp.pack(sp.record(token_id=2, address=alice.address, value=20))).run(sender=bob, valid=False, exception="FA2_TOKEN_UNDEFINED")
+
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=alice.address, token_id=0)] == 10)
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=alice.address, token_id=1)] == 20)
+        sc.verify(c1.data.storage.hot.supply[1] == 20)
+
+        sc.h2("Batched transfer across assets")
+        c1.transfer([
+            sp.record(from_=alice.address, txs=[
+                sp.record(to_=bob.address, token_id=0, amount=4),
+                sp.record(to_=bob.address, token_id=1, amount=5),
+                sp.record(to_=carl.address, token_id=1, amount=15),
+            ])
+        ]).run(sender=alice)
+
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=alice.address, token_id=0)] == 6)
+        sc.verify(c1.data.storage.hot.ledger.contains(sp.record(owner=alice.address, token_id=1)) == False)
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=bob.address, token_id=0)] == 4)
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=bob.address, token_id=1)] == 5)
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=carl.address, token_id=1)] == 15)
+
+        sc.h2("Transfer failures")
+        c1.transfer([sp.record(from_=alice.address, txs=[sp.record(to_=bob.address, token_id=0, amount=7)])]).run(sender=alice, valid=False, exception="FA2_INSUFFICIENT_BALANCE")
+        c1.transfer([sp.record(from_=alice.address, txs=[sp.record(to_=bob.address, token_id=2, amount=1)])]).run(sender=alice, valid=False, exception="FA2_TOKEN_UNDEFINED")
+        c1.transfer([sp.record(from_=alice.address, txs=[sp.record(to_=bob.address, token_id=0, amount=1)])]).run(sender=bob, valid=False, exception="FA2_NOT_OPERATOR")
+
+        sc.h2("Operators")
+        c1.update_operators([
+            sp.variant("add_operator", sp.record(owner=alice.address, operator=bob.address, token_id=0))
+        ]).run(sender=bob, valid=False, exception="FA2_NOT_OWNER")
+        c1.update_operators([
+            sp.variant("add_operator", sp.record(owner=alice.address, operator=bob.address, token_id=0))
+        ]).run(sender=alice)
+        c1.transfer([sp.record(from_=alice.address, txs=[sp.record(to_=bob.address, token_id=0, amount=1)])]).run(sender=bob)
+        c1.transfer([sp.record(from_=carl.address, txs=[sp.record(to_=bob.address, token_id=1, amount=1)])]).run(sender=bob, valid=False, exception="FA2_NOT_OPERATOR")
+
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=bob.address, token_id=0)] == 5)
+
+        c1.update_operators([
+            sp.variant("remove_operator", sp.record(owner=alice.address, operator=bob.address, token_id=0))
+        ]).run(sender=alice)
+        c1.transfer([sp.record(from_=alice.address, txs=[sp.record(to_=bob.address, token_id=0, amount=1)])]).run(sender=bob, valid=False, exception="FA2_NOT_OPERATOR")
+
+        sc.h2("Balance of")
+        view_balances = TestModule.Viewer_balances()
+        sc += view_balances
+        target = sp.contract(sp.list[BackedMultiTokenStorageModule.BalanceOfResponse], view_balances.address, entrypoint="target").unwrap_some()
+
+        c1.balance_of(sp.record(requests=[
+            sp.record(owner=alice.address, token_id=0),
+            sp.record(owner=alice.address, token_id=1),
+            sp.record(owner=carl.address, token_id=1),
+        ], callback=target)).run(sender=alice)
+        sc.verify_equal(view_balances.data.last, sp.Some([
+            sp.record(request=sp.record(owner=alice.address, token_id=0), balance=5),
+            sp.record(request=sp.record(owner=alice.address, token_id=1), balance=0),
+            sp.record(request=sp.record(owner=carl.address, token_id=1), balance=15),
+        ]))
+
+        c1.balance_of(sp.record(requests=[sp.record(owner=alice.address, token_id=2)], callback=target)).run(sender=alice, valid=False, exception="FA2_TOKEN_UNDEFINED")
+
+        sc.h2("Burn")
+        c1.execute(actionName="burn", data=sp.pack(sp.record(token_id=1, address=carl.address, value=5))).run(sender=admin, valid=False, exception="BACKED_TOKEN_Burn_NotBurner")
+        c1.execute(actionName="burn", data=sp.pack(sp.record(token_id=1, address=carl.address, value=5))).run(sender=bob)
+
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=carl.address, token_id=1)] == 10)
+        sc.verify(c1.data.storage.hot.supply[1] == 15)
+
+        sc.h2("Roles")
+        c1.execute(actionName="setMinter", data=sp.pack(sp.record(token_id=1, address=carl.address))).run(sender=bob, valid=False, exception="BACKED_TOKEN_NotAdmin")
+        c1.execute(actionName="setMinter", data=sp.pack(sp.record(token_id=1, address=carl.address))).run(sender=admin)
+        c1.execute(actionName="setBurner", data=sp.pack(sp.record(token_id=1, address=carl.address))).run(sender=admin)
+
+        sc.verify(c1.data.storage.hot.roles[1].minter == carl.address)
+        sc.verify(c1.data.storage.hot.roles[1].burner == carl.address)
+        sc.verify(c1.data.storage.hot.roles[0].minter == admin.address)
+
+        sc.h2("Pause")
+        c1.setPause(True).run(sender=admin)
+        c1.transfer([sp.record(from_=alice.address, txs=[sp.record(to_=bob.address, token_id=0, amount=1)])]).run(sender=alice, valid=False, exception="BACKED_TOKEN_Paused")
+        c1.update_operators([
+            sp.variant("add_operator", sp.record(owner=alice.address, operator=bob.address, token_id=0))
+        ]).run(sender=alice, valid=False, exception="BACKED_TOKEN_Paused")
+        c1.execute(actionName="mint", data=sp.pack(sp.record(token_id=0, address=alice.address, value=1))).run(sender=admin, valid=False, exception="BACKED_TOKEN_Paused")
+        c1.setPause(False).run(sender=admin)
+
+        sc.h2("Cold actions")
+        c1.execute(actionName="setTerms", data=sp.pack("https://example.com/terms")).run(sender=admin)
+        sc.verify(c1.data.storage.cold.terms == "https://example.com/terms")
+        c1.execute(actionName="setDelegateWhitelist", data=sp.pack(sp.record(address=carl.address, status=True))).run(sender=admin)
+        sc.verify(c1.data.storage.cold.delegateWhitelist[carl.address])
+        c1.execute(actionName="setDelegateWhitelist", data=sp.pack(sp.record(address=carl.address, status=False))).run(sender=admin)
+
+        sc.h2("Permit")
+        deadline = sp.timestamp(1571761676)
+        now = sp.timestamp(1571761674)
+        permit_message = sp.pack(sp.record(
+            deadline=deadline, operator=bob.address, token_id=0, enabled=True, nonce=0))
+        sig_from_alice = sp.make_signature(
+            secret_key=alice.secret_key,
+            message=permit_message,
+            message_format="Raw",
+        )
+        permit = sp.pack(sp.record(owner=alice.public_key, operator=bob.address, token_id=0, enabled=True, deadline=deadline, signature=sig_from_alice))
+
+        c1.execute(actionName="permit", data=permit).run(sender=carl, now=now, valid=False, exception="BACKED_TOKEN_Permit_UnauthorizedDelegate")
+        c1.execute(actionName="setDelegateMode", data=sp.pack(True)).run(sender=admin)
+        c1.execute(actionName="permit", data=permit).run(sender=carl, now=sp.timestamp(1571761677), valid=False, exception="BACKED_TOKEN_Permit_ExpiredSignature")
+        c1.execute(actionName="permit", data=permit).run(sender=carl, now=now)
+        c1.execute(actionName="permit", data=permit).run(sender=carl, now=now, valid=False, exception="BACKED_TOKEN_Permit_InvalidSigner")
+
+        sc.verify(c1.data.storage.hot.operators.contains(sp.record(owner=alice.address, operator=bob.address, token_id=0)))
+        sc.verify(c1.data.storage.cold.nonce[alice.address] == 1)
+
+        sc.h2("Delegated transfer")
+        transfer_message = sp.pack(sp.record(
+            deadline=deadline, to_=carl.address, token_id=0, amount=2, nonce=1))
+        sig_from_alice = sp.make_signature(
+            secret_key=alice.secret_key,
+            message=transfer_message,
+            message_format="Raw",
+        )
+        c1.execute(actionName="delegatedTransfer", data=sp.pack(sp.record(
+            owner=alice.public_key, to_=carl.address, token_id=0, amount=2, deadline=deadline, signature=sig_from_alice
+        ))).run(sender=bob, now=now)
+
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=alice.address, token_id=0)] == 3)
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=carl.address, token_id=0)] == 2)
+
+        sc.h2("Transfer can be replaced by a lambda")
+        c1.setAction(name="transfer", entry=sp.record(action=sp.variant("hot", TestModule.transfer), only_admin=False)).run(sender=alice, valid=False, exception="BACKED_TOKEN_NotOwner")
+        c1.setAction(name="transfer", entry=sp.record(action=sp.variant("hot", TestModule.transfer), only_admin=False)).run(sender=admin)
+        c1.transfer([sp.record(from_=alice.address, txs=[sp.record(to_=bob.address, token_id=0, amount=1)])]).run(sender=alice)
+
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=alice.address, token_id=0)] == 3)
+
+        sc.h2("Upgrader")
+        c1.setUpgrader(carl.address).run(sender=admin)
+        c1.updateActions([sp.record(name="transfer", entry=None)]).run(sender=bob, valid=False, exception="BACKED_TOKEN_NotUpgrader")
+        c1.updateActions([sp.record(name="transfer", entry=None)]).run(sender=carl)
+        c1.transfer([sp.record(from_=alice.address, txs=[sp.record(to_=bob.address, token_id=0, amount=1)])]).run(sender=alice)
+
+        sc.verify(c1.data.storage.hot.ledger[sp.record(owner=alice.address, token_id=0)] == 2)
+
+        sc.h2("Token metadata")
+        c1.updateTokenMetadata(token_id=2, token_info=cspx_metadata).run(sender=admin, valid=False, exception="FA2_TOKEN_UNDEFINED")
+        c1.updateTokenMetadata(token_id=0, token_info=cspx_metadata).run(sender=alice, valid=False, exception="BACKED_TOKEN_NotOwner")
+        c1.updateTokenMetadata(token_id=0, token_info=cspx_metadata).run(sender=admin)
+
+        sc.verify(c1.data.storage.cold.token_metadata[0].token_info["symbol"] == sp.utils.bytes_of_string("bCSPX"))
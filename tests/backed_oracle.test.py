@@ -2,7 +2,9 @@ import smartpy as sp
 
 from contracts.backed_oracle import BackedOracleModule
 from contracts.storage.backed_oracle import BackedOracleStorageModule
+from contracts.utils.round_buffer import RoundBufferModule
 from contracts.utils.ownable import OwnableModule
+from contracts.implementation_registry import ImplementationRegistryModule
 
 from contracts.actions.oracle.update_answer import UpdateAnswerModule
 
@@ -15,7 +17,9 @@ if "templates" not in __name__:
     def test():
         sc = sp.test_scenario([
             OwnableModule,
+            ImplementationRegistryModule,
             BackedOracleStorageModule,
+            RoundBufferModule,
             UpdateAnswerModule,
             BackedOracleModule,
             TestModule
@@ -41,6 +45,7 @@ if "templates" not in __name__:
             updater=admin.address,
             decimals=decimals,
             description=description,
+            retention=0,
             metadata=metadata
         )
 
@@ -168,6 +173,13 @@ if "templates" not in __name__:
             answeredInRound=sp.nat(4)
         ))
 
+        sc.h2("Latest round is cached inline")
+        # latestAnswer, latestTimestamp and latestRoundData read `latest` instead of indexing the `roundData` big_map
+        # (twice for latestRoundData), so `latest` has to match the latest stored round
+        sc.verify(oracle.data.storage.latest == oracle.data.storage.roundData[4])
+        sc.verify(oracle.data.storage.latest.answer == valid_answer)
+        sc.verify(oracle.data.storage.latest.timestamp == valid_timestamp)
+
         sc.h2("Get Answer")
         getAnswer_view_result = sc.compute(oracle.getAnswer(1), source=alice)
 
@@ -196,5 +208,116 @@ if "templates" not in __name__:
         sc.h2("Sender is not admin")
         oracle.updateImplementation(updatedImplementation).run(sender=admin)
 
+        sc.h2("Single action update")
 
+        sc.h2("Sender is not admin")
+        oracle.setAction(name="updateAnswer", entry=sp.record(action=UpdateAnswerModule.updateAnswer, only_admin=True)).run(sender=alice, valid=False)
+        oracle.removeAction("updateAnswer").run(sender=alice, valid=False)
 
+        sc.h2("Sender is admin")
+        oracle.setAction(name="updateAnswer", entry=sp.record(action=UpdateAnswerModule.updateAnswer, only_admin=True)).run(sender=admin)
+        sc.verify(oracle.data.implementation["updateAnswer"].only_admin == True)
+        oracle.removeAction("updateAnswer").run(sender=admin)
+        sc.verify(oracle.data.implementation.contains("updateAnswer") == False)
+
+        sc.h1("Round retention")
+        ring = BackedOracleModule.BackedOracle(
+            owner=admin.address,
+            implementation = implementation,
+            updater=admin.address,
+            decimals=decimals,
+            description=description,
+            retention=2,
+            metadata=metadata
+        )
+        sc += ring
+
+        time = sp.timestamp(10000)
+        for answer in [10, 11, 12]:
+            ring.execute(actionName="updateAnswer", data=sp.pack(sp.record(newAnswer=answer, newTimestamp=time.add_seconds(-100)))).run(sender=admin, now=time)
+            time = time.add_seconds(3601)
+
+        sc.h2("Rounds are stored modulo the retention")
+        sc.verify(sc.compute(ring.retention()) == 2)
+        sc.verify(sc.compute(ring.latestRound()) == 3)
+        sc.verify(ring.data.storage.roundData.contains(2) == False)
+        sc.verify(ring.data.storage.roundData[0].answer == 11)
+        sc.verify(ring.data.storage.roundData[1].answer == 12)
+
+        sc.h2("Retained rounds")
+        sc.verify(sc.compute(ring.getAnswer(2)) == 11)
+        sc.verify(sc.compute(ring.getRoundData(3)).answer == 12)
+        sc.verify(sc.compute(ring.latestAnswer()) == 12)
+
+        sc.h2("Evicted rounds")
+        e = sp.catch_exception(ring.getAnswer(1))
+        sc.verify(e == sp.some("Round pruned"))
+        e = sp.catch_exception(ring.getRoundData(1))
+        sc.verify(e == sp.some("Round pruned"))
+
+        sc.h2("Rounds not present yet")
+        e = sp.catch_exception(ring.getAnswer(4))
+        sc.verify(e == sp.some(error))
+        sc.verify(ring.data.storage.latest == ring.data.storage.roundData[1])
+
+        sc.h1("Round range")
+        sc.h2("Slice of rounds")
+        rounds = sc.compute(oracle.getRoundRange(sp.record(fromRound=2, count=2)))
+        sc.verify_equal(rounds.rounds, [sc.compute(oracle.getRoundData(2)), sc.compute(oracle.getRoundData(3))])
+        sc.verify(rounds.nextRound.is_none())
+
+        sc.h2("Range is capped to the latest round")
+        rounds = sc.compute(oracle.getRoundRange(sp.record(fromRound=3, count=10)))
+        sc.verify(sp.len(rounds.rounds) == 2)
+        sc.verify(rounds.nextRound.is_none())
+        rounds = sc.compute(oracle.getRoundRange(sp.record(fromRound=5, count=10)))
+        sc.verify(sp.len(rounds.rounds) == 0)
+
+        sc.h2("Evicted rounds")
+        e = sp.catch_exception(ring.getRoundRange(sp.record(fromRound=1, count=2)))
+        sc.verify(e == sp.some("Round pruned"))
+        rounds = sc.compute(ring.getRoundRange(sp.record(fromRound=2, count=5)))
+        sc.verify(sp.len(rounds.rounds) == 2)
+
+        sc.h2("Range is capped to MAX_ROUND_RANGE rounds")
+        history = BackedOracleModule.BackedOracle(
+            owner=admin.address,
+            implementation = implementation,
+            updater=admin.address,
+            decimals=decimals,
+            description=description,
+            retention=0,
+            metadata=metadata
+        )
+        sc += history
+
+        time = sp.timestamp(10000)
+        for _ in range(51):
+            history.execute(actionName="updateAnswer", data=sp.pack(sp.record(newAnswer=10, newTimestamp=time.add_seconds(-100)))).run(sender=admin, now=time)
+            time = time.add_seconds(3601)
+
+        rounds = sc.compute(history.getRoundRange(sp.record(fromRound=1, count=60)))
+        sc.verify(sp.len(rounds.rounds) == 50)
+        sc.verify(rounds.nextRound == sp.Some(51))
+
+        rounds = sc.compute(history.getRoundRange(sp.record(fromRound=51, count=10)))
+        sc.verify(sp.len(rounds.rounds) == 1)
+        sc.verify(rounds.nextRound.is_none())
+
+        sc.h1("Time-weighted average")
+        sc.h2("Cumulative price is stored with each round")
+        # Rounds are 3601s apart: round 2 adds 10 * 3601, round 3 adds 11 * 3601
+        sc.verify(ring.data.storage.roundData[0].cumulativePrice == 36010)
+        sc.verify(ring.data.storage.latest.cumulativePrice == 75621)
+
+        sc.h2("Average between two rounds")
+        sc.verify(sc.compute(ring.twap(sp.record(fromRound=2, toRound=3))) == 11)
+        sc.verify(sc.compute(history.twap(sp.record(fromRound=1, toRound=51))) == 10)
+
+        sc.h2("Invalid range")
+        e = sp.catch_exception(ring.twap(sp.record(fromRound=3, toRound=3)))
+        sc.verify(e == sp.some("Invalid round range"))
+        e = sp.catch_exception(ring.twap(sp.record(fromRound=1, toRound=3)))
+        sc.verify(e == sp.some("Round pruned"))
+        e = sp.catch_exception(ring.twap(sp.record(fromRound=2, toRound=4)))
+        sc.verify(e == sp.some(error))
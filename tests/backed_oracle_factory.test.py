@@ -5,8 +5,10 @@ from contracts.backed_oracle_forwarder import BackedOracleForwarderModule
 from contracts.backed_oracle_factory import BackedOracleFactoryModule
 
 from contracts.utils.ownable import OwnableModule
+from contracts.implementation_registry import ImplementationRegistryModule
 
 from contracts.storage.backed_oracle import BackedOracleStorageModule
+from contracts.utils.round_buffer import RoundBufferModule
 
 from contracts.actions.oracle.update_answer import UpdateAnswerModule
 
@@ -19,7 +21,9 @@ if "templates" not in __name__:
     def test():
         sc = sp.test_scenario([
             OwnableModule,
+            ImplementationRegistryModule,
             BackedOracleStorageModule,
+            RoundBufferModule,
             UpdateAnswerModule,
             BackedOracleModule,
             BackedOracleForwarderModule,
@@ -45,10 +49,10 @@ if "templates" not in __name__:
         sc.h1("Deploy Oracle")
 
         sc.h2("Sender is not admin")
-        factory.deployOracle(owner=admin.address, metadata=metadata, updater=admin.address, decimals="18", description="Backed Oracle").run(sender=alice, valid=False)
+        factory.deployOracle(owner=admin.address, metadata=metadata, updater=admin.address, decimals="18", description="Backed Oracle", retention=0).run(sender=alice, valid=False)
 
         sc.h2("Sender is admin")
-        factory.deployOracle(owner=admin.address, metadata=metadata, updater=admin.address, decimals="18", description="Backed Oracle").run(sender=admin)
+        factory.deployOracle(owner=admin.address, metadata=metadata, updater=admin.address, decimals="18", description="Backed Oracle", retention=0).run(sender=admin)
 
         updatedImplementation=sp.big_map({
             "updateAnswer": sp.record(action=UpdateAnswerModule.updateAnswer, only_admin=False)
@@ -59,6 +63,13 @@ if "templates" not in __name__:
         sc.h2("Sender is admin")
         factory.updateImplementation(updatedImplementation).run(sender=admin)
 
+        sc.h1("Single action update")
+        sc.h2("Sender is not admin")
+        factory.setAction(name="updateAnswer", entry=sp.record(action=UpdateAnswerModule.updateAnswer, only_admin=True)).run(sender=alice, valid=False)
+        factory.removeAction("updateAnswer").run(sender=alice, valid=False)
 
-
-
+        sc.h2("Sender is admin")
+        factory.setAction(name="updateAnswer", entry=sp.record(action=UpdateAnswerModule.updateAnswer, only_admin=True)).run(sender=admin)
+        sc.verify(factory.data.implementation["updateAnswer"].only_admin == True)
+        factory.removeAction("updateAnswer").run(sender=admin)
+        sc.verify(factory.data.implementation.contains("updateAnswer") == False)
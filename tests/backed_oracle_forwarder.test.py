@@ -4,7 +4,9 @@ from contracts.backed_oracle import BackedOracleModule
 from contracts.backed_oracle_forwarder import BackedOracleForwarderModule
 
 from contracts.storage.backed_oracle import BackedOracleStorageModule
+from contracts.utils.round_buffer import RoundBufferModule
 from contracts.utils.ownable import OwnableModule
+from contracts.implementation_registry import ImplementationRegistryModule
 
 from contracts.actions.oracle.update_answer import UpdateAnswerModule
 
@@ -17,7 +19,9 @@ if "templates" not in __name__:
     def test():
         sc = sp.test_scenario([
             OwnableModule,
+            ImplementationRegistryModule,
             BackedOracleStorageModule,
+            RoundBufferModule,
             UpdateAnswerModule,
             BackedOracleModule,
             BackedOracleForwarderModule,
@@ -42,7 +46,8 @@ if "templates" not in __name__:
             }),
             updater=admin.address,
             decimals=decimals,
-            description=description
+            description=description,
+            retention=0
         )
 
         sc += oracle
@@ -149,7 +154,8 @@ if "templates" not in __name__:
             }),
             updater=admin.address,
             decimals=decimals,
-            description=description
+            description=description,
+            retention=0
         )
 
         sc += new_oracle
@@ -165,3 +171,45 @@ if "templates" not in __name__:
    
 
 
+
+        sc.h1("Evicted rounds")
+        ring = BackedOracleModule.BackedOracle(
+            owner=admin.address,
+            metadata=sp.big_map(),
+            implementation=sp.big_map({
+                "updateAnswer": sp.record(action=UpdateAnswerModule.updateAnswer, only_admin=False)
+            }),
+            updater=admin.address,
+            decimals=decimals,
+            description=description,
+            retention=1
+        )
+        sc += ring
+        oracleForwarder.setUpstreamOracle(ring.address).run(sender=admin)
+
+        time = sp.timestamp(10000)
+        ring.execute(actionName="updateAnswer", data=sp.pack(sp.record(newAnswer=10, newTimestamp=time.add_seconds(-100)))).run(sender=admin, now=time)
+        time = time.add_seconds(3601)
+        ring.execute(actionName="updateAnswer", data=sp.pack(sp.record(newAnswer=11, newTimestamp=time.add_seconds(-100)))).run(sender=admin, now=time)
+
+        sc.verify(sc.compute(oracleForwarder.getAnswer(2)) == 11)
+        e = sp.catch_exception(oracleForwarder.getAnswer(1))
+        sc.verify(e == sp.some("Round pruned"))
+        e = sp.catch_exception(oracleForwarder.getRoundData(1))
+        sc.verify(e == sp.some("Round pruned"))
+
+        sc.h1("Round range")
+        rounds = sc.compute(oracleForwarder.getRoundRange(sp.record(fromRound=2, count=5)))
+        sc.verify_equal(rounds.rounds, [sc.compute(oracleForwarder.getRoundData(2))])
+        sc.verify(rounds.nextRound.is_none())
+        e = sp.catch_exception(oracleForwarder.getRoundRange(sp.record(fromRound=1, count=5)))
+        sc.verify(e == sp.some("Round pruned"))
+
+        sc.h1("Time-weighted average")
+        e = sp.catch_exception(oracleForwarder.twap(sp.record(fromRound=1, toRound=2)))
+        sc.verify(e == sp.some("Round pruned"))
+
+        oracleForwarder.setUpstreamOracle(oracle.address).run(sender=admin)
+        time = sp.timestamp(10000).add_seconds(3601)
+        oracle.execute(actionName="updateAnswer", data=sp.pack(sp.record(newAnswer=11, newTimestamp=time.add_seconds(-100)))).run(sender=admin, now=time)
+        sc.verify(sc.compute(oracleForwarder.twap(sp.record(fromRound=1, toRound=2))) == first_round_answer)
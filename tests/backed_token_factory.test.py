@@ -2,8 +2,11 @@ import smartpy as sp
 from contracts.backed_token_factory import BackedTokenFactoryModule
 from contracts.backed_token import BackedTokenModule 
 from contracts.utils.ownable import OwnableModule 
+from contracts.implementation_registry import ImplementationRegistryModule
 from contracts.utils.pausable import PausableModule
 from contracts.utils.nonce import NonceModule
+from contracts.utils.shares import SharesModule
+from contracts.utils.token_events import TokenEventsModule
 
 from contracts.actions.token.mint import MintModule 
 from contracts.actions.token.set_minter import SetMinterModule 
@@ -11,13 +14,19 @@ from contracts.actions.token.burn import BurnModule
 from contracts.actions.token.set_burner import SetBurnerModule 
 from contracts.actions.token.approve import ApproveModule
 from contracts.actions.token.transfer import TransferModule
+from contracts.actions.token.transfer_batch import TransferBatchModule
 from contracts.actions.token.delegated_transfer import DelegatedTransferModule
 from contracts.actions.token.permit import PermitModule
+from contracts.actions.token.relay_bundle import RelayBundleModule
+from contracts.actions.token.permit_unordered import PermitUnorderedModule
+from contracts.actions.token.delegated_transfer_unordered import DelegatedTransferUnorderedModule
 from contracts.actions.token.increase_allowance import IncreaseAllowanceModule
 from contracts.actions.token.decrease_allowance import DecreaseAllowanceModule
 from contracts.actions.token.set_terms import SetTermsModule
 from contracts.actions.token.set_delegate_mode import SetDelegateModeModule
 from contracts.actions.token.set_delegate_whitelist import SetDelegateWhitelistModule
+from contracts.actions.token.import_balances import ImportBalancesModule
+from contracts.actions.token.set_multiplier import SetMultiplierModule
 
 from contracts.storage.backed_token import BackedTokenStorageModule
 
@@ -33,19 +42,15 @@ def TestModule():
         def target(self, params):
             self.data.last = sp.Some(params)
 
-    @sp.effects()
+    @sp.effects(with_operations=True)
     def mint(storage, data):
-        sp.cast(storage, BackedTokenStorageModule.BackedToken)
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
         sp.cast(data, sp.bytes)
         mintParams = sp.unpack(data, MintParams).unwrap_some(error="BACKED_TOKEN_Mint_CannotUnpackParams")
         
         updated_storage = storage
 
-        receiver_balance = updated_storage.balances.get(
-            mintParams.address, default=sp.record(balance=0, approvals={})
-        )
-        receiver_balance.balance += mintParams.value * 2
-        updated_storage.balances[mintParams.address] = receiver_balance
+        updated_storage.balances[mintParams.address] = updated_storage.balances.get(mintParams.address, default=0) + mintParams.value * 2
         updated_storage.total_supply += mintParams.value * 2
 
         return updated_storage
@@ -55,8 +60,11 @@ if "templates" not in __name__:
     def test():
         sc = sp.test_scenario([
             OwnableModule,
+            ImplementationRegistryModule,
             PausableModule,
             NonceModule,
+            SharesModule,
+            TokenEventsModule,
             BackedTokenStorageModule,
             MintModule,
             SetMinterModule,
@@ -64,13 +72,19 @@ if "templates" not in __name__:
             SetBurnerModule,
             ApproveModule,
             TransferModule,
+            TransferBatchModule,
             DelegatedTransferModule,
             PermitModule,
+            RelayBundleModule,
+            PermitUnorderedModule,
+            DelegatedTransferUnorderedModule,
             SetTermsModule,
             IncreaseAllowanceModule,
             DecreaseAllowanceModule,
             SetDelegateModeModule,
             SetDelegateWhitelistModule,
+            ImportBalancesModule,
+            SetMultiplierModule,
             BackedTokenModule,
             BackedTokenFactoryModule,
             TestModule
@@ -86,19 +100,22 @@ if "templates" not in __name__:
         )
 
         implementation = sp.big_map({
-            "mint": sp.record(action=MintModule.mint, only_admin=False),
-            "burn": sp.record(action=BurnModule.burn, only_admin=False),
-            "approve": sp.record(action=ApproveModule.approve, only_admin=False),
-            "transfer": sp.record(action=TransferModule.transfer, only_admin=False),
-            # "delegatedTransfer": sp.record(action=DelegatedTransferModule.delegatedTransfer, only_admin=False),
-            # "permit": sp.record(action=PermitModule.permit, only_admin=False),
-            "setMinter": sp.record(action=SetMinterModule.setMinter, only_admin=True),
-            "setBurner": sp.record(action=SetBurnerModule.setBurner, only_admin=True),
-            "setTerms": sp.record(action=SetTermsModule.setTerms, only_admin=True),
-            "increaseAllowance": sp.record(action=IncreaseAllowanceModule.increaseAllowance, only_admin=False),
-            "decreaseAllowance": sp.record(action=DecreaseAllowanceModule.decreaseAllowance, only_admin=False),
-            # "setDelegateMode": sp.record(action=SetDelegateModeModule.setDelegateMode, only_admin=True),
-            # "setDelegateWhitelist": sp.record(action=SetDelegateWhitelistModule.setDelegateWhitelist, only_admin=True),
+            "mint": sp.record(action=sp.variant("hot", MintModule.mint), only_admin=False),
+            "mintBatch": sp.record(action=sp.variant("hot", MintModule.mintBatch), only_admin=False),
+            "burn": sp.record(action=sp.variant("hot", BurnModule.burn), only_admin=False),
+            "burnBatch": sp.record(action=sp.variant("hot", BurnModule.burnBatch), only_admin=False),
+            "approve": sp.record(action=sp.variant("hot", ApproveModule.approve), only_admin=False),
+            "transfer": sp.record(action=sp.variant("hot", TransferModule.transfer), only_admin=False),
+            "transferBatch": sp.record(action=sp.variant("hot", TransferBatchModule.transferBatch), only_admin=False),
+            # "delegatedTransfer": sp.record(action=sp.variant("full", DelegatedTransferModule.delegatedTransfer), only_admin=False),
+            # "permit": sp.record(action=sp.variant("full", PermitModule.permit), only_admin=False),
+            "setMinter": sp.record(action=sp.variant("hot", SetMinterModule.setMinter), only_admin=True),
+            "setBurner": sp.record(action=sp.variant("hot", SetBurnerModule.setBurner), only_admin=True),
+            "setTerms": sp.record(action=sp.variant("cold", SetTermsModule.setTerms), only_admin=True),
+            "increaseAllowance": sp.record(action=sp.variant("hot", IncreaseAllowanceModule.increaseAllowance), only_admin=False),
+            "decreaseAllowance": sp.record(action=sp.variant("hot", DecreaseAllowanceModule.decreaseAllowance), only_admin=False),
+            # "setDelegateMode": sp.record(action=sp.variant("cold", SetDelegateModeModule.setDelegateMode), only_admin=True),
+            # "setDelegateWhitelist": sp.record(action=sp.variant("cold", SetDelegateWhitelistModule.setDelegateWhitelist), only_admin=True),
         })
 
         factory = BackedTokenFactoryModule.BackedFactory(owner=admin.address, metadata=metadata, implementation=implementation)
@@ -138,15 +155,18 @@ if "templates" not in __name__:
 
         sc.h1("Update implementation")
         updated_implementation = sp.big_map({
-            "mint": sp.record(action=TestModule.mint, only_admin=True),
-            "burn": sp.record(action=BurnModule.burn, only_admin=True),
-            "approve": sp.record(action=ApproveModule.approve, only_admin=False),
-            "transfer": sp.record(action=TransferModule.transfer, only_admin=False),
-            "setMinter": sp.record(action=SetMinterModule.setMinter, only_admin=True),
-            "setBurner": sp.record(action=SetBurnerModule.setBurner, only_admin=True),
-            "setTerms": sp.record(action=SetTermsModule.setTerms, only_admin=True),
-            "increaseAllowance": sp.record(action=IncreaseAllowanceModule.increaseAllowance, only_admin=False),
-            "decreaseAllowance": sp.record(action=DecreaseAllowanceModule.decreaseAllowance, only_admin=False),
+            "mint": sp.record(action=sp.variant("hot", TestModule.mint), only_admin=True),
+            "mintBatch": sp.record(action=sp.variant("hot", MintModule.mintBatch), only_admin=False),
+            "burn": sp.record(action=sp.variant("hot", BurnModule.burn), only_admin=True),
+            "burnBatch": sp.record(action=sp.variant("hot", BurnModule.burnBatch), only_admin=False),
+            "approve": sp.record(action=sp.variant("hot", ApproveModule.approve), only_admin=False),
+            "transfer": sp.record(action=sp.variant("hot", TransferModule.transfer), only_admin=False),
+            "transferBatch": sp.record(action=sp.variant("hot", TransferBatchModule.transferBatch), only_admin=False),
+            "setMinter": sp.record(action=sp.variant("hot", SetMinterModule.setMinter), only_admin=True),
+            "setBurner": sp.record(action=sp.variant("hot", SetBurnerModule.setBurner), only_admin=True),
+            "setTerms": sp.record(action=sp.variant("cold", SetTermsModule.setTerms), only_admin=True),
+            "increaseAllowance": sp.record(action=sp.variant("hot", IncreaseAllowanceModule.increaseAllowance), only_admin=False),
+            "decreaseAllowance": sp.record(action=sp.variant("hot", DecreaseAllowanceModule.decreaseAllowance), only_admin=False),
         })
 
         sc.h2("Sender is not admin")
@@ -155,3 +175,115 @@ if "templates" not in __name__:
         sc.h2("Sender is admin")
         factory.updateImplementation(updated_implementation).run(sender=admin)
         
+
+        sc.h1("Single action update")
+        sc.h2("Sender is not admin")
+        factory.setAction(name="mint", entry=sp.record(action=sp.variant("hot", MintModule.mint), only_admin=False)).run(sender=alice, valid=False)
+        factory.removeAction("burn").run(sender=alice, valid=False)
+
+        sc.h2("Sender is admin")
+        factory.setAction(name="mint", entry=sp.record(action=sp.variant("hot", MintModule.mint), only_admin=False)).run(sender=admin)
+        sc.verify(factory.data.implementation["mint"].only_admin == False)
+        factory.removeAction("burn").run(sender=admin)
+        sc.verify(factory.data.implementation.contains("burn") == False)
+
+        sc.h1("Upgrade deployed tokens")
+        sc.verify(factory.data.tokenCount == 1)
+
+        updates = [
+            sp.record(name="mint", entry=sp.Some(sp.record(action=sp.variant("hot", MintModule.mint), only_admin=True))),
+            sp.record(name="burnBatch", entry=None),
+        ]
+
+        sc.h2("Sender is not admin")
+        factory.upgradeTokens(updates=updates, fromIndex=0, count=10).run(sender=alice, valid=False)
+
+        sc.h2("Index out of range")
+        factory.upgradeTokens(updates=updates, fromIndex=2, count=10).run(sender=admin, valid=False)
+
+        sc.h2("Sender is admin")
+        factory.upgradeTokens(updates=updates, fromIndex=0, count=10).run(sender=admin)
+
+        sc.h2("Cursor at the end of registry")
+        factory.upgradeTokens(updates=updates, fromIndex=1, count=10).run(sender=admin)
+
+        sc.h2("Tokens that replaced the factory as upgrader are skipped")
+        factory.deployToken(
+            tokenOwner=admin.address,
+            minter=admin.address,
+            burner=admin.address,
+            pauser=admin.address,
+            metadata=metadata,
+            name=sp.utils.bytes_of_string("Backed CSPX Core S&P 500"),
+            symbol=sp.utils.bytes_of_string("bCSPX"),
+            icon=sp.utils.bytes_of_string(""),
+            decimals=sp.utils.bytes_of_string("18")
+        ).run(sender=admin)
+        optedOut = sc.dynamic_contract(BackedTokenModule.BackedToken)
+        sc.verify(sc.compute(optedOut.upgrader()) == factory.address)
+
+        optedOut.setUpgrader(admin.address).run(sender=admin)
+        sc.verify(sc.compute(optedOut.upgrader()) == admin.address)
+
+        # The opted-out token does not block the rest of the range
+        factory.upgradeTokens(updates=[sp.record(name="approve", entry=None)], fromIndex=0, count=10).run(sender=admin)
+        sc.verify(optedOut.data.implementation.contains("approve"))
+
+        sc.h1("Implementation registry")
+        sc.h2("Sender is not admin")
+        factory.setRegistry(sp.Some(sp.record(address=bob.address, version=1))).run(sender=alice, valid=False)
+
+        sc.h2("Sender is admin")
+        factory.setRegistry(sp.Some(sp.record(address=bob.address, version=1))).run(sender=admin)
+        sc.verify(factory.data.registry == sp.Some(sp.record(address=bob.address, version=1)))
+        factory.setRegistry(None).run(sender=admin)
+        sc.verify(factory.data.registry.is_none())
+
+        sc.h1("Typed actions")
+        typedActions = sp.record(
+            transfer=sp.Some(TransferModule.applyTransfer),
+            approve=sp.Some(ApproveModule.applyApprove),
+            increaseAllowance=None,
+            decreaseAllowance=None
+        )
+
+        sc.h2("Sender is not admin")
+        factory.setTypedActions(typedActions).run(sender=alice, valid=False)
+
+        sc.h2("Sender is admin")
+        factory.setTypedActions(typedActions).run(sender=admin)
+        sc.verify(factory.data.typedActions.transfer.is_some())
+        sc.verify(factory.data.typedActions.decreaseAllowance.is_none())
+
+        sc.h1("Native actions")
+        sc.h2("Sender is not admin")
+        factory.setNativeActions(True).run(sender=alice, valid=False)
+
+        sc.h2("Sender is admin")
+        factory.setNativeActions(True).run(sender=admin)
+        sc.verify(factory.data.nativeActions)
+
+        sc.h2("Deployed token runs the native actions")
+        factory.setTypedActions(sp.record(transfer=None, approve=None, increaseAllowance=None, decreaseAllowance=None)).run(sender=admin)
+        factory.deployToken(
+            tokenOwner=admin.address,
+            minter=admin.address,
+            burner=admin.address,
+            pauser=admin.address,
+            metadata=metadata,
+            name=sp.utils.bytes_of_string("Backed IB01 $ Treasury Bond 0-1yr"),
+            symbol=sp.utils.bytes_of_string("bIB01"),
+            icon=sp.utils.bytes_of_string(""),
+            decimals=sp.utils.bytes_of_string("18")
+        ).run(sender=admin)
+        nativeToken = sc.dynamic_contract(BackedTokenModule.BackedToken)
+        sc.verify(nativeToken.data.nativeActions)
+        sc.verify(nativeToken.data.implementation.contains("transfer") == False)
+        sc.verify(nativeToken.data.implementation.contains("approve") == False)
+        sc.verify(nativeToken.data.implementation.contains("mint"))
+        # The factory implementation keeps the lambdas, for the tokens deployed with native actions disabled
+        sc.verify(factory.data.implementation.contains("transfer"))
+
+        nativeToken.execute(actionName="mint", data=sp.pack(sp.record(address=alice.address, value=10))).run(sender=admin)
+        nativeToken.transfer(from_=alice.address, to_=bob.address, value=4).run(sender=alice)
+        sc.verify(nativeToken.data.storage.hot.balances[bob.address] == 4)
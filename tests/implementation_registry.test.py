@@ -0,0 +1,220 @@
+import smartpy as sp
+from contracts.implementation_registry import ImplementationRegistryModule
+from contracts.backed_token import BackedTokenModule
+from contracts.backed_oracle import BackedOracleModule
+from contracts.utils.ownable import OwnableModule
+from contracts.utils.pausable import PausableModule
+from contracts.utils.nonce import NonceModule
+from contracts.utils.shares import SharesModule
+from contracts.utils.token_events import TokenEventsModule
+
+from contracts.actions.token.mint import MintModule
+from contracts.actions.token.burn import BurnModule
+from contracts.actions.token.transfer import TransferModule
+from contracts.actions.token.approve import ApproveModule
+from contracts.actions.token.increase_allowance import IncreaseAllowanceModule
+from contracts.actions.token.decrease_allowance import DecreaseAllowanceModule
+from contracts.actions.token.transfer_batch import TransferBatchModule
+from contracts.actions.token.delegated_transfer import DelegatedTransferModule
+from contracts.actions.token.permit import PermitModule
+from contracts.actions.token.relay_bundle import RelayBundleModule
+from contracts.actions.token.permit_unordered import PermitUnorderedModule
+from contracts.actions.token.delegated_transfer_unordered import DelegatedTransferUnorderedModule
+from contracts.actions.token.set_terms import SetTermsModule
+from contracts.actions.token.set_delegate_whitelist import SetDelegateWhitelistModule
+from contracts.actions.token.import_balances import ImportBalancesModule
+from contracts.actions.token.set_multiplier import SetMultiplierModule
+from contracts.actions.oracle.update_answer import UpdateAnswerModule
+from contracts.storage.backed_token import BackedTokenStorageModule
+from contracts.storage.backed_oracle import BackedOracleStorageModule
+from contracts.utils.round_buffer import RoundBufferModule
+
+@sp.module
+def TestModule():
+    MintParams: type = sp.record(address=sp.address, value=sp.nat)
+
+    @sp.effects(with_operations=True)
+    def mint(storage, data):
+        sp.cast(storage, BackedTokenStorageModule.BackedTokenHot)
+        sp.cast(data, sp.bytes)
+        mintParams = sp.unpack(data, MintParams).unwrap_some(error="BACKED_TOKEN_Mint_CannotUnpackParams")
+
+        updated_storage = storage
+
+        updated_storage.balances[mintParams.address] = updated_storage.balances.get(mintParams.address, default=0) + mintParams.value * 2
+        updated_storage.total_supply += mintParams.value * 2
+
+        return updated_storage
+
+if "templates" not in __name__:
+    @sp.add_test(name="implementation_registry")
+    def test():
+        sc = sp.test_scenario([
+            OwnableModule,
+            ImplementationRegistryModule,
+            PausableModule,
+            NonceModule,
+            SharesModule,
+            TokenEventsModule,
+            BackedTokenStorageModule,
+            BackedOracleStorageModule,
+            RoundBufferModule,
+            MintModule,
+            BurnModule,
+            ApproveModule,
+            TransferModule,
+            TransferBatchModule,
+            DelegatedTransferModule,
+            PermitModule,
+            RelayBundleModule,
+            PermitUnorderedModule,
+            DelegatedTransferUnorderedModule,
+            SetTermsModule,
+            SetDelegateWhitelistModule,
+            ImportBalancesModule,
+            SetMultiplierModule,
+            IncreaseAllowanceModule,
+            DecreaseAllowanceModule,
+            UpdateAnswerModule,
+            BackedTokenModule,
+            BackedOracleModule,
+            TestModule
+        ])
+        sc.h1("Implementation Registry")
+
+        # sp.test_account generates ED25519 key-pairs deterministically:
+        admin = sp.test_account("Administrator")
+        alice = sp.test_account("Alice")
+        bob = sp.test_account("Robert")
+
+        contract_metadata = sp.utils.metadata_of_url(
+            "ipfs://QmaiAUj1FFNGYTu8rLBjc3eeN9cSKwaF8EGMBNDmhzPNFd"
+        )
+
+        registry = ImplementationRegistryModule.ImplementationRegistry(
+            owner=admin.address,
+            metadata=contract_metadata,
+            actions=sp.big_map({
+                sp.record(version=1, name="mint"): sp.record(action=sp.variant("hot", MintModule.mint), only_admin=True),
+                sp.record(version=1, name="transfer"): sp.record(action=sp.variant("hot", TransferModule.transfer), only_admin=False),
+            })
+        )
+        sc += registry
+
+        sc.h2("Draft version is not visible")
+        e = sp.catch_exception(registry.getAction(sp.record(version=1, name="mint")))
+        sc.verify(e == sp.some("IMPLEMENTATION_REGISTRY_UnpublishedVersion"))
+
+        sc.h2("Only owner can change the draft and publish")
+        registry.setAction(name="setTerms", entry=sp.record(action=sp.variant("cold", SetTermsModule.setTerms), only_admin=True)).run(sender=alice, valid=False)
+        registry.removeAction("transfer").run(sender=alice, valid=False)
+        registry.publishVersion().run(sender=alice, valid=False)
+
+        sc.h2("Publish version 1")
+        registry.setAction(name="setTerms", entry=sp.record(action=sp.variant("cold", SetTermsModule.setTerms), only_admin=True)).run(sender=admin)
+        registry.publishVersion().run(sender=admin)
+
+        sc.verify(sc.compute(registry.latestVersion()) == 1)
+        sc.verify(sc.compute(registry.getAction(sp.record(version=1, name="mint"))).is_some())
+        sc.verify(sc.compute(registry.getAction(sp.record(version=1, name="approve"))).is_none())
+
+        sc.h2("Stage version 2")
+        registry.copyActions(fromVersion=2, names=["mint"]).run(sender=admin, valid=False)
+        registry.copyActions(fromVersion=1, names=["approve"]).run(sender=admin, valid=False)
+        registry.copyActions(fromVersion=1, names=["transfer", "setTerms"]).run(sender=admin)
+        registry.setAction(name="mint", entry=sp.record(action=sp.variant("hot", TestModule.mint), only_admin=True)).run(sender=admin)
+        registry.setAction(name="approve", entry=sp.record(action=sp.variant("hot", ApproveModule.approve), only_admin=False)).run(sender=admin)
+        registry.removeAction("approve").run(sender=admin)
+
+        e = sp.catch_exception(registry.getAction(sp.record(version=2, name="mint")))
+        sc.verify(e == sp.some("IMPLEMENTATION_REGISTRY_UnpublishedVersion"))
+
+        sc.h1("Token resolving actions through the registry")
+        token_metadata = {
+            "decimals": sp.utils.bytes_of_string("18"),
+            "name": sp.utils.bytes_of_string("Backed IB01 $ Treasury Bond 0-1yr"),
+            "symbol": sp.utils.bytes_of_string("bIB01"),
+            "icon": sp.utils.bytes_of_string(
+                "https://assets.website-files.com/6418671e8e48de1967843312/64e39beb6a4b261e47c6c763_bIB01.svg"
+            ),
+        }
+        token = BackedTokenModule.BackedToken(
+            owner=admin.address,
+            metadata=contract_metadata,
+            token_metadata=token_metadata,
+            ledger={},
+            implementation=sp.big_map({}),
+            minter=admin.address,
+            burner=admin.address,
+            pauser=admin.address
+        )
+        sc += token
+
+        sc.h2("Unknown action without a registry")
+        token.execute(actionName="mint", data=sp.pack(sp.record(address=alice.address, value=5))).run(sender=admin, valid=False, exception="BACKED_TOKEN_UnknownAction")
+
+        sc.h2("Only owner can pin the registry")
+        token.setRegistry(sp.Some(sp.record(address=registry.address, version=1))).run(sender=alice, valid=False)
+        token.setRegistry(sp.Some(sp.record(address=registry.address, version=1))).run(sender=admin)
+
+        sc.h2("Execute and typed entrypoints use the pinned version")
+        token.execute(actionName="mint", data=sp.pack(sp.record(address=alice.address, value=5))).run(sender=alice, valid=False, exception="BACKED_TOKEN_NotAdmin")
+        token.execute(actionName="mint", data=sp.pack(sp.record(address=alice.address, value=5))).run(sender=admin)
+        token.transfer(from_=alice.address, to_=bob.address, value=2).run(sender=alice)
+
+        sc.verify(token.data.storage.hot.balances[alice.address] == 3)
+        sc.verify(token.data.storage.hot.balances[bob.address] == 2)
+
+        token.approve(spender=bob.address, value=1).run(sender=alice, valid=False, exception="BACKED_TOKEN_UnknownAction")
+
+        sc.h2("Pinning an unpublished version")
+        token.setRegistry(sp.Some(sp.record(address=registry.address, version=2))).run(sender=admin)
+        token.execute(actionName="mint", data=sp.pack(sp.record(address=alice.address, value=5))).run(sender=admin, valid=False)
+
+        sc.h2("Pin the new version once published")
+        registry.publishVersion().run(sender=admin)
+        token.execute(actionName="mint", data=sp.pack(sp.record(address=alice.address, value=5))).run(sender=admin)
+
+        sc.verify(token.data.storage.hot.balances[alice.address] == 13)
+        sc.verify(token.data.storage.hot.total_supply == 15)
+
+        sc.h2("Local implementation takes precedence")
+        token.setAction(name="mint", entry=sp.record(action=sp.variant("hot", MintModule.mint), only_admin=True)).run(sender=admin)
+        token.execute(actionName="mint", data=sp.pack(sp.record(address=alice.address, value=5))).run(sender=admin)
+
+        sc.verify(token.data.storage.hot.balances[alice.address] == 18)
+
+        sc.h2("Unpin the registry")
+        token.setRegistry(None).run(sender=admin)
+        token.transfer(from_=alice.address, to_=bob.address, value=2).run(sender=alice, valid=False, exception="BACKED_TOKEN_UnknownAction")
+
+        sc.h1("Oracle resolving actions through the registry")
+        oracleRegistry = ImplementationRegistryModule.ImplementationRegistry(
+            owner=admin.address,
+            metadata=contract_metadata,
+            actions=sp.big_map({
+                sp.record(version=1, name="updateAnswer"): sp.record(action=UpdateAnswerModule.updateAnswer, only_admin=False),
+            })
+        )
+        sc += oracleRegistry
+        oracleRegistry.publishVersion().run(sender=admin)
+
+        oracle = BackedOracleModule.BackedOracle(
+            owner=admin.address,
+            implementation=sp.big_map({}),
+            updater=admin.address,
+            decimals="18",
+            description="Backed Oracle contract",
+            retention=0,
+            metadata=contract_metadata
+        )
+        sc += oracle
+
+        time = sp.timestamp(1000)
+        oracle.execute(actionName="updateAnswer", data=sp.pack(sp.record(newAnswer=100, newTimestamp=sp.timestamp(900)))).run(sender=admin, now=time, valid=False, exception="BACKED_ORACLE_UnknownAction")
+
+        oracle.setRegistry(sp.Some(sp.record(address=oracleRegistry.address, version=1))).run(sender=alice, valid=False)
+        oracle.setRegistry(sp.Some(sp.record(address=oracleRegistry.address, version=1))).run(sender=admin)
+        oracle.execute(actionName="updateAnswer", data=sp.pack(sp.record(newAnswer=100, newTimestamp=sp.timestamp(900)))).run(sender=admin, now=time)
+
+        sc.verify(sc.compute(oracle.latestAnswer()) == 100)